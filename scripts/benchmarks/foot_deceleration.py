@@ -0,0 +1,140 @@
+"""Script to benchmark the foot deceleration reward kernels on synthetic data.
+
+The script compares the reference (unfused) implementation of the reward against the TorchScript and
+the buffered eager kernels for a range of environment counts, both with shared parameters and with the
+same values given per environment. It reports whether the kernels return bit-identical rewards, which
+holds on the CPU, and their maximum deviation from the reference, which is about one ulp on CUDA where
+the reference divides by a Python scalar as a multiplication by its reciprocal.
+
+.. code-block:: bash
+
+    python scripts/benchmarks/foot_deceleration.py
+    python scripts/benchmarks/foot_deceleration.py --device cuda:0
+
+"""
+
+import argparse
+import time
+import torch
+from prettytable import PrettyTable
+
+from accrobotics.mdp import rewards
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark the foot deceleration reward kernels.")
+parser.add_argument(
+    "--num_envs", type=int, nargs="+", default=[1024, 4096, 16384], help="Environment counts to benchmark."
+)
+parser.add_argument("--num_feet", type=int, default=4, help="Number of feet per environment.")
+parser.add_argument("--iterations", type=int, default=200, help="Number of timed calls per kernel.")
+parser.add_argument("--warmup", type=int, default=20, help="Number of untimed calls per kernel.")
+parser.add_argument("--device", type=str, default="cpu", help="Device on which the kernels are evaluated.")
+args_cli = parser.parse_args()
+
+# reward parameters used by the quiet locomotion tasks
+VELOCITY_THRESHOLD = 0.3
+MIN_AIR_TIME = 0.05
+DECELERATION_PHASE = 0.1
+DECELERATION_WEIGHT = 0.3
+LANDING_WEIGHT = 0.7
+
+
+def reference_kernel(
+    foot_velocities: torch.Tensor, current_air_time: torch.Tensor, first_contact: torch.Tensor
+) -> torch.Tensor:
+    """Original, unfused formulation of the reward used as ground truth."""
+    foot_speeds = torch.norm(foot_velocities, dim=-1)
+    in_deceleration_phase = (current_air_time > MIN_AIR_TIME) & (
+        current_air_time <= MIN_AIR_TIME + DECELERATION_PHASE
+    )
+    good_landing = first_contact & (current_air_time > MIN_AIR_TIME)
+    velocity_reward = torch.exp(-foot_speeds / VELOCITY_THRESHOLD)
+    phase_reward = velocity_reward * (
+        in_deceleration_phase.float() * DECELERATION_WEIGHT + good_landing.float() * LANDING_WEIGHT
+    )
+    return torch.sum(phase_reward, dim=1)
+
+
+def time_kernel(kernel, iterations: int, warmup: int) -> float:
+    """Return the mean wall-clock time of a call in microseconds."""
+    for _ in range(warmup):
+        kernel()
+    if args_cli.device.startswith("cuda"):
+        torch.cuda.synchronize()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        kernel()
+    if args_cli.device.startswith("cuda"):
+        torch.cuda.synchronize()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main():
+    """Benchmark the foot deceleration reward kernels."""
+    table = PrettyTable([
+        "Envs",
+        "Reference (us)",
+        "JIT (us)",
+        "Eager (us)",
+        "JIT speedup",
+        "Eager speedup",
+        "Exact",
+        "Max deviation",
+    ])
+    table.title = f"Foot deceleration reward kernels ({args_cli.device})"
+
+    max_air_time = MIN_AIR_TIME + DECELERATION_PHASE
+    for num_envs in args_cli.num_envs:
+        # synthetic foot states
+        generator = torch.Generator().manual_seed(num_envs)
+        foot_velocities = torch.randn(num_envs, args_cli.num_feet, 3, generator=generator).to(args_cli.device)
+        current_air_time = (torch.rand(num_envs, args_cli.num_feet, generator=generator) * 0.3).to(args_cli.device)
+        first_contact = (torch.rand(num_envs, args_cli.num_feet, generator=generator) > 0.8).to(args_cli.device)
+        foot_speeds = torch.empty(num_envs, args_cli.num_feet, device=args_cli.device)
+        buffers = rewards._FootDecelerationBuffers(num_envs, args_cli.num_feet, foot_velocities.device)
+        values = (VELOCITY_THRESHOLD, MIN_AIR_TIME, max_air_time, DECELERATION_WEIGHT, LANDING_WEIGHT)
+        # shared parameters are 0-dim tensors, per-environment parameters are broadcast over the feet
+        params = tuple(torch.tensor(value, device=args_cli.device) for value in values)
+        env_params = tuple(torch.full((num_envs, 1), value, device=args_cli.device) for value in values)
+
+        def run_reference():
+            return reference_kernel(foot_velocities, current_air_time, first_contact)
+
+        def run_jit(params=params):
+            return rewards._foot_deceleration_jit(
+                torch.linalg.vector_norm(foot_velocities, dim=-1), current_air_time, first_contact, *params
+            )
+
+        def run_eager(params=params):
+            return rewards._foot_deceleration_eager(
+                torch.linalg.vector_norm(foot_velocities, dim=-1, out=foot_speeds),
+                current_air_time,
+                first_contact,
+                *params,
+                buffers,
+            )
+
+        expected = run_reference()
+        results = [run(kernel_params).clone() for run in (run_jit, run_eager) for kernel_params in (params, env_params)]
+        exact = all(torch.equal(expected, result) for result in results)
+        max_deviation = max(torch.abs(result - expected).max().item() for result in results)
+
+        reference_us = time_kernel(run_reference, args_cli.iterations, args_cli.warmup)
+        jit_us = time_kernel(run_jit, args_cli.iterations, args_cli.warmup)
+        eager_us = time_kernel(run_eager, args_cli.iterations, args_cli.warmup)
+        table.add_row([
+            num_envs,
+            f"{reference_us:.1f}",
+            f"{jit_us:.1f}",
+            f"{eager_us:.1f}",
+            f"{reference_us / jit_us:.2f}x",
+            f"{reference_us / eager_us:.2f}x",
+            exact,
+            f"{max_deviation:.1e}",
+        ])
+
+    print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Script to benchmark the import time of the extension modules imported by the scripts.
+
+Every module is imported in fresh interpreters with ``python -X importtime`` and the median cumulative
+import time over the runs is reported, together with the number of imported modules. The script
+fails if importing a module pulls in one of the ``--forbidden`` packages, which guards the lazy
+registration of the tasks: registering them must not import the Isaac Lab task configurations.
+
+.. code-block:: bash
+
+    python scripts/benchmarks/import_time.py --runs 5
+
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+from prettytable import PrettyTable
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark the import time of the extension modules.")
+parser.add_argument(
+    "--modules",
+    type=str,
+    nargs="+",
+    default=["accrobotics", "accrobotics.tasks", "accrobotics.mdp", "accrobotics.deploy"],
+    help="Modules to import.",
+)
+parser.add_argument("--runs", type=int, default=5, help="Number of fresh interpreters per module.")
+parser.add_argument(
+    "--forbidden",
+    type=str,
+    nargs="+",
+    default=["isaaclab_tasks", "isaaclab.envs", "omni"],
+    help="Packages that importing the modules must not import.",
+)
+args_cli = parser.parse_args()
+
+
+def import_time(module: str) -> tuple[float, list[str]]:
+    """Import a module in a fresh interpreter and return its cumulative import time (in ms) and the imported modules."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"], capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing '{module}' failed:\n{result.stderr}")
+    total_us, imported = 0, []
+    # lines have the format "import time: <self us> | <cumulative us> | <indented module name>"
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative_us, name = line[len("import time:") :].split("|")
+        imported.append(name.strip())
+        # top-level imports of the command are not indented
+        if not name.startswith("  "):
+            total_us += int(cumulative_us)
+    return total_us / 1e3, imported
+
+
+def main():
+    """Benchmark the import time of the modules."""
+    table = PrettyTable(["Module", "Median (ms)", "Min (ms)", "Imported modules", "Forbidden imports"])
+    table.title = f"Import time over {args_cli.runs} fresh interpreter(s)"
+    table.align["Module"] = "l"
+    table.align["Forbidden imports"] = "l"
+
+    failures = []
+    for module in args_cli.modules:
+        times, imported = [], []
+        for _ in range(args_cli.runs):
+            elapsed_ms, imported = import_time(module)
+            times.append(elapsed_ms)
+        forbidden = sorted({
+            name
+            for name in imported
+            for package in args_cli.forbidden
+            if name == package or name.startswith(package + ".")
+        })
+        table.add_row([
+            module,
+            f"{statistics.median(times):.1f}",
+            f"{min(times):.1f}",
+            len(imported),
+            ", ".join(forbidden[:3]) + (", ..." if len(forbidden) > 3 else ""),
+        ])
+        if forbidden:
+            failures.append(f"{module}: {len(forbidden)} module(s) of {', '.join(args_cli.forbidden)}")
+    print(table)
+
+    if failures:
+        print("[ERROR] Modules importing forbidden packages:\n  " + "\n  ".join(failures))
+        sys.exit(1)
+    print("[INFO] No module imports a forbidden package.")
+
+
+if __name__ == "__main__":
+    main()
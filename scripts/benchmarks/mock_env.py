@@ -0,0 +1,248 @@
+"""Lightweight stand-in for a manager-based environment used to drive MDP terms without Isaac Sim.
+
+The mock environment exposes the subset of the :class:`isaaclab.envs.ManagerBasedRLEnv` interface read by
+the terms in :mod:`accrobotics.mdp`: the contact sensors and articulations of the scene, the command
+manager, the step counter and the step duration. Its state is either generated by a synthetic,
+vectorized trotting gait or replayed from recorded tensors.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import numpy as np
+import os
+import torch
+from dataclasses import dataclass, field
+
+# the Unitree Go2 articulation has 17 bodies, the last four being the feet
+GO2_NUM_BODIES = 17
+GO2_FOOT_IDS = [13, 14, 15, 16]
+
+
+@dataclass
+class MockEntityCfg:
+    """Resolved scene entity selection, equivalent to a resolved :class:`isaaclab.managers.SceneEntityCfg`."""
+
+    name: str
+    body_ids: list[int] | slice = field(default_factory=lambda: slice(None))
+
+
+@dataclass
+class MockContactSensorCfg:
+    """Contact sensor configuration, updated at every physics step like the default sensor configuration."""
+
+    update_period: float = 0.0
+
+
+class MockContactSensorData:
+    """Contact sensor buffers read by the MDP terms."""
+
+    def __init__(self, num_envs: int, num_bodies: int, history_length: int, device: str):
+        self.current_air_time = torch.zeros(num_envs, num_bodies, device=device)
+        self.last_air_time = torch.zeros(num_envs, num_bodies, device=device)
+        self.current_contact_time = torch.zeros(num_envs, num_bodies, device=device)
+        self.last_contact_time = torch.zeros(num_envs, num_bodies, device=device)
+        self.net_forces_w_history = torch.zeros(num_envs, history_length, num_bodies, 3, device=device)
+
+
+class MockContactSensor:
+    """Contact sensor with the air and contact time tracking of :class:`isaaclab.sensors.ContactSensor`."""
+
+    def __init__(self, num_envs: int, num_bodies: int, history_length: int, device: str):
+        self.cfg = MockContactSensorCfg()
+        self.data = MockContactSensorData(num_envs, num_bodies, history_length, device)
+
+    def compute_first_contact(self, dt: float, abs_tol: float = 1.0e-8) -> torch.Tensor:
+        """Checks if bodies have established contact within the last :attr:`dt` seconds."""
+        currently_in_contact = self.data.current_contact_time > 0.0
+        less_than_dt_in_contact = self.data.current_contact_time < (dt + abs_tol)
+        return currently_in_contact * less_than_dt_in_contact
+
+
+class MockArticulationData:
+    """Articulation buffers read by the MDP terms."""
+
+    def __init__(self, num_envs: int, num_bodies: int, device: str):
+        self.body_lin_vel_w = torch.zeros(num_envs, num_bodies, 3, device=device)
+        self.root_lin_vel_b = torch.zeros(num_envs, 3, device=device)
+        self.root_ang_vel_b = torch.zeros(num_envs, 3, device=device)
+
+
+class MockArticulation:
+    """Articulation exposing its data buffers."""
+
+    def __init__(self, num_envs: int, num_bodies: int, device: str):
+        self.data = MockArticulationData(num_envs, num_bodies, device)
+
+
+class MockScene:
+    """Scene holding one articulation and its contact sensor."""
+
+    def __init__(self, num_envs: int, num_bodies: int, history_length: int, device: str):
+        self.articulations = {"robot": MockArticulation(num_envs, num_bodies, device)}
+        self.sensors = {"contact_forces": MockContactSensor(num_envs, num_bodies, history_length, device)}
+
+    def __getitem__(self, key: str):
+        if key in self.articulations:
+            return self.articulations[key]
+        return self.sensors[key]
+
+
+class MockCommandManager:
+    """Command manager with a constant forward velocity command."""
+
+    def __init__(self, num_envs: int, device: str, command: tuple[float, float, float] = (1.0, 0.0, 0.0)):
+        self._command = torch.tensor(command, device=device).repeat(num_envs, 1)
+
+    def get_command(self, name: str) -> torch.Tensor:
+        return self._command
+
+
+class SyntheticGait:
+    """Vectorized trotting gait filling the foot buffers of the mock scene.
+
+    Every foot alternates between stance and swing with the given period and duty factor. Diagonal
+    feet are in phase and every environment gets a random phase offset. The foot speed follows a
+    half-sine profile during swing, scaled by a random per-environment gain, and touchdown produces
+    a vertical force spike.
+    """
+
+    def __init__(
+        self, env: MockEnv, foot_ids: list[int], period: float = 0.5, duty_factor: float = 0.6, seed: int = 0
+    ):
+        generator = torch.Generator(device="cpu").manual_seed(seed)
+        self.foot_ids = foot_ids
+        self.period = period
+        self.duty_factor = duty_factor
+        # trotting: front-left/rear-right and front-right/rear-left are in phase
+        foot_offsets = torch.tensor([(0.0, 0.5, 0.5, 0.0)[i % 4] for i in range(len(foot_ids))])
+        env_offsets = torch.rand(env.num_envs, 1, generator=generator)
+        self.phase = ((env_offsets + foot_offsets) % 1.0).to(env.device)
+        self.speed_gain = (0.5 + torch.rand(env.num_envs, 1, generator=generator)).to(env.device)
+
+    def step(self, env: MockEnv):
+        """Advance the gait by one environment step and write the foot buffers."""
+        sensor = env.scene.sensors["contact_forces"]
+        robot = env.scene.articulations["robot"]
+        self.phase = (self.phase + env.step_dt / self.period) % 1.0
+        in_swing = self.phase >= self.duty_factor
+        swing_progress = ((self.phase - self.duty_factor) / (1.0 - self.duty_factor)).clamp(0.0, 1.0)
+        swing_time = swing_progress * (1.0 - self.duty_factor) * self.period
+        stance_time = self.phase * self.period
+        data = sensor.data
+        was_in_swing = data.current_air_time[:, self.foot_ids] > 0.0
+        landed = was_in_swing & ~in_swing
+        lifted = ~was_in_swing & in_swing
+        # air and contact times, with the last durations updated on transitions
+        data.last_air_time[:, self.foot_ids] = torch.where(
+            landed, data.current_air_time[:, self.foot_ids], data.last_air_time[:, self.foot_ids]
+        )
+        data.last_contact_time[:, self.foot_ids] = torch.where(
+            lifted, data.current_contact_time[:, self.foot_ids], data.last_contact_time[:, self.foot_ids]
+        )
+        data.current_air_time[:, self.foot_ids] = torch.where(in_swing, swing_time.clamp(min=env.step_dt), 0.0)
+        data.current_contact_time[:, self.foot_ids] = torch.where(in_swing, 0.0, stance_time.clamp(min=env.step_dt))
+        # the first stance step is the touchdown
+        data.current_contact_time[:, self.foot_ids] = torch.where(
+            landed, env.step_dt, data.current_contact_time[:, self.foot_ids]
+        )
+        # half-sine speed profile during swing
+        speed = torch.where(in_swing, torch.sin(math.pi * swing_progress) * self.speed_gain, 0.0)
+        robot.data.body_lin_vel_w[:, self.foot_ids, 0] = speed
+        # contact force history, with one sample per physics step and a spike at the touchdown
+        for substep in range(round(env.step_dt / env.physics_dt)):
+            data.net_forces_w_history = data.net_forces_w_history.roll(1, dims=1)
+            spike = landed * 80.0 if substep == 0 else 0.0
+            data.net_forces_w_history[:, 0, self.foot_ids, 2] = torch.where(in_swing, 0.0, 40.0) + spike
+
+
+class RecordedStates:
+    """Replays the foot states of a rollout recorded with ``scripts/rsl_rl/play.py --record`` in a loop.
+
+    The recorded foot speeds are written to the forward velocity of the feet, and the air and contact
+    times to the contact sensor buffers. Recordings with fewer environments than the mock environment
+    are tiled along the environment dimension.
+    """
+
+    # recorded stream -> (scene entity, attribute) of the foot buffers
+    STREAMS = {
+        "foot_speeds": ("robot", "body_lin_vel_w"),
+        "current_air_time": ("contact_forces", "current_air_time"),
+        "last_air_time": ("contact_forces", "last_air_time"),
+        "current_contact_time": ("contact_forces", "current_contact_time"),
+    }
+
+    def __init__(self, env: MockEnv, directory: str):
+        with open(os.path.join(directory, "meta.json")) as f:
+            metadata = json.load(f)
+        num_steps, chunk_size = metadata["num_steps"], metadata["chunk_size"]
+        num_chunks = (num_steps + chunk_size - 1) // chunk_size
+        self.frames = {}
+        for name in self.STREAMS:
+            chunks = [
+                np.load(os.path.join(directory, name, f"chunk_{chunk_index:05d}.npy"), mmap_mode="r")
+                for chunk_index in range(num_chunks)
+            ]
+            frames = torch.from_numpy(np.concatenate(chunks)[:num_steps])
+            repeats = math.ceil(env.num_envs / frames.shape[1])
+            self.frames[name] = frames.repeat(1, repeats, 1)[:, : env.num_envs].to(env.device)
+        self.num_steps = num_steps
+        self.foot_ids = env.foot_ids
+        self._index = 0
+
+    def step(self, env: MockEnv):
+        """Write the next recorded frame into the scene buffers."""
+        for name, (entity_name, attribute) in self.STREAMS.items():
+            buffer = getattr(env.scene[entity_name].data, attribute)
+            if buffer.dim() == 3:
+                buffer = buffer[..., 0]
+            buffer[:, self.foot_ids] = self.frames[name][self._index]
+        self._index = (self._index + 1) % self.num_steps
+
+
+class MockEnv:
+    """Stand-in for a manager-based RL environment, driven by synthetic or recorded states."""
+
+    def __init__(
+        self,
+        num_envs: int,
+        device: str = "cpu",
+        step_dt: float = 0.02,
+        num_bodies: int = GO2_NUM_BODIES,
+        foot_ids: list[int] | None = None,
+        history_length: int = 3,
+        recording: str | None = None,
+        seed: int = 0,
+    ):
+        """Initialize the environment.
+
+        Args:
+            num_envs: Number of environments.
+            device: Device on which the buffers are allocated.
+            step_dt: Environment step duration (s).
+            num_bodies: Number of bodies of the articulation and contact sensor.
+            foot_ids: Body indices of the feet. Defaults to the feet of the Unitree Go2.
+            history_length: Length of the contact force history.
+            recording: Directory of a recorded rollout to replay. Defaults to None, in which case a
+                synthetic gait is generated.
+            seed: Seed of the synthetic gait.
+        """
+        self.num_envs = num_envs
+        self.device = device
+        self.step_dt = step_dt
+        self.physics_dt = step_dt / 4
+        self.common_step_counter = 0
+        self.foot_ids = foot_ids if foot_ids is not None else GO2_FOOT_IDS
+        self.scene = MockScene(num_envs, num_bodies, history_length, device)
+        self.command_manager = MockCommandManager(num_envs, device)
+        if recording is not None:
+            self.source = RecordedStates(self, recording)
+        else:
+            self.source = SyntheticGait(self, self.foot_ids, seed=seed)
+        self.step()
+
+    def step(self):
+        """Advance the scene state by one environment step."""
+        self.common_step_counter += 1
+        self.source.step(self)
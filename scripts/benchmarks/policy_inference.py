@@ -0,0 +1,138 @@
+"""Script to benchmark the CPU inference of exported policies in a fixed-rate control loop.
+
+The policies are run by :mod:`accrobotics.deploy` at the 50 Hz rate of the Go2 policies, optionally
+restricted to a single core and thread to approximate an embedded-class CPU. For every policy and
+batch size the script reports the latency percentiles, the wake-up jitter and the share of the
+control period used by the 99th percentile step. It fails if that share exceeds ``--max_utilization``.
+
+Without ``--policy``, TorchScript policies with the observation and network sizes of the flat and
+rough Go2 tasks are generated:
+
+.. code-block:: bash
+
+    python scripts/benchmarks/policy_inference.py --cpu 0 --threads 1
+    python scripts/benchmarks/policy_inference.py \\
+        --policy logs/rsl_rl/<experiment>/<run>/exported/<checkpoint>/policy.onnx
+
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import torch
+from prettytable import PrettyTable
+
+from accrobotics import deploy
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark the CPU inference of exported policies.")
+parser.add_argument("--policy", type=str, nargs="+", default=None, help="Exported policy files (.pt or .onnx).")
+parser.add_argument("--batch_sizes", type=int, nargs="+", default=[1], help="Observation batch sizes.")
+parser.add_argument("--threads", type=int, default=1, help="Number of inference threads.")
+parser.add_argument("--cpu", type=int, default=None, help="Pin the process to this CPU core.")
+parser.add_argument("--rate", type=float, default=50.0, help="Control rate (Hz).")
+parser.add_argument("--steps", type=int, default=500, help="Number of timed control steps per policy.")
+parser.add_argument("--warmup", type=int, default=50, help="Number of untimed calls per policy.")
+parser.add_argument(
+    "--max_utilization",
+    type=float,
+    default=0.5,
+    help="Maximum share of the control period that the 99th percentile step may use.",
+)
+args_cli = parser.parse_args()
+
+# observation sizes and actor networks of the Go2 tasks
+GO2_POLICIES = {
+    "go2_flat": (48, [128, 128, 128]),
+    "go2_rough": (235, [512, 256, 128]),
+}
+GO2_NUM_ACTIONS = 12
+
+
+class _ExportedPolicy(torch.nn.Module):
+    """Module with the structure of the policies exported by :func:`isaaclab_rl.rsl_rl.export_policy_as_jit`."""
+
+    def __init__(self, num_obs: int, hidden_dims: list[int], num_actions: int):
+        super().__init__()
+        layers = []
+        for in_dim, out_dim in zip([num_obs, *hidden_dims], hidden_dims):
+            layers += [torch.nn.Linear(in_dim, out_dim), torch.nn.ELU()]
+        layers.append(torch.nn.Linear(hidden_dims[-1], num_actions))
+        self.actor = torch.nn.Sequential(*layers)
+        self.normalizer = torch.nn.Identity()
+
+    def forward(self, x: torch.Tensor) -> torch.Tensor:
+        return self.actor(self.normalizer(x))
+
+
+def generate_policies(directory: str) -> dict[str, str]:
+    """Export TorchScript policies with the sizes of the Go2 tasks and return their paths."""
+    paths = {}
+    for name, (num_obs, hidden_dims) in GO2_POLICIES.items():
+        path = os.path.join(directory, f"{name}.pt")
+        torch.jit.script(_ExportedPolicy(num_obs, hidden_dims, GO2_NUM_ACTIONS)).save(path)
+        paths[name] = path
+    return paths
+
+
+def main():
+    """Benchmark the policies in the control loop."""
+    if args_cli.cpu is not None:
+        os.sched_setaffinity(0, {args_cli.cpu})
+
+    table = PrettyTable([
+        "Policy",
+        "Batch",
+        "p50 (us)",
+        "p99 (us)",
+        "Max (us)",
+        "Max jitter (us)",
+        "Overruns",
+        "p99 utilization",
+    ])
+    cpu = f"core {args_cli.cpu}" if args_cli.cpu is not None else "all cores"
+    table.title = f"Policy inference at {args_cli.rate:g} Hz ({args_cli.threads} thread(s), {cpu})"
+    table.align["Policy"] = "l"
+
+    failures = []
+    with tempfile.TemporaryDirectory() as directory:
+        if args_cli.policy is None:
+            policies = generate_policies(directory)
+        else:
+            policies = {os.path.relpath(path): path for path in args_cli.policy}
+        for name, path in policies.items():
+            for batch_size in args_cli.batch_sizes:
+                policy = deploy.load_policy(path, batch_size=batch_size, num_threads=args_cli.threads)
+                obs = torch.randn(batch_size, policy.num_obs).numpy()
+                for _ in range(args_cli.warmup):
+                    policy(obs)
+                summary = deploy.run_control_loop(
+                    policy, lambda: obs, rate_hz=args_cli.rate, num_steps=args_cli.steps
+                )
+                table.add_row([
+                    name,
+                    batch_size,
+                    f"{summary['p50_us']:.1f}",
+                    f"{summary['p99_us']:.1f}",
+                    f"{summary['max_us']:.1f}",
+                    f"{summary['jitter_max_us']:.1f}",
+                    summary["num_overruns"],
+                    f"{summary['utilization_p99']:.2%}",
+                ])
+                if summary["utilization_p99"] > args_cli.max_utilization or summary["num_overruns"] > 0:
+                    failures.append(
+                        f"{name} (batch {batch_size}): {summary['utilization_p99']:.2%} of the period,"
+                        f" {summary['num_overruns']} overrun(s)"
+                    )
+    print(table)
+
+    if failures:
+        print(f"[ERROR] Policies overrunning or exceeding {args_cli.max_utilization:.0%} of the control period:")
+        print("  " + "\n  ".join(failures))
+        sys.exit(1)
+    print(f"[INFO] All policies use less than {args_cli.max_utilization:.0%} of the control period.")
+
+
+if __name__ == "__main__":
+    main()
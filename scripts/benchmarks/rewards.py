@@ -0,0 +1,187 @@
+"""Script to benchmark the reward terms of the extension without Isaac Sim.
+
+The reward terms are driven by a mock environment on synthetic or recorded states. For every term and
+environment count the script reports the throughput (env-steps/s), the number and size of tensor
+allocations per call and the memory of the benchmark: the peak memory allocated by PyTorch on CUDA
+devices, and the growth of the resident memory of the process over the benchmark on the CPU.
+
+The results can be saved as a baseline and later runs compared against it, which makes the script
+usable as a regression benchmark on machines without a GPU or a simulator:
+
+.. code-block:: bash
+
+    python scripts/benchmarks/rewards.py --save baseline.json
+    python scripts/benchmarks/rewards.py --compare baseline.json --tolerance 0.2
+
+"""
+
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import torch
+from prettytable import PrettyTable
+from torch.profiler import ProfilerActivity, profile
+
+import accrobotics.mdp as mdp
+
+from mock_env import GO2_FOOT_IDS, MockEntityCfg, MockEnv
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark the reward terms on a mock environment.")
+parser.add_argument(
+    "--num_envs", type=int, nargs="+", default=[1024, 4096, 16384], help="Environment counts to benchmark."
+)
+parser.add_argument("--steps", type=int, default=200, help="Number of timed environment steps per term.")
+parser.add_argument("--warmup", type=int, default=20, help="Number of untimed environment steps per term.")
+parser.add_argument("--device", type=str, default="cpu", help="Device on which the terms are evaluated.")
+parser.add_argument(
+    "--recording", type=str, default=None, help="Recorded rollout to replay instead of a synthetic gait."
+)
+parser.add_argument("--save", type=str, default=None, help="Save the results to a JSON file.")
+parser.add_argument("--compare", type=str, default=None, help="Compare the throughput against saved results.")
+parser.add_argument(
+    "--tolerance", type=float, default=0.2, help="Allowed relative throughput drop when comparing against results."
+)
+args_cli = parser.parse_args()
+
+
+def reward_terms() -> dict:
+    """Return the benchmarked terms with the parameters used by the quiet locomotion tasks."""
+    sensor_cfg = MockEntityCfg("contact_forces", body_ids=GO2_FOOT_IDS)
+    asset_cfg = MockEntityCfg("robot")
+    foot_deceleration_params = {
+        "sensor_cfg": sensor_cfg,
+        "asset_cfg": asset_cfg,
+        "velocity_threshold": 0.3,
+        "min_air_time": 0.05,
+        "deceleration_phase": 0.1,
+    }
+    return {
+        "foot_deceleration_swing_phase (jit)": (
+            mdp.foot_deceleration_swing_phase,
+            {**foot_deceleration_params, "backend": "jit"},
+        ),
+        "foot_deceleration_swing_phase (eager)": (
+            mdp.foot_deceleration_swing_phase,
+            {**foot_deceleration_params, "backend": "eager"},
+        ),
+        "feet_air_time": (
+            mdp.feet_air_time,
+            {"command_name": "base_velocity", "sensor_cfg": sensor_cfg, "threshold": 0.5},
+        ),
+        "foot_landing_impact": (mdp.foot_landing_impact, {"sensor_cfg": sensor_cfg, "metric": "impulse"}),
+    }
+
+
+def resident_memory_mb() -> float:
+    """Return the resident memory of the process (in MiB), read from ``/proc/self/statm``."""
+    with open("/proc/self/statm") as f:
+        resident_pages = int(f.read().split()[1])
+    return resident_pages * os.sysconf("SC_PAGE_SIZE") / 2**20
+
+
+def measure_allocations(env: MockEnv, func, params: dict) -> tuple[int, int]:
+    """Return the number and total size (in bytes) of the tensor allocations of one call."""
+    activities = [ProfilerActivity.CPU]
+    if env.device.startswith("cuda"):
+        activities.append(ProfilerActivity.CUDA)
+    env.step()
+    with profile(activities=activities, profile_memory=True) as prof:
+        func(env, **params)
+    num_allocations, num_bytes = 0, 0
+    for event in prof.events():
+        if env.device.startswith("cuda"):
+            usage = getattr(event, "self_device_memory_usage", getattr(event, "self_cuda_memory_usage", 0))
+        else:
+            usage = event.self_cpu_memory_usage
+        if event.name != "[memory]" and usage > 0:
+            num_allocations += 1
+            num_bytes += usage
+    return num_allocations, num_bytes
+
+
+def benchmark(num_envs: int, func, params: dict) -> dict:
+    """Benchmark a reward term on a mock environment."""
+    # the peak resident memory of the process cannot be reset, so its growth is measured instead
+    gc.collect()
+    memory_start_mb = resident_memory_mb()
+    env = MockEnv(num_envs, device=args_cli.device, recording=args_cli.recording)
+    for _ in range(args_cli.warmup):
+        env.step()
+        func(env, **params)
+    if env.device.startswith("cuda"):
+        torch.cuda.reset_peak_memory_stats()
+    elapsed = 0.0
+    for _ in range(args_cli.steps):
+        # only the term is timed, not the update of the mock state
+        env.step()
+        if env.device.startswith("cuda"):
+            torch.cuda.synchronize()
+        start = time.perf_counter()
+        func(env, **params)
+        if env.device.startswith("cuda"):
+            torch.cuda.synchronize()
+        elapsed += time.perf_counter() - start
+    num_allocations, num_bytes = measure_allocations(env, func, params)
+    if env.device.startswith("cuda"):
+        memory_mb = torch.cuda.max_memory_allocated() / 2**20
+    else:
+        memory_mb = resident_memory_mb() - memory_start_mb
+    return {
+        "env_steps_per_s": num_envs * args_cli.steps / elapsed,
+        "us_per_call": elapsed / args_cli.steps * 1e6,
+        "allocations_per_call": num_allocations,
+        "allocated_kb_per_call": num_bytes / 2**10,
+        "memory_mb": memory_mb,
+    }
+
+
+def main():
+    """Benchmark the reward terms and optionally compare against saved results."""
+    memory_column = "Peak memory (MiB)" if args_cli.device.startswith("cuda") else "Memory growth (MiB)"
+    table = PrettyTable(["Term", "Envs", "Env-steps/s", "us/call", "Allocs/call", "KiB/call", memory_column])
+    table.title = f"Reward terms on mock environment ({args_cli.device})"
+    table.align["Term"] = "l"
+
+    results = {}
+    for term_name, (func, params) in reward_terms().items():
+        for num_envs in args_cli.num_envs:
+            result = benchmark(num_envs, func, params)
+            results[f"{term_name}/{num_envs}"] = result
+            table.add_row([
+                term_name,
+                num_envs,
+                f"{result['env_steps_per_s']:.3e}",
+                f"{result['us_per_call']:.1f}",
+                result["allocations_per_call"],
+                f"{result['allocated_kb_per_call']:.1f}",
+                f"{result['memory_mb']:.1f}",
+            ])
+    print(table)
+
+    if args_cli.save is not None:
+        with open(args_cli.save, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"[INFO] Saved results to: {args_cli.save}")
+
+    if args_cli.compare is not None:
+        with open(args_cli.compare) as f:
+            baseline = json.load(f)
+        regressions = []
+        for key, result in results.items():
+            if key not in baseline:
+                continue
+            ratio = result["env_steps_per_s"] / baseline[key]["env_steps_per_s"]
+            if ratio < 1.0 - args_cli.tolerance:
+                regressions.append(f"{key}: {ratio:.2f}x of baseline throughput")
+        if regressions:
+            print("[ERROR] Throughput regressions:\n  " + "\n  ".join(regressions))
+            sys.exit(1)
+        print(f"[INFO] No throughput regression against: {args_cli.compare}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,7 @@
+"""Test configuration of the benchmarks, run without Isaac Sim."""
+
+import os
+import sys
+
+# the modules of the benchmarks are imported as top-level modules, as when running the scripts
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
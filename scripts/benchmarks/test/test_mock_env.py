@@ -0,0 +1,63 @@
+"""Tests of the mock environment driving the reward terms without Isaac Sim."""
+
+import json
+import numpy as np
+import torch
+
+from mock_env import GO2_FOOT_IDS, MockEnv  # isort: skip
+
+
+def test_synthetic_gait():
+    env = MockEnv(64, seed=1)
+    sensor = env.scene.sensors["contact_forces"]
+    robot = env.scene.articulations["robot"]
+    num_touchdowns = 0
+    for _ in range(50):
+        env.step()
+        air_time = sensor.data.current_air_time[:, GO2_FOOT_IDS]
+        contact_time = sensor.data.current_contact_time[:, GO2_FOOT_IDS]
+        foot_velocities = robot.data.body_lin_vel_w[:, GO2_FOOT_IDS]
+        # every foot is either in the air or in contact, and only swinging feet move
+        assert torch.all((air_time > 0.0) ^ (contact_time > 0.0))
+        assert torch.all(foot_velocities[contact_time > 0.0] == 0.0)
+        # only the feet in contact have a contact force at the last physics step
+        forces = sensor.data.net_forces_w_history[:, 0, GO2_FOOT_IDS, 2]
+        assert torch.all((forces > 0.0) == (contact_time > 0.0))
+        # the contact time of a touchdown is one step, as for the contact sensor of Isaac Lab
+        first_contact = sensor.compute_first_contact(env.step_dt)[:, GO2_FOOT_IDS]
+        assert torch.allclose(contact_time[first_contact], torch.tensor(env.step_dt))
+        num_touchdowns += int(first_contact.sum())
+    assert env.common_step_counter == 51
+    assert num_touchdowns > 0
+    assert torch.all(sensor.data.last_air_time[:, GO2_FOOT_IDS] > 0.0)
+
+
+def test_synthetic_gait_seed():
+    speeds = [MockEnv(8, seed=seed).scene.articulations["robot"].data.body_lin_vel_w for seed in (0, 0, 1)]
+    assert torch.equal(speeds[0], speeds[1])
+    assert not torch.equal(speeds[0], speeds[2])
+
+
+def test_recorded_states(tmp_path):
+    # a recording of two environments over five steps, in chunks of three steps
+    num_steps, chunk_size, num_feet = 5, 3, len(GO2_FOOT_IDS)
+    frames = np.arange(num_steps * 2 * num_feet, dtype=np.float32).reshape(num_steps, 2, num_feet)
+    streams = ("foot_speeds", "current_air_time", "last_air_time", "current_contact_time")
+    for name in streams:
+        (tmp_path / name).mkdir()
+        for chunk_index in range(2):
+            chunk = np.zeros((chunk_size, 2, num_feet), dtype=np.float32)
+            recorded = frames[chunk_index * chunk_size : (chunk_index + 1) * chunk_size]
+            chunk[: len(recorded)] = recorded
+            np.save(tmp_path / name / f"chunk_{chunk_index:05d}.npy", chunk)
+    (tmp_path / "meta.json").write_text(json.dumps({"num_steps": num_steps, "chunk_size": chunk_size}))
+
+    env = MockEnv(3, recording=str(tmp_path))
+    speeds = env.scene.articulations["robot"].data.body_lin_vel_w
+    air_time = env.scene.sensors["contact_forces"].data.current_air_time
+    for step in range(2 * num_steps):
+        # the recording is replayed in a loop and tiled over the environments
+        expected = torch.from_numpy(frames[step % num_steps][[0, 1, 0]])
+        assert torch.equal(speeds[:, GO2_FOOT_IDS, 0], expected)
+        assert torch.equal(air_time[:, GO2_FOOT_IDS], expected)
+        env.step()
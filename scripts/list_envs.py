@@ -1,30 +1,102 @@
 """
 Script to print all the available environments in the extension.
 
-The script iterates over all registered environments and stores the details in a table.
-It prints the name of the environment, the entry point and the config file.
+The environments are read from the task manifest ``accrobotics/tasks/manifest.json``, which lists the
+``gym.register`` calls of :mod:`accrobotics.tasks`. Reading the manifest neither launches the simulator
+nor imports the extension, so the tasks are listed in milliseconds. It prints the name of the
+environment, the entry point and the config file.
+
+The manifest is regenerated from the registered environments with ``--generate`` and checked to be
+up to date with ``--check``:
+
+.. code-block:: bash
+
+    # print the tasks, or the manifest as JSON for job schedulers
+    python scripts/list_envs.py
+    python scripts/list_envs.py --json
+    # after adding or changing a task registration
+    python scripts/list_envs.py --generate
+    # in CI, fails if the manifest is out of date
+    python scripts/list_envs.py --check
+
 """
 
-"""Launch Isaac Sim Simulator first."""
+import argparse
+import importlib.util
+import json
+import os
+import sys
 
-from isaaclab.app import AppLauncher
+# add argparse arguments
+parser = argparse.ArgumentParser(description="List the environments of the extension.")
+group = parser.add_mutually_exclusive_group()
+group.add_argument("--json", action="store_true", default=False, help="Print the task manifest as JSON.")
+group.add_argument(
+    "--generate", action="store_true", default=False, help="Regenerate the task manifest from the registered tasks."
+)
+group.add_argument(
+    "--check", action="store_true", default=False, help="Fail if the task manifest differs from the registered tasks."
+)
+args_cli = parser.parse_args()
 
-# launch omniverse app
-app_launcher = AppLauncher(headless=True)
-simulation_app = app_launcher.app
+# prefixes of the environment names registered by the extension
+TASK_PREFIXES = ("Base-", "Acc-")
 
 
-"""Rest everything follows."""
+def manifest_path() -> str:
+    """Return the path of the task manifest, without importing the extension."""
+    spec = importlib.util.find_spec("accrobotics")
+    if spec is None or not spec.submodule_search_locations:
+        raise ModuleNotFoundError("The 'accrobotics' extension is not installed.")
+    return os.path.join(spec.submodule_search_locations[0], "tasks", "manifest.json")
 
-import gymnasium as gym
-from prettytable import PrettyTable
 
-# Import extensions to set up environment tasks
-import accrobotics.tasks  # noqa: F401
+def registered_tasks() -> dict:
+    """Return the manifest of the environments registered by the extension."""
+    import gymnasium as gym
+
+    # Import extensions to set up environment tasks
+    import accrobotics.tasks  # noqa: F401
+
+    tasks = []
+    for task_spec in gym.registry.values():
+        if task_spec.id.startswith(TASK_PREFIXES):
+            tasks.append({
+                "id": task_spec.id,
+                "entry_point": task_spec.entry_point,
+                "disable_env_checker": task_spec.disable_env_checker,
+                "kwargs": task_spec.kwargs,
+            })
+    return {"tasks": tasks}
 
 
 def main():
-    """Print all environments registered in `isaac.lab_demo` extension."""
+    """Print all environments registered in the extension."""
+    path = manifest_path()
+
+    if args_cli.generate or args_cli.check:
+        manifest = registered_tasks()
+        if args_cli.generate:
+            with open(path, "w") as f:
+                json.dump(manifest, f, indent=2)
+                f.write("\n")
+            print(f"[INFO] Wrote {len(manifest['tasks'])} task(s) to: {path}")
+            return
+        with open(path) as f:
+            if json.load(f) != manifest:
+                print(f"[ERROR] The task manifest is out of date, run: python {sys.argv[0]} --generate")
+                sys.exit(1)
+        print(f"[INFO] The task manifest is up to date: {path}")
+        return
+
+    with open(path) as f:
+        manifest = json.load(f)
+    if args_cli.json:
+        print(json.dumps(manifest, indent=2))
+        return
+
+    from prettytable import PrettyTable
+
     # print all the available environments
     table = PrettyTable(["S. No.", "Task Name", "Entry Point", "Config"])
     table.title = "Available Environments in Isaac Lab Template Extension"
@@ -32,26 +104,12 @@ def main():
     table.align["Task Name"] = "l"
     table.align["Entry Point"] = "l"
     table.align["Config"] = "l"
-
-    # count of environments
-    index = 0
-    # acquire all Isaac environments names
-    for task_spec in gym.registry.values():
-        if "Base-" in task_spec.id or "Acc-" in task_spec.id:
-            # add details to table
-            table.add_row([index + 1, task_spec.id, task_spec.entry_point, task_spec.kwargs["env_cfg_entry_point"]])
-            # increment count
-            index += 1
+    for index, task in enumerate(manifest["tasks"]):
+        # add details to table
+        table.add_row([index + 1, task["id"], task["entry_point"], task["kwargs"]["env_cfg_entry_point"]])
 
     print(table)
 
 
 if __name__ == "__main__":
-    try:
-        # run the main function
-        main()
-    except Exception as e:
-        raise e
-    finally:
-        # close the app
-        simulation_app.close()
+    main()
@@ -0,0 +1,215 @@
+"""Script to find the number of environments with the highest training throughput for a task.
+
+The script trains with the RSL-RL configuration of the task for a few iterations at increasing numbers
+of environments, starting at ``--min_envs`` and growing by ``--growth``. Every probe measures the
+environment steps per second of the training iterations, the device memory and the growth of the host
+memory of the process. The search stops when the throughput grows by less than ``--min_gain``, when the
+next probe is expected to exceed ``--max_memory_fraction`` of the device memory or at ``--max_envs``.
+The number of environments with the highest throughput and all probes are saved in the cache of
+:mod:`autotune_cache`, from which ``train.py`` takes the number of environments when ``--num_envs`` is
+not given.
+
+.. code-block:: bash
+
+    python scripts/rsl_rl/autotune.py --task Acc-QuietVelocity-Rough-Unitree-Go2-v0 --headless
+
+"""
+
+"""Launch Isaac Sim Simulator first."""
+
+import argparse
+
+from isaaclab.app import AppLauncher
+
+# local imports
+import cli_args  # isort: skip
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Find the throughput-optimal number of environments of a task.")
+parser.add_argument("--task", type=str, default=None, help="Name of the task.")
+parser.add_argument("--min_envs", type=int, default=512, help="Number of environments of the first probe.")
+parser.add_argument("--max_envs", type=int, default=32768, help="Maximum number of environments.")
+parser.add_argument("--growth", type=float, default=2.0, help="Growth factor of the number of environments.")
+parser.add_argument("--iterations", type=int, default=5, help="Number of timed training iterations per probe.")
+parser.add_argument(
+    "--warmup_iterations", type=int, default=2, help="Number of untimed training iterations per probe."
+)
+parser.add_argument(
+    "--min_gain",
+    type=float,
+    default=0.05,
+    help="Stop when the throughput grows by less than this fraction from one probe to the next.",
+)
+parser.add_argument(
+    "--max_memory_fraction",
+    type=float,
+    default=0.9,
+    help="Stop before the device memory in use is expected to exceed this fraction of the total memory.",
+)
+parser.add_argument("--cache", type=str, default=None, help="Path to the cache file. Defaults to the shared cache.")
+# append RSL-RL cli arguments
+cli_args.add_rsl_rl_args(parser)
+# append AppLauncher cli args
+AppLauncher.add_app_launcher_args(parser)
+args_cli = parser.parse_args()
+# the probes do not render
+args_cli.headless = True
+
+# launch omniverse app
+app_launcher = AppLauncher(args_cli)
+simulation_app = app_launcher.app
+
+"""Rest everything follows."""
+
+import gc
+import gymnasium as gym
+import math
+import omni.usd
+import os
+import time
+import torch
+from datetime import datetime
+from prettytable import PrettyTable
+
+from rsl_rl.runners import OnPolicyRunner
+
+from isaaclab_rl.rsl_rl import RslRlOnPolicyRunnerCfg, RslRlVecEnvWrapper
+from isaaclab_tasks.utils import parse_env_cfg
+
+# Import extensions to set up environment tasks
+import accrobotics.tasks  # noqa: F401
+
+from autotune_cache import CACHE_PATH, AutotuneCache, hardware_key  # isort: skip
+
+
+def host_memory_gib() -> float:
+    """Return the resident memory of the process on the host (in GiB), read from ``/proc/self/statm``."""
+    with open("/proc/self/statm") as f:
+        resident_pages = int(f.read().split()[1])
+    return resident_pages * os.sysconf("SC_PAGE_SIZE") / 2**30
+
+
+def probe(num_envs: int, agent_cfg: RslRlOnPolicyRunnerCfg) -> dict:
+    """Train for a few iterations with a number of environments and measure the throughput and memory.
+
+    Args:
+        num_envs: The number of environments.
+        agent_cfg: The RSL-RL configuration of the task.
+
+    Returns:
+        The environment steps per second of the timed iterations, the device memory in use and the peak
+        memory of PyTorch on the device (in GiB), and the growth of the resident host memory of the process
+        during the probe (in GiB).
+    """
+    env_cfg = parse_env_cfg(args_cli.task, device=args_cli.device, num_envs=num_envs)
+    env_cfg.seed = agent_cfg.seed
+    device = torch.device(env_cfg.sim.device)
+    use_cuda = device.type == "cuda"
+    if use_cuda:
+        torch.cuda.reset_peak_memory_stats(device)
+    # the peak resident memory cannot be reset, so the growth of the resident memory is measured instead
+    host_memory_start = host_memory_gib()
+    # every probe simulates on a new stage
+    omni.usd.get_context().new_stage()
+    env = RslRlVecEnvWrapper(gym.make(args_cli.task, cfg=env_cfg))
+    try:
+        runner = OnPolicyRunner(env, agent_cfg.to_dict(), log_dir=None, device=agent_cfg.device)
+        runner.learn(num_learning_iterations=args_cli.warmup_iterations, init_at_random_ep_len=True)
+        if use_cuda:
+            torch.cuda.synchronize(device)
+        start = time.perf_counter()
+        runner.learn(num_learning_iterations=args_cli.iterations)
+        if use_cuda:
+            torch.cuda.synchronize(device)
+        elapsed = time.perf_counter() - start
+        result = {
+            "num_envs": num_envs,
+            "env_steps_per_s": args_cli.iterations * agent_cfg.num_steps_per_env * num_envs / elapsed,
+            "iteration_time_s": elapsed / args_cli.iterations,
+        }
+        if use_cuda:
+            free, total = torch.cuda.mem_get_info(device)
+            result["device_memory_gib"] = (total - free) / 2**30
+            result["device_memory_total_gib"] = total / 2**30
+            result["torch_peak_memory_gib"] = torch.cuda.max_memory_allocated(device) / 2**30
+        result["host_memory_delta_gib"] = host_memory_gib() - host_memory_start
+        return result
+    finally:
+        env.close()
+        # release the memory of the probe before the next one
+        gc.collect()
+        if use_cuda:
+            torch.cuda.empty_cache()
+
+
+def main():
+    """Probe increasing numbers of environments and cache the best one."""
+    agent_cfg: RslRlOnPolicyRunnerCfg = cli_args.parse_rsl_rl_cfg(args_cli.task, args_cli)
+    agent_cfg.device = args_cli.device if args_cli.device is not None else agent_cfg.device
+    device = agent_cfg.device
+    print(f"[INFO] Tuning the number of environments of '{args_cli.task}' on: {hardware_key(device)}")
+
+    probes = []
+    stop_reason = "max_envs"
+    num_envs = args_cli.min_envs
+    while num_envs <= args_cli.max_envs:
+        print(f"[INFO] Probing {num_envs} environments.")
+        try:
+            result = probe(num_envs, agent_cfg)
+        except torch.cuda.OutOfMemoryError:
+            if not probes:
+                raise
+            stop_reason = "out_of_memory"
+            break
+        print(f"[INFO] {num_envs} environments: {result['env_steps_per_s']:.0f} env-steps/s.")
+        best = max(probes, key=lambda p: p["env_steps_per_s"], default=None)
+        probes.append(result)
+        if best is not None and result["env_steps_per_s"] < (1.0 + args_cli.min_gain) * best["env_steps_per_s"]:
+            stop_reason = "diminishing_returns"
+            break
+        next_num_envs = math.ceil(num_envs * args_cli.growth)
+        # extrapolate the device memory linearly in the number of environments
+        if "device_memory_gib" in result:
+            memory = result["device_memory_gib"]
+            if len(probes) > 1:
+                previous = probes[-2]
+                per_env = (memory - previous["device_memory_gib"]) / (num_envs - previous["num_envs"])
+                memory += max(per_env, 0.0) * (next_num_envs - num_envs)
+            if memory > args_cli.max_memory_fraction * result["device_memory_total_gib"]:
+                stop_reason = "memory_limit"
+                break
+        num_envs = next_num_envs
+
+    best = max(probes, key=lambda p: p["env_steps_per_s"])
+    table = PrettyTable(["Environments", "Env-steps/s", "Iteration (s)", "Device memory (GiB)", "Host growth (GiB)"])
+    table.title = f"{args_cli.task} on {hardware_key(device)}"
+    for result in probes:
+        table.add_row([
+            result["num_envs"],
+            f"{result['env_steps_per_s']:.0f}",
+            f"{result['iteration_time_s']:.3f}",
+            f"{result.get('device_memory_gib', math.nan):.2f}",
+            f"{result['host_memory_delta_gib']:.2f}",
+        ])
+    print(table)
+
+    cache = AutotuneCache(args_cli.cache or CACHE_PATH)
+    cache.put(
+        args_cli.task,
+        device,
+        {
+            "num_envs": best["num_envs"],
+            "env_steps_per_s": best["env_steps_per_s"],
+            "stop_reason": stop_reason,
+            "date": datetime.now().isoformat(timespec="seconds"),
+            "probes": probes,
+        },
+    )
+    print(f"[INFO] Chose {best['num_envs']} environments ({stop_reason}), saved to: {cache.path}")
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
+    # close sim app
+    simulation_app.close()
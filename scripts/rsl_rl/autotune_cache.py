@@ -0,0 +1,103 @@
+"""Cache of the numbers of environments tuned by ``autotune.py``, keyed by task and hardware.
+
+The cache is a JSON file ``logs/rsl_rl/autotune.json``. For every task and hardware it holds the chosen
+number of environments and the throughput and memory measured at every probed number. ``train.py``
+uses the chosen number when ``--num_envs`` is not given.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import fcntl
+import json
+import os
+import platform
+import torch
+
+# default path of the cache, relative to the working directory like the logs
+CACHE_PATH = os.path.join("logs", "rsl_rl", "autotune.json")
+
+
+def hardware_key(device: str | torch.device) -> str:
+    """Return the name of the hardware running the simulation on a device.
+
+    Args:
+        device: The simulation device.
+
+    Returns:
+        The name and memory of the GPU for CUDA devices, the processor and number of cores otherwise.
+    """
+    device = torch.device(device)
+    if device.type == "cuda":
+        properties = torch.cuda.get_device_properties(device)
+        return f"{properties.name} ({properties.total_memory / 2**30:.0f} GiB)"
+    return f"{platform.processor() or platform.machine()} ({os.cpu_count()} CPUs)"
+
+
+class AutotuneCache:
+    """Tuned numbers of environments of the tasks on every hardware.
+
+    Updates hold an exclusive lock on ``autotune.json.lock`` and replace the file atomically, as for the
+    checkpoint index.
+    """
+
+    def __init__(self, path: str = CACHE_PATH):
+        """Initialize the cache.
+
+        Args:
+            path: The path to the cache file. Defaults to ``logs/rsl_rl/autotune.json``.
+        """
+        self.path = os.path.abspath(path)
+
+    def load(self) -> dict:
+        """Return the cache, mapping the tasks to the hardware names to their tuning results."""
+        if not os.path.isfile(self.path):
+            return {"tasks": {}}
+        with open(self.path) as f:
+            return json.load(f)
+
+    def get(self, task: str, device: str | torch.device) -> dict | None:
+        """Return the tuning result of a task on the hardware of a device, or None if it was not tuned.
+
+        Args:
+            task: The task name.
+            device: The simulation device.
+        """
+        return self.load()["tasks"].get(task, {}).get(hardware_key(device))
+
+    def num_envs(self, task: str, device: str | torch.device) -> int | None:
+        """Return the tuned number of environments of a task on the hardware of a device, or None.
+
+        Args:
+            task: The task name.
+            device: The simulation device.
+        """
+        result = self.get(task, device)
+        return None if result is None else result["num_envs"]
+
+    def put(self, task: str, device: str | torch.device, result: dict):
+        """Store the tuning result of a task on the hardware of a device, replacing the previous one.
+
+        Args:
+            task: The task name.
+            device: The simulation device.
+            result: The tuning result, with the chosen ``num_envs`` and the measured ``probes``.
+        """
+        with self._update() as cache:
+            cache["tasks"].setdefault(task, {})[hardware_key(device)] = result
+
+    @contextlib.contextmanager
+    def _update(self):
+        """Lock the cache and yield it for modification, then write it atomically."""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(f"{self.path}.lock", "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                cache = self.load()
+                yield cache
+                tmp_path = f"{self.path}.{os.getpid()}.tmp"
+                with open(tmp_path, "w") as f:
+                    json.dump(cache, f, indent=2)
+                os.replace(tmp_path, self.path)
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
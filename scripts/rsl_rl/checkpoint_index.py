@@ -0,0 +1,260 @@
+"""Index of the checkpoints of an experiment, resolving checkpoints without listing the run directories.
+
+:func:`isaaclab_tasks.utils.get_checkpoint_path` lists every run directory of the experiment and every
+file of the selected run, which is slow on shared storage with many runs and checkpoints. The index is a
+JSON file ``checkpoints.json`` in the experiment directory, updated by the training runner whenever it
+writes or deletes a checkpoint, and :func:`get_checkpoint_path` resolves the checkpoints from it. The
+run directories are only listed again when the experiment directory changed since they were last
+listed, to index the runs missing from the index. It falls back to listing the checkpoint files when
+the index is missing or holds no matching checkpoint.
+
+The index of the experiments trained before it existed is built with:
+
+.. code-block:: bash
+
+    python scripts/rsl_rl/checkpoint_index.py logs/rsl_rl/<experiment>
+
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import fcntl
+import json
+import os
+import re
+
+# file of the index in the experiment directory
+INDEX_FILENAME = "checkpoints.json"
+# file holding the state of the experiment directory when the run directories were last listed
+SCAN_FILENAME = "checkpoints.json.scan"
+# checkpoint files written by the RSL-RL runners
+CHECKPOINT_PATTERN = re.compile(r"model_(\d+)\.pt$")
+
+
+class CheckpointIndex:
+    """Checkpoints of the runs of an experiment, with their iteration and mean reward.
+
+    Runs without checkpoints are indexed with no entries, so that the index lists all run directories.
+    Updates hold an exclusive lock on ``checkpoints.json.lock``, so that concurrent runs of the same
+    experiment do not lose each other's entries, and replace the index atomically, so that readers do
+    not need the lock.
+    """
+
+    def __init__(self, log_root_path: str):
+        """Initialize the index.
+
+        Args:
+            log_root_path: The experiment directory, holding one directory per run.
+        """
+        self.log_root_path = log_root_path
+        self.path = os.path.join(log_root_path, INDEX_FILENAME)
+        self.scan_path = os.path.join(log_root_path, SCAN_FILENAME)
+
+    def exists(self) -> bool:
+        """Whether the index file exists."""
+        return os.path.isfile(self.path)
+
+    def load(self) -> dict:
+        """Return the index, mapping the run names to their checkpoint files and the files to their entries."""
+        if not self.exists():
+            return {"runs": {}}
+        with open(self.path) as f:
+            return json.load(f)
+
+    def add(self, run_name: str, filename: str, iteration: int, mean_reward: float | None = None):
+        """Add a checkpoint to the index, replacing its previous entry.
+
+        Args:
+            run_name: The name of the run directory.
+            filename: The name of the checkpoint file in the run directory.
+            iteration: The training iteration of the checkpoint.
+            mean_reward: The mean episode reward when the checkpoint was saved. Defaults to None.
+        """
+        with self._update() as index:
+            checkpoints = index["runs"].setdefault(run_name, {})
+            checkpoints[filename] = {"iteration": iteration, "mean_reward": mean_reward}
+
+    def remove(self, run_name: str, filename: str):
+        """Remove a checkpoint from the index.
+
+        Args:
+            run_name: The name of the run directory.
+            filename: The name of the checkpoint file in the run directory.
+        """
+        with self._update() as index:
+            index["runs"].get(run_name, {}).pop(filename, None)
+
+    def add_run(self, run_name: str):
+        """Add the checkpoint files found in a run directory to the index.
+
+        Args:
+            run_name: The name of the run directory.
+        """
+        with self._update() as index:
+            self._add_scanned_run(index, run_name)
+
+    def add_missing_runs(self, run_dir: str = ".*") -> list[str]:
+        """Add the run directories missing from the index and return the matching runs.
+
+        Runs trained before the index existed, with another runner or on another machine are not in the
+        index. The run directories are only listed when the modification time or the link count of the
+        experiment directory changed since they were last listed, and only the directories missing from
+        the index are scanned for checkpoints. Runs whose directories were deleted are removed from the
+        index. The index is left unchanged if it cannot be written.
+
+        Args:
+            run_dir: The regular expression matching the name of the run directory.
+
+        Returns:
+            The names of the matching runs of the index, sorted by name.
+        """
+        state = self._directory_state()
+        if state != self._load_scan_state():
+            # the index is a cache, so a read-only experiment directory is not an error
+            with contextlib.suppress(OSError):
+                with self._update() as index:
+                    run_names = {entry.name for entry in os.scandir(self.log_root_path) if entry.is_dir()}
+                    for run_name in index["runs"].keys() - run_names:
+                        del index["runs"][run_name]
+                    for run_name in run_names - index["runs"].keys():
+                        self._add_scanned_run(index, run_name)
+                # the state read before listing, so that any later change lists the directories again
+                with open(self.scan_path, "w") as f:
+                    json.dump(state, f)
+        return sorted(run_name for run_name in self.load()["runs"] if re.match(run_dir, run_name))
+
+    def rebuild(self):
+        """Rebuild the index from the run directories of the experiment, keeping the entries of existing files."""
+        with self._update() as index:
+            runs = {}
+            for entry in os.scandir(self.log_root_path):
+                if not entry.is_dir():
+                    continue
+                checkpoints = self._scan_run(entry.name)
+                indexed = index["runs"].get(entry.name, {})
+                checkpoints.update({name: indexed[name] for name in checkpoints if name in indexed})
+                runs[entry.name] = checkpoints
+            index["runs"] = runs
+
+    def find(self, run_dir: str = ".*", checkpoint: str = ".*") -> str | None:
+        """Return the path of the last matching checkpoint of the last matching run in the index.
+
+        Runs and checkpoints are selected and sorted like in :func:`isaaclab_tasks.utils.get_checkpoint_path`,
+        except that runs without a matching checkpoint are skipped.
+
+        Args:
+            run_dir: The regular expression matching the name of the run directory.
+            checkpoint: The regular expression matching the name of the checkpoint file.
+
+        Returns:
+            The path of the checkpoint, or None if the index holds no matching checkpoint or the
+            checkpoint file no longer exists.
+        """
+        for run_name, checkpoints in sorted(self.load()["runs"].items(), reverse=True):
+            if not re.match(run_dir, run_name):
+                continue
+            filenames = [filename for filename in checkpoints if re.match(checkpoint, filename)]
+            if filenames:
+                filenames.sort(key=lambda filename: f"{filename:0>15}")
+                path = os.path.join(self.log_root_path, run_name, filenames[-1])
+                return path if os.path.isfile(path) else None
+        return None
+
+    def _add_scanned_run(self, index: dict, run_name: str):
+        """Add the checkpoint files found in a run directory to the loaded index."""
+        # the entries of the runner keep their mean reward
+        index["runs"][run_name] = {**self._scan_run(run_name), **index["runs"].get(run_name, {})}
+
+    def _scan_run(self, run_name: str) -> dict:
+        """Return the entries of the checkpoint files found in a run directory."""
+        checkpoints = {}
+        for filename in os.listdir(os.path.join(self.log_root_path, run_name)):
+            match = CHECKPOINT_PATTERN.match(filename)
+            if match is not None:
+                checkpoints[filename] = {"iteration": int(match.group(1)), "mean_reward": None}
+        return checkpoints
+
+    def _directory_state(self) -> list[int]:
+        """Return the modification time and the link count of the experiment directory.
+
+        The link count grows with the number of subdirectories on most file systems, which catches the
+        changes within the resolution of the modification time.
+        """
+        stat = os.stat(self.log_root_path)
+        return [stat.st_mtime_ns, stat.st_nlink]
+
+    def _load_scan_state(self) -> list[int] | None:
+        """Return the state of the experiment directory when the run directories were last listed."""
+        try:
+            with open(self.scan_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    @contextlib.contextmanager
+    def _update(self):
+        """Lock the index and yield it for modification, then write it atomically if it changed."""
+        os.makedirs(self.log_root_path, exist_ok=True)
+        with open(f"{self.path}.lock", "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                index = self.load()
+                loaded = json.dumps(index, sort_keys=True)
+                yield index
+                if json.dumps(index, sort_keys=True) == loaded and self.exists():
+                    return
+                tmp_path = f"{self.path}.{os.getpid()}.tmp"
+                with open(tmp_path, "w") as f:
+                    json.dump(index, f, indent=2)
+                os.replace(tmp_path, self.path)
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def get_checkpoint_path(log_path: str, run_dir: str = ".*", checkpoint: str = ".*") -> str:
+    """Return the path of a checkpoint of an experiment, resolved from its index when possible.
+
+    The arguments have the semantics of :func:`isaaclab_tasks.utils.get_checkpoint_path`. The run is the
+    last matching run directory, as with the scan, and the run directories missing from the index are
+    added to it first (see :meth:`CheckpointIndex.add_missing_runs`). The lookup falls back to
+    the scan when the index holds no matching checkpoint of the run, and the run found by the fallback
+    is then added to the index.
+
+    Args:
+        log_path: The experiment directory.
+        run_dir: The regular expression matching the name of the run directory. Defaults to ".*", the
+            latest run.
+        checkpoint: The regular expression matching the name of the checkpoint file. Defaults to ".*",
+            the latest checkpoint.
+
+    Returns:
+        The path of the checkpoint.
+    """
+    index = CheckpointIndex(log_path)
+    if index.exists():
+        run_names = index.add_missing_runs(run_dir)
+        if run_names:
+            path = index.find(f"{re.escape(run_names[-1])}$", checkpoint)
+            if path is not None:
+                return path
+
+    from isaaclab_tasks.utils import get_checkpoint_path as scan_checkpoint_path
+
+    path = scan_checkpoint_path(log_path, run_dir, checkpoint)
+    # the index is a cache, so a read-only experiment directory is not an error
+    with contextlib.suppress(OSError):
+        index.add_run(os.path.basename(os.path.dirname(path)))
+    return path
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rebuild the checkpoint index of experiments.")
+    parser.add_argument("log_root_paths", type=str, nargs="+", help="Experiment directories, e.g. logs/rsl_rl/<name>.")
+    args_cli = parser.parse_args()
+    for log_root_path in args_cli.log_root_paths:
+        index = CheckpointIndex(log_root_path)
+        index.rebuild()
+        num_checkpoints = sum(len(checkpoints) for checkpoints in index.load()["runs"].values())
+        print(f"[INFO] Indexed {num_checkpoints} checkpoint(s) in: {index.path}")
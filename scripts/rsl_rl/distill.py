@@ -0,0 +1,192 @@
+"""Script to distill a trained RSL-RL policy into a smaller student network.
+
+The teacher checkpoint is selected with the RSL-RL arguments, as in ``play.py``. The student is trained
+with :class:`distillation.DAggerDistillation` and written to ``distill/<date>`` in the run directory of
+the teacher, where it is exported to ``exported/<student>/policy.pt`` and ``policy.onnx``. The teacher
+and the student are then evaluated side by side, the teacher on the even and the student on the odd
+environments so that both run on all terrains, and their inference latency and evaluation metrics are
+compared in ``distillation_report.json``.
+
+.. code-block:: bash
+
+    python scripts/rsl_rl/distill.py --task Acc-QuietVelocity-Rough-Unitree-Go2-v0 --headless \\
+        --load_run <run> --student_hidden_dims 128 64 --max_iterations 300
+
+"""
+
+"""Launch Isaac Sim Simulator first."""
+
+import argparse
+
+from isaaclab.app import AppLauncher
+
+# local imports
+import cli_args  # isort: skip
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Distill an RL agent from RSL-RL into a smaller student network.")
+parser.add_argument("--num_envs", type=int, default=None, help="Number of environments to simulate.")
+parser.add_argument("--task", type=str, default=None, help="Name of the task.")
+parser.add_argument("--seed", type=int, default=None, help="Seed used for the environment")
+parser.add_argument("--max_iterations", type=int, default=300, help="Distillation iterations.")
+parser.add_argument(
+    "--student_hidden_dims", type=int, nargs="+", default=[128, 64], help="Sizes of the hidden layers of the student."
+)
+parser.add_argument("--student_activation", type=str, default="elu", help="Activation function of the student.")
+parser.add_argument("--learning_rate", type=float, default=1.0e-3, help="Learning rate of the student.")
+parser.add_argument(
+    "--buffer_size", type=int, default=2_000_000, help="Maximum number of samples of the aggregated dataset."
+)
+parser.add_argument(
+    "--beta_decay",
+    type=float,
+    default=0.9,
+    help="Decay per iteration of the probability of the environments to follow the teacher.",
+)
+parser.add_argument("--save_interval", type=int, default=50, help="Number of iterations between checkpoints.")
+parser.add_argument(
+    "--eval_steps", type=int, default=1000, help="Number of steps of the evaluation of the teacher and the student."
+)
+# append RSL-RL cli arguments
+cli_args.add_rsl_rl_args(parser)
+# append AppLauncher cli args
+AppLauncher.add_app_launcher_args(parser)
+args_cli = parser.parse_args()
+
+# launch omniverse app
+app_launcher = AppLauncher(args_cli)
+simulation_app = app_launcher.app
+
+"""Rest everything follows."""
+
+import gymnasium as gym
+import json
+import os
+import torch
+from datetime import datetime
+
+from rsl_rl.runners import OnPolicyRunner
+
+from isaaclab.envs import ManagerBasedRLEnv
+from isaaclab.managers import SceneEntityCfg
+from isaaclab.utils.dict import print_dict
+from isaaclab_rl.rsl_rl import RslRlOnPolicyRunnerCfg, RslRlVecEnvWrapper
+from isaaclab_tasks.utils import parse_env_cfg
+
+# Import extensions to set up environment tasks
+import accrobotics.tasks  # noqa: F401
+from accrobotics.deploy import TorchScriptRuntime, measure_latency, torch_num_threads
+
+from checkpoint_index import get_checkpoint_path  # isort: skip
+from distillation import DAggerDistillation, StudentPolicy, compare_evaluations  # isort: skip
+from evaluation import EvaluationMetrics  # isort: skip
+from exporter import JIT_FILENAME, export_dir, export_policy  # isort: skip
+from quantization import synthetic_observations  # isort: skip
+
+
+def main():
+    """Distill an RSL-RL agent."""
+    # parse configuration
+    env_cfg = parse_env_cfg(args_cli.task, device=args_cli.device, num_envs=args_cli.num_envs)
+    agent_cfg: RslRlOnPolicyRunnerCfg = cli_args.parse_rsl_rl_cfg(args_cli.task, args_cli)
+    env_cfg.seed = agent_cfg.seed
+
+    # select the teacher checkpoint
+    log_root_path = os.path.abspath(os.path.join("logs", "rsl_rl", agent_cfg.experiment_name))
+    teacher_path = get_checkpoint_path(log_root_path, agent_cfg.load_run, agent_cfg.load_checkpoint)
+    log_dir = os.path.join(os.path.dirname(teacher_path), "distill", datetime.now().strftime("%Y-%m-%d_%H-%M-%S"))
+    print(f"[INFO] Distilling the teacher checkpoint: {teacher_path}")
+    print(f"[INFO] Logging the student in directory: {log_dir}")
+
+    # create isaac environment
+    env = gym.make(args_cli.task, cfg=env_cfg)
+    if not isinstance(env.unwrapped, ManagerBasedRLEnv):
+        raise ValueError("Distillation is only supported for manager-based RL environments.")
+    # wrap around environment for rsl-rl
+    env = RslRlVecEnvWrapper(env)
+
+    # load the teacher
+    ppo_runner = OnPolicyRunner(env, agent_cfg.to_dict(), log_dir=None, device=agent_cfg.device)
+    ppo_runner.load(teacher_path)
+    try:
+        # Version 2.3 onwards
+        teacher = ppo_runner.alg.policy
+    except AttributeError:
+        # Version 2.2 and below
+        teacher = ppo_runner.alg.actor_critic
+    normalizer = ppo_runner.obs_normalizer
+
+    # distill the student
+    student = StudentPolicy(env.num_obs, env.num_actions, args_cli.student_hidden_dims, args_cli.student_activation)
+    student.to(env.unwrapped.device)
+    distillation = DAggerDistillation(
+        env,
+        teacher,
+        normalizer,
+        student,
+        num_steps_per_env=agent_cfg.num_steps_per_env,
+        learning_rate=args_cli.learning_rate,
+        buffer_size=args_cli.buffer_size,
+        beta_decay=args_cli.beta_decay,
+    )
+    os.makedirs(log_dir, exist_ok=True)
+    distillation.learn(args_cli.max_iterations, log_dir=log_dir, save_interval=args_cli.save_interval)
+    student_path = os.path.join(log_dir, f"student_{distillation.current_learning_iteration}.pt")
+
+    # export the teacher and the student with the same tooling
+    teacher_export_dir = export_dir(teacher_path)
+    student_export_dir = export_dir(student_path)
+    export_policy(teacher, normalizer, teacher_path, teacher_export_dir)
+    export_policy(student, normalizer, student_path, student_export_dir)
+    print(f"[INFO] Exported the student to: {student_export_dir}")
+
+    # evaluate the teacher on the even and the student on the odd environments
+    print(f"[INFO] Evaluating the teacher and the student for {args_cli.eval_steps} steps.")
+    foot_sensor_cfg = SceneEntityCfg("contact_forces", body_names=".*_foot")
+    foot_sensor_cfg.resolve(env.unwrapped.scene)
+    group_ids = torch.arange(env.num_envs, device=env.unwrapped.device) % 2
+    metrics = EvaluationMetrics(
+        env.unwrapped, foot_sensor_cfg, SceneEntityCfg("robot"), group_ids=group_ids, num_groups=2
+    )
+    use_student = group_ids.bool().unsqueeze(1)
+    student.eval()
+    obs, _ = env.get_observations()
+    with torch.inference_mode():
+        for _ in range(args_cli.eval_steps):
+            obs = normalizer(obs)
+            actions = torch.where(use_student, student(obs), teacher.act_inference(obs))
+            obs, rewards, dones, _ = env.step(actions)
+            metrics.update(rewards, dones)
+
+    # compare the inference latency of the exported policies on a single thread, as onboard
+    observations = synthetic_observations(env.num_obs, normalizer).numpy()
+    report = {"task": args_cli.task, "teacher_checkpoint": teacher_path, "student_checkpoint": student_path}
+    for name, policy, policy_dir, group in (
+        ("teacher", teacher.actor, teacher_export_dir, 0),
+        ("student", student.actor, student_export_dir, 1),
+    ):
+        with torch_num_threads(1):
+            latency = measure_latency(TorchScriptRuntime(os.path.join(policy_dir, JIT_FILENAME)), observations)
+        report[name] = {
+            "num_parameters": sum(param.numel() for param in policy.parameters()),
+            "latency_p50_us": latency["p50_us"],
+            "latency_p99_us": latency["p99_us"],
+            "evaluation": metrics.summary(group),
+        }
+    report["speedup_p50"] = report["teacher"]["latency_p50_us"] / report["student"]["latency_p50_us"]
+    report["speedup_p99"] = report["teacher"]["latency_p99_us"] / report["student"]["latency_p99_us"]
+    report["regression"] = compare_evaluations(report["teacher"]["evaluation"], report["student"]["evaluation"])
+    print_dict({key: report[key] for key in ("speedup_p50", "speedup_p99", "regression")}, nesting=4)
+    with open(os.path.join(log_dir, "distillation_report.json"), "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"[INFO] Saved the distillation report to: {os.path.join(log_dir, 'distillation_report.json')}")
+
+    # close the simulator
+    env.close()
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
+    # close sim app
+    simulation_app.close()
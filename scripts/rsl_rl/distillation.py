@@ -0,0 +1,266 @@
+"""Distillation of a trained policy into a smaller student network with DAgger.
+
+At every iteration, the environments are stepped for a few steps by a mixture of the teacher and the
+student: each environment follows the teacher with probability ``beta``, which decays over the
+iterations, and the student otherwise. The teacher labels all visited observations, which are added to
+an aggregated dataset on which the student is trained to regress the teacher actions. The student
+shares the frozen observation normalizer of the teacher, so it is exported with the same tooling.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import torch
+
+from rsl_rl.utils import resolve_nn_activation
+
+# evaluation metrics compared between the teacher and the student
+REGRESSION_KEYS = (
+    "episode_return_mean",
+    "lin_vel_tracking_error_mean",
+    "ang_vel_tracking_error_mean",
+    "landing_foot_speed_mean",
+    "landing_peak_force_mean",
+    "landing_impulse_mean",
+)
+
+
+class StudentPolicy(torch.nn.Module):
+    """MLP student, with the ``actor`` attribute expected by the exporters of Isaac Lab."""
+
+    is_recurrent = False
+
+    def __init__(self, num_obs: int, num_actions: int, hidden_dims: list[int], activation: str = "elu"):
+        """Build the network.
+
+        Args:
+            num_obs: The number of observations.
+            num_actions: The number of actions.
+            hidden_dims: The sizes of the hidden layers.
+            activation: The activation function of the hidden layers. Defaults to "elu".
+        """
+        super().__init__()
+        # sizes saved with the checkpoints to rebuild the network
+        self.cfg = {
+            "num_obs": num_obs,
+            "num_actions": num_actions,
+            "hidden_dims": list(hidden_dims),
+            "activation": activation,
+        }
+        layers = []
+        for in_dim, out_dim in zip([num_obs, *hidden_dims], hidden_dims):
+            layers += [torch.nn.Linear(in_dim, out_dim), resolve_nn_activation(activation)]
+        layers.append(torch.nn.Linear(hidden_dims[-1] if hidden_dims else num_obs, num_actions))
+        self.actor = torch.nn.Sequential(*layers)
+
+    def act_inference(self, obs: torch.Tensor) -> torch.Tensor:
+        return self.actor(obs)
+
+    def forward(self, obs: torch.Tensor) -> torch.Tensor:
+        return self.actor(obs)
+
+
+class DAggerDistillation:
+    """Trains a student policy on the observations visited by a mixture of the teacher and the student."""
+
+    def __init__(
+        self,
+        env,
+        teacher: torch.nn.Module,
+        normalizer: torch.nn.Module,
+        student: StudentPolicy,
+        num_steps_per_env: int = 24,
+        num_learning_epochs: int = 4,
+        num_mini_batches: int = 4,
+        learning_rate: float = 1.0e-3,
+        max_grad_norm: float = 1.0,
+        buffer_size: int = 1_000_000,
+        beta: float = 1.0,
+        beta_decay: float = 0.9,
+    ):
+        """Initialize the distillation.
+
+        Args:
+            env: The environment wrapped for RSL-RL.
+            teacher: The actor-critic module of the teacher, evaluated with ``act_inference``.
+            normalizer: The observation normalizer of the teacher, shared by the student.
+            student: The student policy, on the device of the environment.
+            num_steps_per_env: The number of steps per environment collected at every iteration. Defaults to 24.
+            num_learning_epochs: The number of passes over the dataset at every iteration. Defaults to 4.
+            num_mini_batches: The number of mini-batches per pass. Defaults to 4.
+            learning_rate: The learning rate of the student. Defaults to 1e-3.
+            max_grad_norm: The maximum norm of the student gradients. Defaults to 1.0.
+            buffer_size: The maximum number of samples of the aggregated dataset. The oldest samples are
+                replaced once it is full. Defaults to 1000000.
+            beta: The initial probability of an environment to follow the teacher. Defaults to 1.0.
+            beta_decay: The decay of the probability at every iteration. Defaults to 0.9.
+        """
+        self.env = env
+        self.device = env.device
+        self.teacher = teacher.eval()
+        self.normalizer = normalizer.eval()
+        self.student = student
+        self.num_steps_per_env = num_steps_per_env
+        self.num_learning_epochs = num_learning_epochs
+        self.num_mini_batches = num_mini_batches
+        self.max_grad_norm = max_grad_norm
+        self.beta = beta
+        self.beta_decay = beta_decay
+        self.optimizer = torch.optim.Adam(student.parameters(), lr=learning_rate)
+        self.current_learning_iteration = 0
+
+        # aggregated dataset of normalized observations and teacher actions
+        self._obs_buffer = torch.zeros(buffer_size, env.num_obs, device=self.device)
+        self._action_buffer = torch.zeros(buffer_size, env.num_actions, device=self.device)
+        self._num_samples = 0
+        self._buffer_index = 0
+        # returns of the running episodes and mean return of the last completed ones
+        self._episode_return = torch.zeros(env.num_envs, device=self.device)
+        self._mean_return = math.nan
+
+    def learn(self, num_learning_iterations: int, log_dir: str | None = None, save_interval: int = 50) -> dict:
+        """Alternate collection and training for a number of iterations.
+
+        Args:
+            num_learning_iterations: The number of iterations.
+            log_dir: The directory of the TensorBoard logs and of the ``student_<iteration>.pt`` checkpoints.
+                Defaults to None, in which case nothing is written.
+            save_interval: The number of iterations between checkpoints. Defaults to 50.
+
+        Returns:
+            The statistics of the last iteration.
+        """
+        writer = None
+        if log_dir is not None:
+            from torch.utils.tensorboard import SummaryWriter
+
+            writer = SummaryWriter(log_dir=log_dir, flush_secs=10)
+        stats = {}
+        start_iteration = self.current_learning_iteration
+        for it in range(start_iteration, start_iteration + num_learning_iterations):
+            stats = self.collect()
+            stats["loss"] = self.update()
+            stats["beta"] = self.beta
+            self.beta *= self.beta_decay
+            self.current_learning_iteration = it + 1
+            print(
+                f"[INFO] Iteration {it}: loss {stats['loss']:.5f}, action error {stats['action_error']:.4f},"
+                f" beta {stats['beta']:.3f}, mean return {stats['mean_return']:.2f}"
+            )
+            if writer is not None:
+                for name, value in stats.items():
+                    writer.add_scalar(f"Distillation/{name}", value, it)
+                if it % save_interval == 0:
+                    self.save(os.path.join(log_dir, f"student_{it}.pt"))
+        if log_dir is not None:
+            self.save(os.path.join(log_dir, f"student_{self.current_learning_iteration}.pt"))
+            writer.close()
+        return stats
+
+    def collect(self) -> dict[str, float]:
+        """Step the environments with the mixture of the teacher and the student and add the samples.
+
+        Returns:
+            The mean absolute difference of the student and teacher actions, the share of the
+            environments that followed the teacher and the mean return of the episodes completed during
+            the last collection that completed any, NaN before the first completed episode.
+        """
+        use_teacher = torch.rand(self.env.num_envs, 1, device=self.device) < self.beta
+        # accumulated on the device and read once, as in the evaluation metrics
+        action_error = torch.zeros((), device=self.device)
+        return_sum = torch.zeros((), device=self.device)
+        num_episodes = torch.zeros((), device=self.device)
+        obs, _ = self.env.get_observations()
+        self.student.eval()
+        with torch.inference_mode():
+            for _ in range(self.num_steps_per_env):
+                obs = self.normalizer(obs.to(self.device))
+                teacher_actions = self.teacher.act_inference(obs)
+                student_actions = self.student(obs)
+                action_error += torch.abs(student_actions - teacher_actions).mean()
+                self._add(obs, teacher_actions)
+                obs, rewards, dones, _ = self.env.step(torch.where(use_teacher, teacher_actions, student_actions))
+                # track the returns of the completed episodes
+                dones = dones.to(self.device) > 0
+                self._episode_return += rewards.to(self.device)
+                return_sum += (self._episode_return * dones).sum()
+                num_episodes += dones.sum()
+                self._episode_return.masked_fill_(dones, 0.0)
+        action_error, teacher_share, return_sum, num_episodes = torch.stack(
+            [action_error / self.num_steps_per_env, use_teacher.float().mean(), return_sum, num_episodes]
+        ).tolist()
+        if num_episodes > 0:
+            self._mean_return = return_sum / num_episodes
+        return {"action_error": action_error, "teacher_share": teacher_share, "mean_return": self._mean_return}
+
+    def update(self) -> float:
+        """Train the student on the aggregated dataset and return the mean loss."""
+        self.student.train()
+        batch_size = max(self._num_samples // self.num_mini_batches, 1)
+        total_loss, num_updates = 0.0, 0
+        for _ in range(self.num_learning_epochs):
+            indices = torch.randperm(self._num_samples, device=self.device)
+            for start in range(0, self._num_samples, batch_size):
+                batch = indices[start : start + batch_size]
+                loss = torch.nn.functional.mse_loss(self.student(self._obs_buffer[batch]), self._action_buffer[batch])
+                self.optimizer.zero_grad()
+                loss.backward()
+                torch.nn.utils.clip_grad_norm_(self.student.parameters(), self.max_grad_norm)
+                self.optimizer.step()
+                total_loss += loss.item()
+                num_updates += 1
+        return total_loss / max(num_updates, 1)
+
+    def save(self, path: str):
+        """Save the student, the observation normalizer and the network sizes.
+
+        Args:
+            path: The path to the checkpoint file.
+        """
+        torch.save(
+            {
+                "model_state_dict": self.student.state_dict(),
+                "obs_norm_state_dict": self.normalizer.state_dict(),
+                "optimizer_state_dict": self.optimizer.state_dict(),
+                "student_cfg": self.student.cfg,
+                "iter": self.current_learning_iteration,
+                "beta": self.beta,
+            },
+            path,
+        )
+
+    """
+    Helper functions.
+    """
+
+    def _add(self, obs: torch.Tensor, actions: torch.Tensor):
+        """Add samples to the dataset, replacing the oldest ones once it is full."""
+        capacity = len(self._obs_buffer)
+        indices = torch.arange(self._buffer_index, self._buffer_index + len(obs), device=self.device) % capacity
+        self._obs_buffer[indices] = obs
+        self._action_buffer[indices] = actions
+        self._buffer_index = (self._buffer_index + len(obs)) % capacity
+        self._num_samples = min(self._num_samples + len(obs), capacity)
+
+
+def compare_evaluations(teacher: dict, student: dict) -> dict[str, dict[str, float]]:
+    """Return the change of the tracking and quietness metrics from the teacher to the student.
+
+    Args:
+        teacher: The evaluation summary of the teacher.
+        student: The evaluation summary of the student.
+
+    Returns:
+        The teacher and student values, their difference and the relative difference of every metric.
+    """
+    comparison = {}
+    for key in REGRESSION_KEYS:
+        difference = student[key] - teacher[key]
+        comparison[key] = {
+            "teacher": teacher[key],
+            "student": student[key],
+            "difference": difference,
+            "relative_difference": difference / abs(teacher[key]) if teacher[key] != 0 else float("nan"),
+        }
+    return comparison
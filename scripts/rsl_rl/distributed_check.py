@@ -0,0 +1,145 @@
+"""Script to check distributed training of the runner on the CPU, without Isaac Sim.
+
+Every process trains the runner of :mod:`runners` on a mock environment with its own seed, using the
+``gloo`` backend. After training, the script checks that the policy parameters and the observation
+normalizers are identical in all processes and that only the process of rank 0 wrote checkpoints.
+
+.. code-block:: bash
+
+    torchrun --nnodes=1 --nproc_per_node=2 scripts/rsl_rl/distributed_check.py
+
+"""
+
+import argparse
+import os
+import tempfile
+import torch
+import torch.distributed as dist
+
+from runners import CheckpointingRunner
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Check distributed training of the runner on the CPU.")
+parser.add_argument("--num_envs", type=int, default=64, help="Number of environments per process.")
+parser.add_argument("--iterations", type=int, default=5, help="Number of training iterations.")
+parser.add_argument("--log_dir", type=str, default=None, help="Log directory. Defaults to a temporary directory.")
+args_cli = parser.parse_args()
+
+
+class MockVecEnv:
+    """Point masses steered to random targets, with the environment interface of RSL-RL."""
+
+    num_obs = 4
+    num_actions = 2
+    max_episode_length = 50
+
+    def __init__(self, num_envs: int, seed: int):
+        self.num_envs = num_envs
+        self.device = "cpu"
+        self.cfg = {}
+        self.generator = torch.Generator().manual_seed(seed)
+        self.position = torch.zeros(num_envs, 2)
+        self.target = torch.rand(num_envs, 2, generator=self.generator) * 4.0 - 2.0
+        self.episode_length_buf = torch.zeros(num_envs, dtype=torch.long)
+
+    @property
+    def unwrapped(self):
+        return self
+
+    def get_observations(self) -> tuple[torch.Tensor, dict]:
+        return torch.cat([self.position, self.target], dim=1), {"observations": {}}
+
+    def step(self, actions: torch.Tensor):
+        self.position += 0.1 * actions.clamp(-1.0, 1.0)
+        rewards = -torch.linalg.vector_norm(self.position - self.target, dim=1)
+        self.episode_length_buf += 1
+        dones = self.episode_length_buf >= self.max_episode_length
+        # reset the finished episodes with new targets
+        num_dones = int(dones.sum())
+        self.position[dones] = 0.0
+        self.target[dones] = torch.rand(num_dones, 2, generator=self.generator) * 4.0 - 2.0
+        self.episode_length_buf[dones] = 0
+        obs, extras = self.get_observations()
+        extras["time_outs"] = dones.clone()
+        return obs, rewards, dones.long(), extras
+
+    def reset(self):
+        return self.get_observations()
+
+
+def train_cfg() -> dict:
+    """Return a small PPO configuration with empirical normalization."""
+    return {
+        "num_steps_per_env": 16,
+        "save_interval": 2,
+        "empirical_normalization": True,
+        "seed": 42,
+        "logger": "tensorboard",
+        "policy": {
+            "class_name": "ActorCritic",
+            "actor_hidden_dims": [32, 32],
+            "critic_hidden_dims": [32, 32],
+            "activation": "elu",
+            "init_noise_std": 1.0,
+        },
+        "algorithm": {
+            "class_name": "PPO",
+            "num_learning_epochs": 2,
+            "num_mini_batches": 2,
+            "learning_rate": 1.0e-3,
+            "schedule": "adaptive",
+            "gamma": 0.99,
+            "lam": 0.95,
+            "entropy_coef": 0.01,
+            "desired_kl": 0.01,
+            "max_grad_norm": 1.0,
+            "value_loss_coef": 1.0,
+            "use_clipped_value_loss": True,
+            "clip_param": 0.2,
+        },
+    }
+
+
+def gather_state(runner: CheckpointingRunner) -> list[torch.Tensor]:
+    """Return the flattened policy parameters and normalizer statistics of every process."""
+    state = torch.cat([
+        *(param.detach().flatten() for param in runner.alg.policy.parameters()),
+        runner.obs_normalizer._mean.flatten(),
+        runner.obs_normalizer._var.flatten(),
+    ])
+    states = [torch.empty_like(state) for _ in range(dist.get_world_size())]
+    dist.all_gather(states, state)
+    return states
+
+
+def main():
+    """Train on every process and check that the processes stayed synchronized."""
+    if int(os.getenv("WORLD_SIZE", "1")) < 2:
+        raise RuntimeError("Launch the check with torchrun and at least two processes.")
+    rank = int(os.getenv("RANK", "0"))
+    torch.manual_seed(rank)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        log_dir = args_cli.log_dir or os.path.join(tmp_dir, f"run_{rank}")
+        runner = CheckpointingRunner(MockVecEnv(args_cli.num_envs, seed=rank), train_cfg(), log_dir=log_dir)
+        runner.learn(args_cli.iterations)
+
+        states = gather_state(runner)
+        max_difference = max((state - states[0]).abs().max().item() for state in states)
+        wrote_checkpoints = os.path.isdir(log_dir) and any(name.endswith(".pt") for name in os.listdir(log_dir))
+        flags = torch.tensor([int(wrote_checkpoints)])
+        all_flags = [torch.empty_like(flags) for _ in range(dist.get_world_size())]
+        dist.all_gather(all_flags, flags)
+
+    if rank == 0:
+        writers = [index for index, flag in enumerate(all_flags) if flag.item()]
+        print(f"[INFO] Max difference of the parameters and normalizers between processes: {max_difference:.3e}")
+        print(f"[INFO] Processes that wrote checkpoints: {writers}")
+        if max_difference > 0.0 or writers != [0]:
+            raise RuntimeError("The processes are not synchronized.")
+        print("[INFO] Distributed training check passed.")
+    dist.destroy_process_group()
+
+
+if __name__ == "__main__":
+    main()
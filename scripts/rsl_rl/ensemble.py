@@ -0,0 +1,79 @@
+"""Batched inference of several policies with the same network architecture.
+
+The parameters and buffers of the policies are stacked along a leading dimension with
+:func:`torch.func.stack_module_state` and the network is evaluated once with :func:`torch.vmap`, each
+policy on its own group of the observations. The environments are assigned to the policies in turn:
+environment ``i`` is driven by policy ``i % num_policies``. Since the terrain importer places the
+environments on the terrain by their index, contiguous slices would give every policy different
+terrains, while interleaved groups spread every policy over all of them.
+"""
+
+from __future__ import annotations
+
+import copy
+import torch
+
+
+class StackedPolicies:
+    """Evaluates several policies on interleaved groups of a batch of observations."""
+
+    def __init__(self, policies: list[torch.nn.Module]):
+        """Stack the policies.
+
+        Args:
+            policies: The policies, mapping observations to actions. They must have the same parameter
+                and buffer names and shapes, e.g. the normalizer and actor of checkpoints of one run.
+
+        Raises:
+            ValueError: If no policy is given or the policies have different architectures.
+        """
+        if not policies:
+            raise ValueError("Expected at least one policy.")
+        shapes = {name: tensor.shape for name, tensor in _named_tensors(policies[0])}
+        for index, policy in enumerate(policies[1:], start=1):
+            if {name: tensor.shape for name, tensor in _named_tensors(policy)} != shapes:
+                raise ValueError(f"Policy {index} does not have the architecture of policy 0.")
+        self.num_policies = len(policies)
+        policies = [policy.eval() for policy in policies]
+        params, buffers = torch.func.stack_module_state(policies)
+        self.params = {name: param.detach() for name, param in params.items()}
+        self.buffers = buffers
+        # stateless copy of the network, called with the stacked tensors
+        self._base = copy.deepcopy(policies[0]).to("meta")
+        self._forward = torch.vmap(self._call_policy)
+
+    def __call__(self, obs: torch.Tensor) -> torch.Tensor:
+        """Compute the actions of every environment with its policy.
+
+        Args:
+            obs: The observations. Shape is (num_envs, num_obs), with num_envs a multiple of the number
+                of policies.
+
+        Returns:
+            The actions. Shape is (num_envs, num_actions).
+        """
+        # environment i is row i // num_policies of group i % num_policies
+        obs = obs.view(-1, self.num_policies, obs.shape[-1]).transpose(0, 1)
+        actions = self._forward(self.params, self.buffers, obs)
+        return actions.transpose(0, 1).reshape(-1, actions.shape[-1])
+
+    def group_ids(self, num_envs: int, device: str | torch.device) -> torch.Tensor:
+        """Return the index of the policy driving every environment.
+
+        Args:
+            num_envs: The number of environments, a multiple of the number of policies.
+            device: The device of the returned tensor.
+
+        Returns:
+            The policy indices. Shape is (num_envs,).
+        """
+        return torch.arange(num_envs, device=device) % self.num_policies
+
+    def _call_policy(self, params: dict, buffers: dict, obs: torch.Tensor) -> torch.Tensor:
+        return torch.func.functional_call(self._base, (params, buffers), (obs,))
+
+
+def _named_tensors(module: torch.nn.Module):
+    """Iterate over the parameters and buffers of a module."""
+    yield from module.named_parameters()
+    yield from module.named_buffers()
@@ -0,0 +1,191 @@
+"""Script to evaluate several checkpoints of an RL agent from RSL-RL in a single simulation.
+
+The environments are assigned to the checkpoints in turn, environment ``i`` to checkpoint
+``i % num_checkpoints``, so that every checkpoint is evaluated on all terrains. The normalizers and
+actors of the checkpoints are stacked and evaluated in one batched call per step with
+:class:`ensemble.StackedPolicies`, so the simulator is started once for all checkpoints. The metrics of
+every checkpoint are saved to ``eval/<checkpoint>.json`` and ``.csv`` next to it, as with ``play.py``.
+
+.. code-block:: bash
+
+    # evaluate all checkpoints of a run until every checkpoint completed 200 episodes
+    python scripts/rsl_rl/evaluate.py --task Acc-QuietVelocity-Flat-Unitree-Go2-Play-v0 --headless \\
+        --checkpoints "logs/rsl_rl/<experiment>/<run>/model_*.pt" --num_envs 4000 --eval_episodes 200
+
+"""
+
+"""Launch Isaac Sim Simulator first."""
+
+import argparse
+import glob
+
+from isaaclab.app import AppLauncher
+
+# local imports
+import cli_args  # isort: skip
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Evaluate several checkpoints of an RL agent with RSL-RL.")
+parser.add_argument("--task", type=str, default=None, help="Name of the task.")
+parser.add_argument(
+    "--checkpoints",
+    type=str,
+    nargs="+",
+    default=None,
+    help="Checkpoint files or glob patterns to evaluate. Defaults to the checkpoint selected by the RSL-RL arguments.",
+)
+parser.add_argument(
+    "--num_envs",
+    type=int,
+    default=None,
+    help="Total number of environments, rounded up to a multiple of the number of checkpoints.",
+)
+parser.add_argument("--eval_steps", type=int, default=1000, help="Evaluate the checkpoints for this number of steps.")
+parser.add_argument(
+    "--eval_episodes",
+    type=int,
+    default=None,
+    help="Evaluate until every checkpoint completed this number of episodes, instead of a number of steps.",
+)
+parser.add_argument(
+    "--disable_fabric", action="store_true", default=False, help="Disable fabric and use USD I/O operations."
+)
+# append RSL-RL cli arguments
+cli_args.add_rsl_rl_args(parser)
+# append AppLauncher cli args
+AppLauncher.add_app_launcher_args(parser)
+args_cli = parser.parse_args()
+
+# launch omniverse app
+app_launcher = AppLauncher(args_cli)
+simulation_app = app_launcher.app
+
+"""Rest everything follows."""
+
+import copy
+import gymnasium as gym
+import math
+import os
+import torch
+from prettytable import PrettyTable
+
+from rsl_rl.runners import OnPolicyRunner
+
+from isaaclab.envs import ManagerBasedRLEnv
+from isaaclab.managers import SceneEntityCfg
+from isaaclab_rl.rsl_rl import RslRlOnPolicyRunnerCfg, RslRlVecEnvWrapper
+from isaaclab_tasks.utils import parse_env_cfg
+
+# Import extensions to set up environment tasks
+import accrobotics.tasks  # noqa: F401
+
+from checkpoint_index import get_checkpoint_path  # isort: skip
+from ensemble import StackedPolicies  # isort: skip
+from evaluation import EvaluationMetrics, save_summary  # isort: skip
+
+# number of steps between checks of the completed episodes, which synchronize with the device
+EVAL_EPISODES_CHECK_INTERVAL = 10
+# metrics printed for every checkpoint
+TABLE_KEYS = (
+    "episode_return_mean",
+    "lin_vel_tracking_error_mean",
+    "ang_vel_tracking_error_mean",
+    "landing_foot_speed_mean",
+    "landing_peak_force_mean",
+)
+
+
+def main():
+    """Evaluate checkpoints of an RSL-RL agent side by side."""
+    agent_cfg: RslRlOnPolicyRunnerCfg = cli_args.parse_rsl_rl_cfg(args_cli.task, args_cli)
+
+    # collect the checkpoints
+    if args_cli.checkpoints is None:
+        log_root_path = os.path.abspath(os.path.join("logs", "rsl_rl", agent_cfg.experiment_name))
+        checkpoint_paths = [get_checkpoint_path(log_root_path, agent_cfg.load_run, agent_cfg.load_checkpoint)]
+    else:
+        checkpoint_paths = []
+        for pattern in args_cli.checkpoints:
+            matches = sorted(glob.glob(pattern))
+            if not matches:
+                raise ValueError(f"No checkpoint matches: {pattern}")
+            checkpoint_paths.extend(os.path.abspath(path) for path in matches)
+    num_checkpoints = len(checkpoint_paths)
+
+    # parse configuration, with the same number of environments for every checkpoint
+    env_cfg = parse_env_cfg(
+        args_cli.task, device=args_cli.device, num_envs=args_cli.num_envs, use_fabric=not args_cli.disable_fabric
+    )
+    envs_per_checkpoint = math.ceil(env_cfg.scene.num_envs / num_checkpoints)
+    env_cfg.scene.num_envs = envs_per_checkpoint * num_checkpoints
+    print(f"[INFO] Evaluating {num_checkpoints} checkpoint(s) on {envs_per_checkpoint} environments each.")
+
+    # create isaac environment
+    env = gym.make(args_cli.task, cfg=env_cfg)
+    if not isinstance(env.unwrapped, ManagerBasedRLEnv):
+        raise ValueError("Evaluation is only supported for manager-based RL environments.")
+    # wrap around environment for rsl-rl
+    env = RslRlVecEnvWrapper(env)
+
+    # load every checkpoint into the same runner and keep a copy of its normalizer and actor
+    ppo_runner = OnPolicyRunner(env, agent_cfg.to_dict(), log_dir=None, device=agent_cfg.device)
+    try:
+        # Version 2.3 onwards
+        policy_nn = ppo_runner.alg.policy
+    except AttributeError:
+        # Version 2.2 and below
+        policy_nn = ppo_runner.alg.actor_critic
+    policies = []
+    for checkpoint_path in checkpoint_paths:
+        print(f"[INFO] Loading model checkpoint from: {checkpoint_path}")
+        ppo_runner.load(checkpoint_path)
+        policies.append(torch.nn.Sequential(copy.deepcopy(ppo_runner.obs_normalizer), copy.deepcopy(policy_nn.actor)))
+    policy = StackedPolicies(policies)
+
+    # accumulate the metrics of every checkpoint in its group of environments
+    foot_sensor_cfg = SceneEntityCfg("contact_forces", body_names=".*_foot")
+    foot_sensor_cfg.resolve(env.unwrapped.scene)
+    group_ids = policy.group_ids(env.num_envs, env.unwrapped.device)
+    metrics = EvaluationMetrics(
+        env.unwrapped, foot_sensor_cfg, SceneEntityCfg("robot"), group_ids=group_ids, num_groups=num_checkpoints
+    )
+
+    # simulate environment
+    obs, _ = env.get_observations()
+    timestep = 0
+    while simulation_app.is_running():
+        with torch.inference_mode():
+            obs, rewards, dones, _ = env.step(policy(obs))
+            metrics.update(rewards, dones)
+        timestep += 1
+        if args_cli.eval_episodes is None:
+            if timestep == args_cli.eval_steps:
+                break
+        elif timestep % EVAL_EPISODES_CHECK_INTERVAL == 0 and metrics.min_group_episodes >= args_cli.eval_episodes:
+            break
+
+    # save the summary of every checkpoint next to it
+    table = PrettyTable(["Checkpoint", "Episodes", *TABLE_KEYS])
+    table.align["Checkpoint"] = "l"
+    for group, checkpoint_path in enumerate(checkpoint_paths):
+        summary = metrics.summary(group)
+        eval_dir = os.path.join(os.path.dirname(checkpoint_path), "eval")
+        checkpoint_name = os.path.splitext(os.path.basename(checkpoint_path))[0]
+        save_summary(summary, eval_dir, checkpoint_name, {"task": args_cli.task, "checkpoint": checkpoint_path})
+        table.add_row([
+            os.path.relpath(checkpoint_path),
+            summary["num_episodes"],
+            *(f"{summary[key]:.4g}" for key in TABLE_KEYS),
+        ])
+    print(table)
+    print("[INFO] Saved the evaluation summaries to the 'eval' directories of the checkpoints.")
+
+    # close the simulator
+    env.close()
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
+    # close sim app
+    simulation_app.close()
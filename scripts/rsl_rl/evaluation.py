@@ -0,0 +1,228 @@
+"""Aggregate metrics of a policy evaluated on all environments in parallel.
+
+The metrics are accumulated on the environment's device at every step and only copied to the host
+when the summary is requested, so that evaluating does not add synchronizations to the stepping loop.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import math
+import os
+import torch
+from typing import TYPE_CHECKING
+
+from accrobotics.mdp import foot_features
+
+if TYPE_CHECKING:
+    from isaaclab.envs import ManagerBasedRLEnv
+    from isaaclab.managers import SceneEntityCfg
+
+
+class EvaluationMetrics:
+    """Accumulates episode returns, reward terms, landing impacts and velocity tracking errors.
+
+    Episode statistics are computed over the episodes completed during the evaluation. Landing foot
+    speeds, peak forces and impulses are averaged over all touchdowns and tracking errors over all
+    environment steps.
+
+    The environments can be partitioned into groups, e.g. with different reward parameters, in which
+    case the metrics are also accumulated per group.
+    """
+
+    def __init__(
+        self,
+        env: ManagerBasedRLEnv,
+        sensor_cfg: SceneEntityCfg,
+        asset_cfg: SceneEntityCfg,
+        command_name: str = "base_velocity",
+        group_ids: torch.Tensor | None = None,
+        num_groups: int = 1,
+    ):
+        """Initialize the metrics.
+
+        Args:
+            env: The environment instance.
+            sensor_cfg: The resolved contact sensor configuration, with the feet selected as bodies.
+            asset_cfg: The robot articulation configuration.
+            command_name: Name of the velocity command. Defaults to "base_velocity".
+            group_ids: Group index of every environment. Shape is (num_envs,). Defaults to None, in which
+                case all environments are in one group.
+            num_groups: Number of groups. Defaults to 1.
+        """
+        self.env = env
+        self.sensor_cfg = sensor_cfg
+        self.asset_cfg = asset_cfg
+        self.command_name = command_name
+        self.term_names = env.reward_manager.active_terms
+        self.num_groups = num_groups
+        self.num_steps = 0
+
+        num_envs, num_terms, device = env.num_envs, len(self.term_names), env.device
+        if group_ids is None:
+            group_ids = torch.zeros(num_envs, dtype=torch.long, device=device)
+        self.group_ids = group_ids
+        self._group_sizes = torch.bincount(group_ids, minlength=num_groups)
+        self.group_sizes = self._group_sizes.tolist()
+        # running episodes
+        self._episode_return = torch.zeros(num_envs, device=device)
+        self._episode_terms = torch.zeros(num_envs, num_terms, device=device)
+        self._episode_length = torch.zeros(num_envs, device=device)
+        # completed episodes and per-step metrics of every group
+        self._num_episodes = torch.zeros(num_groups, dtype=torch.long, device=device)
+        self._num_landings = torch.zeros(num_groups, dtype=torch.long, device=device)
+        self._sums = {
+            name: torch.zeros(num_groups, dtype=torch.float64, device=device)
+            for name in (
+                "return",
+                "return_sq",
+                "length",
+                "landing_speed",
+                "landing_peak_force",
+                "landing_impulse",
+                "lin_vel_error",
+                "ang_vel_error",
+            )
+        }
+        self._term_sums = torch.zeros(num_groups, num_terms, dtype=torch.float64, device=device)
+
+    def update(self, rewards: torch.Tensor, dones: torch.Tensor):
+        """Accumulate the metrics of one environment step.
+
+        Args:
+            rewards: The rewards returned by the environment step. Shape is (num_envs,).
+            dones: The episode terminations and time-outs of the step. Shape is (num_envs,).
+        """
+        self.num_steps += 1
+        dones = dones.bool()
+
+        # episode returns and reward terms, which the reward manager stores unscaled by the step duration
+        self._episode_return += rewards
+        self._episode_terms.add_(self.env.reward_manager._step_reward, alpha=self.env.step_dt)
+        self._episode_length += 1
+        self._num_episodes.index_add_(0, self.group_ids, dones.long())
+        self._add("return", self._episode_return * dones)
+        self._add("return_sq", self._episode_return.square() * dones)
+        self._add("length", self._episode_length * dones)
+        self._term_sums.index_add_(0, self.group_ids, (self._episode_terms * dones.unsqueeze(1)).double())
+        self._episode_return.masked_fill_(dones, 0.0)
+        self._episode_terms.masked_fill_(dones.unsqueeze(1), 0.0)
+        self._episode_length.masked_fill_(dones, 0.0)
+
+        # foot speeds and impacts at touchdown, the impacts being zero for the other feet
+        features = foot_features(self.env, self.sensor_cfg)
+        first_contact = features.first_contact
+        self._num_landings.index_add_(0, self.group_ids, first_contact.sum(dim=1))
+        self._add("landing_speed", (features.foot_speeds(self.asset_cfg) * first_contact).sum(dim=1))
+        self._add("landing_peak_force", features.landing_peak_force.sum(dim=1))
+        self._add("landing_impulse", features.landing_impulse.sum(dim=1))
+
+        # velocity tracking errors
+        command = self.env.command_manager.get_command(self.command_name)
+        robot = self.env.scene[self.asset_cfg.name]
+        self._add("lin_vel_error", torch.linalg.vector_norm(command[:, :2] - robot.data.root_lin_vel_b[:, :2], dim=1))
+        self._add("ang_vel_error", torch.abs(command[:, 2] - robot.data.root_ang_vel_b[:, 2]))
+
+    @property
+    def num_episodes(self) -> int:
+        """Number of completed episodes. Reading it synchronizes with the device."""
+        return int(self._num_episodes.sum().item())
+
+    @property
+    def min_group_episodes(self) -> int:
+        """Number of completed episodes of the group with the fewest. Reading it synchronizes with the device."""
+        return int(self._num_episodes.min().item())
+
+    def group_means(self) -> dict[str, torch.Tensor]:
+        """Return the mean episode return and length, landing metrics and tracking errors of every group.
+
+        The means are computed on the device without synchronization and are zero for groups without
+        completed episodes or landings. Each value has shape (num_groups,).
+        """
+        num_episodes = self._num_episodes.clamp(min=1)
+        num_landings = self._num_landings.clamp(min=1)
+        num_samples = max(self.num_steps, 1) * self._group_sizes.clamp(min=1)
+        return {
+            "episode_return": (self._sums["return"] / num_episodes).float(),
+            "episode_length_s": (self._sums["length"] / num_episodes * self.env.step_dt).float(),
+            "landing_foot_speed": (self._sums["landing_speed"] / num_landings).float(),
+            "landing_peak_force": (self._sums["landing_peak_force"] / num_landings).float(),
+            "landing_impulse": (self._sums["landing_impulse"] / num_landings).float(),
+            "lin_vel_tracking_error": (self._sums["lin_vel_error"] / num_samples).float(),
+            "ang_vel_tracking_error": (self._sums["ang_vel_error"] / num_samples).float(),
+        }
+
+    def reset(self):
+        """Discard the accumulated metrics. Running episodes continue to be tracked."""
+        self.num_steps = 0
+        self._num_episodes.zero_()
+        self._num_landings.zero_()
+        for value in self._sums.values():
+            value.zero_()
+        self._term_sums.zero_()
+
+    def summary(self, group: int | None = None) -> dict[str, float | int]:
+        """Return the aggregate metrics.
+
+        Episode statistics are NaN when no episode was completed.
+
+        Args:
+            group: The group whose metrics are returned. Defaults to None, in which case the metrics of
+                all environments are returned.
+        """
+        groups = slice(None) if group is None else slice(group, group + 1)
+        num_envs = sum(self.group_sizes[groups])
+        num_episodes = int(self._num_episodes[groups].sum().item())
+        num_landings = int(self._num_landings[groups].sum().item())
+        sums = {name: value[groups].sum().item() for name, value in self._sums.items()}
+        num_samples = self.num_steps * num_envs
+        summary = {"num_envs": num_envs, "num_steps": self.num_steps, "num_episodes": num_episodes}
+        if num_episodes > 0:
+            return_mean = sums["return"] / num_episodes
+            return_var = max(sums["return_sq"] / num_episodes - return_mean**2, 0.0)
+            summary["episode_return_mean"] = return_mean
+            summary["episode_return_std"] = math.sqrt(return_var)
+            summary["episode_length_mean_s"] = sums["length"] / num_episodes * self.env.step_dt
+            term_means = (self._term_sums[groups].sum(dim=0) / num_episodes).tolist()
+        else:
+            summary["episode_return_mean"] = summary["episode_return_std"] = math.nan
+            summary["episode_length_mean_s"] = math.nan
+            term_means = [math.nan] * len(self.term_names)
+        for name, value in zip(self.term_names, term_means):
+            summary[f"reward/{name}"] = value
+        summary["num_landings"] = num_landings
+        landing_metrics = {
+            "landing_foot_speed_mean": "landing_speed",
+            "landing_peak_force_mean": "landing_peak_force",
+            "landing_impulse_mean": "landing_impulse",
+        }
+        for key, name in landing_metrics.items():
+            summary[key] = sums[name] / num_landings if num_landings > 0 else math.nan
+        summary["lin_vel_tracking_error_mean"] = sums["lin_vel_error"] / max(num_samples, 1)
+        summary["ang_vel_tracking_error_mean"] = sums["ang_vel_error"] / max(num_samples, 1)
+        return summary
+
+    def _add(self, name: str, values: torch.Tensor):
+        """Add per-environment values to the sums of their groups."""
+        self._sums[name].index_add_(0, self.group_ids, values.double())
+
+
+def save_summary(summary: dict, directory: str, filename: str, attributes: dict | None = None):
+    """Save an evaluation summary as ``<filename>.json`` and as a single-row ``<filename>.csv``.
+
+    Args:
+        summary: The summary returned by :meth:`EvaluationMetrics.summary`.
+        directory: The directory in which the files are written.
+        filename: The name of the files, without extension.
+        attributes: Additional information, such as the task and checkpoint, written before the metrics.
+            Defaults to None.
+    """
+    row = {**(attributes or {}), **summary}
+    os.makedirs(directory, exist_ok=True)
+    with open(os.path.join(directory, f"{filename}.json"), "w") as f:
+        json.dump(row, f, indent=2)
+    with open(os.path.join(directory, f"{filename}.csv"), "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(row))
+        writer.writeheader()
+        writer.writerow(row)
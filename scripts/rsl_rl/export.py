@@ -0,0 +1,147 @@
+"""Script to export checkpoints of an RL agent from RSL-RL to TorchScript and ONNX without playing them.
+
+The policy network is built once on a single headless environment and every checkpoint is loaded into
+it and exported to ``exported/<checkpoint>`` next to the checkpoint, as in ``play.py``. Checkpoints
+whose exported files are up to date are skipped.
+
+.. code-block:: bash
+
+    # export all checkpoints of a run
+    python scripts/rsl_rl/export.py --task Acc-QuietVelocity-Flat-Unitree-Go2-Play-v0 \\
+        --checkpoints "logs/rsl_rl/<experiment>/<run>/model_*.pt"
+
+    # also export int8 and fp16 policies, compared over the observations of a recording
+    python scripts/rsl_rl/export.py --task Acc-QuietVelocity-Flat-Unitree-Go2-Play-v0 --quantize \\
+        --quantize_observations logs/rsl_rl/<experiment>/<run>/recordings/<date>
+
+"""
+
+"""Launch Isaac Sim Simulator first."""
+
+import argparse
+import glob
+
+from isaaclab.app import AppLauncher
+
+# local imports
+import cli_args  # isort: skip
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Export checkpoints of an RL agent with RSL-RL.")
+parser.add_argument("--task", type=str, default=None, help="Name of the task.")
+parser.add_argument(
+    "--checkpoints",
+    type=str,
+    nargs="+",
+    default=None,
+    help="Checkpoint files or glob patterns to export. Defaults to the checkpoint selected by the RSL-RL arguments.",
+)
+parser.add_argument(
+    "--force", action="store_true", default=False, help="Export even when the exported files are up to date."
+)
+parser.add_argument(
+    "--quantize", action="store_true", default=False, help="Also export int8 and fp16 policies with a report."
+)
+parser.add_argument(
+    "--quantize_observations",
+    type=str,
+    default=None,
+    help="Recording whose observations are used for the quantization report. Defaults to synthetic observations.",
+)
+# append RSL-RL cli arguments
+cli_args.add_rsl_rl_args(parser)
+# append AppLauncher cli args
+AppLauncher.add_app_launcher_args(parser)
+args_cli = parser.parse_args()
+# the environment is only needed to build the policy network
+args_cli.headless = True
+
+# launch omniverse app
+app_launcher = AppLauncher(args_cli)
+simulation_app = app_launcher.app
+
+"""Rest everything follows."""
+
+import gymnasium as gym
+import os
+
+from rsl_rl.runners import OnPolicyRunner
+
+from isaaclab.envs import DirectMARLEnv, multi_agent_to_single_agent
+from isaaclab_rl.rsl_rl import RslRlOnPolicyRunnerCfg, RslRlVecEnvWrapper
+from isaaclab_tasks.utils import parse_env_cfg
+
+# Import extensions to set up environment tasks
+import accrobotics.tasks  # noqa: F401
+
+from checkpoint_index import get_checkpoint_path  # isort: skip
+from exporter import export_dir, export_policy  # isort: skip
+from quantization import recorded_observations  # isort: skip
+
+
+def main():
+    """Export checkpoints of an RSL-RL agent."""
+    # parse configuration
+    env_cfg = parse_env_cfg(args_cli.task, device=args_cli.device, num_envs=1)
+    agent_cfg: RslRlOnPolicyRunnerCfg = cli_args.parse_rsl_rl_cfg(args_cli.task, args_cli)
+
+    # collect the checkpoints
+    if args_cli.checkpoints is None:
+        log_root_path = os.path.abspath(os.path.join("logs", "rsl_rl", agent_cfg.experiment_name))
+        checkpoint_paths = [get_checkpoint_path(log_root_path, agent_cfg.load_run, agent_cfg.load_checkpoint)]
+    else:
+        checkpoint_paths = []
+        for pattern in args_cli.checkpoints:
+            matches = sorted(glob.glob(pattern))
+            if not matches:
+                raise ValueError(f"No checkpoint matches: {pattern}")
+            checkpoint_paths.extend(os.path.abspath(path) for path in matches)
+    print(f"[INFO] Exporting {len(checkpoint_paths)} checkpoint(s).")
+
+    # create isaac environment with a single instance
+    env = gym.make(args_cli.task, cfg=env_cfg)
+    # convert to single-agent instance if required by the RL algorithm
+    if isinstance(env.unwrapped, DirectMARLEnv):
+        env = multi_agent_to_single_agent(env)
+    # wrap around environment for rsl-rl
+    env = RslRlVecEnvWrapper(env)
+
+    # create the runner once, the checkpoints are loaded into the same networks
+    ppo_runner = OnPolicyRunner(env, agent_cfg.to_dict(), log_dir=None, device=agent_cfg.device)
+    try:
+        # Version 2.3 onwards
+        policy_nn = ppo_runner.alg.policy
+    except AttributeError:
+        # Version 2.2 and below
+        policy_nn = ppo_runner.alg.actor_critic
+
+    # observations over which the quantized policies are compared
+    observations = None
+    if args_cli.quantize_observations is not None:
+        observations = recorded_observations(args_cli.quantize_observations)
+
+    for checkpoint_path in checkpoint_paths:
+        ppo_runner.load(checkpoint_path)
+        export_model_dir = export_dir(checkpoint_path)
+        if export_policy(
+            policy_nn,
+            ppo_runner.obs_normalizer,
+            checkpoint_path,
+            export_model_dir,
+            args_cli.force,
+            quantize=args_cli.quantize,
+            observations=observations,
+        ):
+            print(f"[INFO] Exported {checkpoint_path} to: {export_model_dir}")
+        else:
+            print(f"[INFO] Skipped {checkpoint_path}, exported policy is up to date: {export_model_dir}")
+
+    # close the simulator
+    env.close()
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
+    # close sim app
+    simulation_app.close()
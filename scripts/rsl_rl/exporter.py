@@ -0,0 +1,127 @@
+"""Export of policies to TorchScript and ONNX, skipped when the exported files are up to date.
+
+Every checkpoint is exported to ``exported/<checkpoint>`` next to it, see :func:`export_dir`. The
+exported files are tagged with a content hash of the checkpoint, of the observation normalizer state and
+of the export options. Exporting again is skipped when the hash stored next to the exported files matches.
+
+With quantization, the int8 and fp16 policies of :mod:`quantization` and their report are exported
+with the fp32 policies.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import torch
+
+from isaaclab_rl.rsl_rl import export_policy_as_jit, export_policy_as_onnx
+
+from quantization import (  # isort: skip
+    FP16_FILENAME,
+    INT8_FILENAME,
+    REPORT_FILENAME,
+    export_reduced_precision_policies,
+    quantization_report,
+    synthetic_observations,
+)
+
+# file storing the hash of the exported checkpoint
+HASH_FILENAME = "policy.sha256"
+# exported policy files
+JIT_FILENAME = "policy.pt"
+ONNX_FILENAME = "policy.onnx"
+# opset of the ONNX files written by :func:`isaaclab_rl.rsl_rl.export_policy_as_onnx`
+ONNX_OPSET_VERSION = 11
+
+
+def export_dir(checkpoint_path: str) -> str:
+    """Return the directory in which a checkpoint is exported, ``exported/<checkpoint>`` next to it.
+
+    Args:
+        checkpoint_path: Path to the checkpoint file.
+    """
+    checkpoint_name = os.path.splitext(os.path.basename(checkpoint_path))[0]
+    return os.path.join(os.path.dirname(checkpoint_path), "exported", checkpoint_name)
+
+
+def policy_export_hash(checkpoint_path: str, normalizer: torch.nn.Module | None, quantize: bool = False) -> str:
+    """Return the content hash of a checkpoint, of the observation normalizer and of the export options.
+
+    Args:
+        checkpoint_path: Path to the checkpoint file.
+        normalizer: The observation normalizer exported with the policy. Defaults to None.
+        quantize: Whether the int8 and fp16 policies are exported. Defaults to False.
+
+    Returns:
+        The hexadecimal SHA-256 digest.
+    """
+    digest = hashlib.sha256()
+    with open(checkpoint_path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    if normalizer is not None:
+        digest.update(type(normalizer).__name__.encode())
+        for name, tensor in normalizer.state_dict().items():
+            digest.update(name.encode())
+            digest.update(tensor.detach().cpu().contiguous().numpy().tobytes())
+    # exports with other options are not up to date
+    digest.update(f"quantize={quantize};onnx_opset={ONNX_OPSET_VERSION}".encode())
+    return digest.hexdigest()
+
+
+def export_policy(
+    policy: torch.nn.Module,
+    normalizer: torch.nn.Module | None,
+    checkpoint_path: str,
+    path: str,
+    force: bool = False,
+    quantize: bool = False,
+    observations: torch.Tensor | None = None,
+) -> bool:
+    """Export a policy as ``policy.pt`` and ``policy.onnx`` unless the exported files are up to date.
+
+    With quantization, the actor is also exported as ``policy_int8.pt`` and ``policy_fp16.pt`` and the
+    reduced-precision policies are compared with ``policy.pt`` in ``quantization_report.json``. Without
+    quantization, the reduced-precision files of a previous export are removed.
+
+    Args:
+        policy: The actor-critic module of the runner.
+        normalizer: The observation normalizer of the runner. Defaults to None.
+        checkpoint_path: Path to the checkpoint loaded into the policy.
+        path: The directory in which the files are exported, usually :func:`export_dir` of the checkpoint.
+        force: Whether to export even when the exported files are up to date. Defaults to False.
+        quantize: Whether to also export the int8 and fp16 policies. Defaults to False.
+        observations: The raw observations over which the quantized policies are compared. Shape is
+            (num_samples, num_obs). Defaults to None, in which case observations are drawn from the
+            statistics of the normalizer.
+
+    Returns:
+        True if the policy was exported, False if the export was skipped.
+    """
+    export_hash = policy_export_hash(checkpoint_path, normalizer, quantize)
+    hash_path = os.path.join(path, HASH_FILENAME)
+    filenames = [JIT_FILENAME, ONNX_FILENAME, HASH_FILENAME]
+    if quantize:
+        filenames += [INT8_FILENAME, FP16_FILENAME, REPORT_FILENAME]
+    exported = all(os.path.isfile(os.path.join(path, name)) for name in filenames)
+    if exported and not force:
+        with open(hash_path) as f:
+            if f.read().strip() == export_hash:
+                return False
+    # remove the stale hash first, so that an interrupted export is not mistaken as up to date
+    if os.path.isfile(hash_path):
+        os.remove(hash_path)
+    if not quantize:
+        for name in (INT8_FILENAME, FP16_FILENAME, REPORT_FILENAME):
+            if os.path.isfile(os.path.join(path, name)):
+                os.remove(os.path.join(path, name))
+    export_policy_as_jit(policy, normalizer, path=path, filename=JIT_FILENAME)
+    export_policy_as_onnx(policy, normalizer=normalizer, path=path, filename=ONNX_FILENAME)
+    if quantize:
+        export_reduced_precision_policies(policy.actor, normalizer, path)
+        if observations is None:
+            observations = synthetic_observations(policy.actor[0].in_features, normalizer)
+        quantization_report(path, observations)
+    with open(hash_path, "w") as f:
+        f.write(export_hash + "\n")
+    return True
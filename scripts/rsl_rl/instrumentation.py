@@ -0,0 +1,119 @@
+"""Breakdown of the time of every training iteration.
+
+The instrumentation wraps the environment step, the reward computation, the policy inference, the PPO
+update and the checkpoint saving of an RSL-RL runner, and times them with the latency recorders of
+:mod:`accrobotics.mdp.profiling`: CUDA events when training on a CUDA device and the host clock
+otherwise. At every logged iteration, the time spent in each section and the throughput are written to
+the logger of the runner as ``Perf/<section>_time`` and appended to ``instrumentation.csv`` in the log
+directory.
+
+The reward computation is part of the environment step. Checkpoints are saved after the iteration is
+logged, so their time is reported with the next iteration.
+"""
+
+from __future__ import annotations
+
+import csv
+import functools
+import os
+import torch
+
+from accrobotics.mdp import LatencyRecorder
+
+
+class TrainingInstrumentation:
+    """Times the sections of the training iterations of an on-policy runner."""
+
+    SECTIONS = ("env_step", "reward_compute", "policy_inference", "ppo_update", "checkpoint")
+    """Timed sections of a training iteration."""
+
+    def __init__(self, runner, log_dir: str, filename: str = "instrumentation.csv"):
+        """Wrap the methods of the runner, its algorithm and its environment.
+
+        Args:
+            runner: The on-policy runner, created with the environment wrapped for RSL-RL.
+            log_dir: The directory in which the CSV file is written.
+            filename: The name of the CSV file. Defaults to "instrumentation.csv".
+        """
+        use_cuda_events = torch.device(runner.device).type == "cuda"
+        self.recorders = {name: LatencyRecorder(use_cuda_events=use_cuda_events) for name in self.SECTIONS}
+        self.path = os.path.join(log_dir, filename)
+        self._runner = runner
+        self._logged_us = dict.fromkeys(self.SECTIONS, 0.0)
+        self._file = None
+        self._writer = None
+
+        self._wrap(runner.env, "step", "env_step")
+        reward_manager = getattr(runner.env.unwrapped, "reward_manager", None)
+        if reward_manager is not None:
+            self._wrap(reward_manager, "compute", "reward_compute")
+        self._wrap(runner.alg, "act", "policy_inference")
+        self._wrap(runner.alg, "update", "ppo_update")
+        self._wrap(runner, "save", "checkpoint")
+        # the runner logs every iteration with its collection and learning times
+        log = runner.log
+
+        @functools.wraps(log)
+        def log_iteration(locs: dict, *args, **kwargs):
+            log(locs, *args, **kwargs)
+            self._log_iteration(locs)
+
+        runner.log = log_iteration
+
+    def close(self):
+        """Close the CSV file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def summary(self) -> dict[str, dict]:
+        """Return the latency statistics of every section over the whole training."""
+        return {name: recorder.summary() for name, recorder in self.recorders.items()}
+
+    """
+    Helper functions.
+    """
+
+    def _wrap(self, obj, name: str, section: str):
+        """Replace a method of an object by a timed one, as an instance attribute."""
+        method = getattr(obj, name)
+        recorder = self.recorders[section]
+
+        @functools.wraps(method)
+        def timed(*args, **kwargs):
+            token = recorder.start()
+            value = method(*args, **kwargs)
+            recorder.stop(token)
+            return value
+
+        setattr(obj, name, timed)
+
+    def _log_iteration(self, locs: dict):
+        """Write the times of the sections since the previous logged iteration."""
+        iteration = locs["it"]
+        iteration_time = locs["collection_time"] + locs["learn_time"]
+        num_env_steps = self._runner.num_steps_per_env * self._runner.env.num_envs
+        row = {
+            "iteration": iteration,
+            "iteration_time_s": iteration_time,
+            "env_steps_per_s": num_env_steps / iteration_time if iteration_time > 0 else 0.0,
+        }
+        for name, recorder in self.recorders.items():
+            # the learning step has synchronized with the device, so the events have completed
+            recorder.wait()
+            row[f"{name}_time_s"] = (recorder.total_us - self._logged_us[name]) / 1e6
+            self._logged_us[name] = recorder.total_us
+
+        writer = getattr(self._runner, "writer", None)
+        if writer is not None:
+            writer.add_scalar("Perf/env_steps_per_s", row["env_steps_per_s"], iteration)
+            for name in self.SECTIONS:
+                writer.add_scalar(f"Perf/{name}_time", row[f"{name}_time_s"], iteration)
+
+        if self._file is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._file = open(self.path, "w", newline="")
+            self._writer = csv.DictWriter(self._file, fieldnames=list(row))
+            self._writer.writeheader()
+        self._writer.writerow(row)
+        self._file.flush()
@@ -13,6 +13,26 @@ import cli_args  # isort: skip
 parser = argparse.ArgumentParser(description="Train an RL agent with RSL-RL.")
 parser.add_argument("--video", action="store_true", default=False, help="Record videos during training.")
 parser.add_argument("--video_length", type=int, default=200, help="Length of the recorded video (in steps).")
+parser.add_argument(
+    "--video_stride", type=int, default=1, help="Number of steps between the recorded frames of the videos."
+)
+parser.add_argument(
+    "--record", action="store_true", default=False, help="Record observations, actions, foot states and rewards."
+)
+parser.add_argument("--record_length", type=int, default=1000, help="Length of the recording (in steps).")
+parser.add_argument("--record_chunk_size", type=int, default=500, help="Number of steps per recording chunk file.")
+parser.add_argument(
+    "--eval_steps", type=int, default=None, help="Evaluate the policy for this number of steps and save the metrics."
+)
+parser.add_argument(
+    "--eval_episodes",
+    type=int,
+    default=None,
+    help="Evaluate the policy until this number of episodes is completed and save the metrics.",
+)
+parser.add_argument(
+    "--quantize", action="store_true", default=False, help="Also export int8 and fp16 policies with a report."
+)
 parser.add_argument(
     "--disable_fabric", action="store_true", default=False, help="Disable fabric and use USD I/O operations."
 )
@@ -36,16 +56,28 @@ simulation_app = app_launcher.app
 import gymnasium as gym
 import os
 import torch
+from datetime import datetime
 
 from rsl_rl.runners import OnPolicyRunner
 
-from isaaclab.envs import DirectMARLEnv, multi_agent_to_single_agent
+from isaaclab.envs import DirectMARLEnv, ManagerBasedRLEnv, multi_agent_to_single_agent
+from isaaclab.managers import SceneEntityCfg
 from isaaclab.utils.dict import print_dict
-from isaaclab_rl.rsl_rl import RslRlOnPolicyRunnerCfg, RslRlVecEnvWrapper, export_policy_as_jit, export_policy_as_onnx
-from isaaclab_tasks.utils import get_checkpoint_path, parse_env_cfg
+from isaaclab_rl.rsl_rl import RslRlOnPolicyRunnerCfg, RslRlVecEnvWrapper
+from isaaclab_tasks.utils import parse_env_cfg
 
 # Import extensions to set up environment tasks
 import accrobotics.tasks  # noqa: F401
+from accrobotics.mdp import foot_features
+
+from checkpoint_index import get_checkpoint_path  # isort: skip
+from evaluation import EvaluationMetrics, save_summary  # isort: skip
+from exporter import export_dir, export_policy  # isort: skip
+from recorder import RolloutRecorder  # isort: skip
+from video import AsyncRecordVideo  # isort: skip
+
+# number of steps between checks of the completed episodes, which synchronize with the device
+EVAL_EPISODES_CHECK_INTERVAL = 10
 
 
 def main():
@@ -71,11 +103,12 @@ def main():
             "video_folder": os.path.join(log_dir, "videos", "play"),
             "step_trigger": lambda step: step == 0,
             "video_length": args_cli.video_length,
+            "frame_stride": args_cli.video_stride,
             "disable_logger": True,
         }
         print("[INFO] Recording videos during training.")
         print_dict(video_kwargs, nesting=4)
-        env = gym.wrappers.RecordVideo(env, **video_kwargs)
+        env = AsyncRecordVideo(env, **video_kwargs)
 
     # convert to single-agent instance if required by the RL algorithm
     if isinstance(env.unwrapped, DirectMARLEnv):
@@ -93,20 +126,44 @@ def main():
     policy = ppo_runner.get_inference_policy(device=env.unwrapped.device)
 
     # export policy to onnx/jit
-    export_model_dir = os.path.join(os.path.dirname(resume_path), "exported")
+    export_model_dir = export_dir(resume_path)
     try:
         # Version 2.3 onwards
         policy_nn = ppo_runner.alg.policy
     except AttributeError:
         # Version 2.2 and below
         policy_nn = ppo_runner.alg.actor_critic
-    
-    export_policy_as_jit(
-        policy_nn, ppo_runner.obs_normalizer, path=export_model_dir, filename="policy.pt"
-    )
-    export_policy_as_onnx(
-        policy_nn, normalizer=ppo_runner.obs_normalizer, path=export_model_dir, filename="policy.onnx"
-    )
+
+    if export_policy(policy_nn, ppo_runner.obs_normalizer, resume_path, export_model_dir, quantize=args_cli.quantize):
+        print(f"[INFO] Exported policy to: {export_model_dir}")
+    else:
+        print(f"[INFO] Exported policy is up to date: {export_model_dir}")
+
+    evaluate = args_cli.eval_steps is not None or args_cli.eval_episodes is not None
+    if args_cli.record or evaluate:
+        if not isinstance(env.unwrapped, ManagerBasedRLEnv):
+            raise ValueError("Recording and evaluation are only supported for manager-based RL environments.")
+        foot_sensor_cfg = SceneEntityCfg("contact_forces", body_names=".*_foot")
+        foot_sensor_cfg.resolve(env.unwrapped.scene)
+        robot_cfg = SceneEntityCfg("robot")
+        reward_manager = env.unwrapped.reward_manager
+
+    # create the rollout recorder
+    recorder = None
+    if args_cli.record:
+        recording_dir = os.path.join(log_dir, "recordings", datetime.now().strftime("%Y-%m-%d_%H-%M-%S"))
+        print(f"[INFO] Recording rollout to: {recording_dir}")
+        recorder = RolloutRecorder(
+            recording_dir,
+            chunk_size=args_cli.record_chunk_size,
+            attributes={"task": args_cli.task, "checkpoint": resume_path, "reward_terms": reward_manager.active_terms},
+        )
+
+    # create the evaluation metrics
+    metrics = None
+    if evaluate:
+        print(f"[INFO] Evaluating the policy on {env.num_envs} environments.")
+        metrics = EvaluationMetrics(env.unwrapped, foot_sensor_cfg, robot_cfg)
 
     # reset environment
     obs, _ = env.get_observations()
@@ -118,12 +175,55 @@ def main():
             # agent stepping
             actions = policy(obs)
             # env stepping
-            obs, _, _, _ = env.step(actions)
-        if args_cli.video:
-            timestep += 1
-            # Exit the play loop after recording one video
-            if timestep == args_cli.video_length:
-                break
+            next_obs, rewards, dones, _ = env.step(actions)
+            # record the step
+            if recorder is not None:
+                features = foot_features(env.unwrapped, foot_sensor_cfg)
+                recorder.record(
+                    obs=obs,
+                    actions=actions,
+                    rewards=rewards,
+                    dones=dones,
+                    reward_terms=reward_manager._step_reward,
+                    foot_speeds=features.foot_speeds(robot_cfg),
+                    current_air_time=features.current_air_time,
+                    last_air_time=features.last_air_time,
+                    current_contact_time=features.current_contact_time,
+                )
+            # accumulate the evaluation metrics
+            if metrics is not None:
+                metrics.update(rewards, dones)
+            obs = next_obs
+        timestep += 1
+        # Exit the play loop after recording one video
+        if args_cli.video and timestep == args_cli.video_length:
+            break
+        # Exit the play loop after recording the rollout
+        if args_cli.record and timestep == args_cli.record_length:
+            break
+        # Exit the play loop after the evaluation budget
+        if args_cli.eval_steps is not None and timestep == args_cli.eval_steps:
+            break
+        if (
+            args_cli.eval_episodes is not None
+            and timestep % EVAL_EPISODES_CHECK_INTERVAL == 0
+            and metrics.num_episodes >= args_cli.eval_episodes
+        ):
+            break
+
+    # finish writing the recording
+    if recorder is not None:
+        recorder.close()
+        print(f"[INFO] Recorded {recorder.num_steps} steps to: {recorder.directory}")
+
+    # save the evaluation summary
+    if metrics is not None:
+        summary = metrics.summary()
+        print_dict(summary, nesting=4)
+        eval_dir = os.path.join(log_dir, "eval")
+        checkpoint_name = os.path.splitext(os.path.basename(resume_path))[0]
+        save_summary(summary, eval_dir, checkpoint_name, {"task": args_cli.task, "checkpoint": resume_path})
+        print(f"[INFO] Saved evaluation summary to: {os.path.join(eval_dir, checkpoint_name)}.json/.csv")
 
     # close the simulator
     env.close()
@@ -0,0 +1,187 @@
+"""Reduced-precision exports of the actor of a policy for the onboard computer.
+
+The observation normalizer is folded into the first linear layer of the actor, which removes it from
+the exported graph, and the folded actor is exported as TorchScript with dynamically quantized int8
+linear layers and in fp16. Both exports take and return fp32 tensors, so they are loaded by the
+runtimes of :mod:`accrobotics.deploy` like the fp32 ``policy.pt``.
+
+The report compares the exports with the fp32 policy: CPU latency in the inference runtime, file size
+and maximum deviation of the actions over a batch of observations.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import numpy as np
+import os
+import torch
+
+from accrobotics.deploy import TorchScriptRuntime, measure_latency, torch_num_threads
+
+from recorder import read_recording  # isort: skip
+
+# exported reduced-precision policy files
+INT8_FILENAME = "policy_int8.pt"
+FP16_FILENAME = "policy_fp16.pt"
+# report comparing the exports with the fp32 policy
+REPORT_FILENAME = "quantization_report.json"
+
+
+class ReducedPrecisionPolicy(torch.nn.Module):
+    """Actor with fp32 inputs and outputs, evaluated in fp16 or with quantized layers."""
+
+    def __init__(self, actor: torch.nn.Module, num_obs: int, num_actions: int, fp16: bool = False):
+        super().__init__()
+        # the sizes are exported, since quantized layers do not expose their weights as parameters
+        self.num_obs = num_obs
+        self.num_actions = num_actions
+        self.fp16 = fp16
+        self.actor = actor
+
+    def forward(self, x: torch.Tensor) -> torch.Tensor:
+        if self.fp16:
+            return self.actor(x.half()).float()
+        return self.actor(x)
+
+
+def fold_normalizer(actor: torch.nn.Module, normalizer: torch.nn.Module | None) -> torch.nn.Sequential:
+    """Return a copy of the actor on the CPU with the observation normalizer folded into its first layer.
+
+    The empirical normalization ``(x - mean) / (std + eps)`` followed by the first linear layer
+    ``W x + b`` is the linear layer ``W' x + b'`` with ``W' = W / (std + eps)`` and ``b' = b - W' mean``.
+    The folded weights are computed in double precision.
+
+    Args:
+        actor: The actor network, a sequence of layers starting with a linear layer.
+        normalizer: The observation normalizer of the runner. Defaults to None, or an identity, in which
+            case the actor is only copied.
+
+    Returns:
+        The folded actor.
+
+    Raises:
+        ValueError: If the first layer of the actor is not a linear layer.
+    """
+    folded = copy.deepcopy(actor).cpu().float().eval()
+    first_layer = folded[0]
+    if not isinstance(first_layer, torch.nn.Linear):
+        raise ValueError(f"Expected the actor to start with a linear layer, got {type(first_layer).__name__}.")
+    if normalizer is None or not hasattr(normalizer, "_mean"):
+        return folded
+    mean = normalizer._mean.detach().double().cpu().flatten()
+    scale = normalizer._std.detach().double().cpu().flatten() + normalizer.eps
+    with torch.no_grad():
+        weight = first_layer.weight.double() / scale
+        bias = first_layer.bias.double() - weight @ mean
+        first_layer.weight.copy_(weight)
+        first_layer.bias.copy_(bias)
+    return folded
+
+
+def export_reduced_precision_policies(actor: torch.nn.Module, normalizer: torch.nn.Module | None, path: str):
+    """Export the actor with the normalizer folded in as int8 and fp16 TorchScript policies.
+
+    Args:
+        actor: The actor network of the policy.
+        normalizer: The observation normalizer of the runner. Defaults to None.
+        path: The directory in which ``policy_int8.pt`` and ``policy_fp16.pt`` are written.
+    """
+    folded = fold_normalizer(actor, normalizer)
+    num_obs, num_actions = folded[0].in_features, _output_size(folded)
+    os.makedirs(path, exist_ok=True)
+    # int8 weights, with the activations quantized at every call
+    int8_actor = torch.ao.quantization.quantize_dynamic(folded, {torch.nn.Linear}, dtype=torch.qint8)
+    int8_policy = ReducedPrecisionPolicy(int8_actor, num_obs, num_actions)
+    torch.jit.script(int8_policy).save(os.path.join(path, INT8_FILENAME))
+    fp16_policy = ReducedPrecisionPolicy(copy.deepcopy(folded).half(), num_obs, num_actions, fp16=True)
+    torch.jit.script(fp16_policy).save(os.path.join(path, FP16_FILENAME))
+
+
+def synthetic_observations(num_obs: int, normalizer: torch.nn.Module | None, num_samples: int = 4096) -> torch.Tensor:
+    """Return observations drawn from the normal distribution of the normalizer statistics.
+
+    Args:
+        num_obs: The number of observations.
+        normalizer: The observation normalizer of the runner. Defaults to None, or an identity, in which
+            case the observations are drawn from the standard normal distribution.
+        num_samples: The number of observations. Defaults to 4096.
+
+    Returns:
+        The observations on the CPU. Shape is (num_samples, num_obs).
+    """
+    generator = torch.Generator().manual_seed(0)
+    obs = torch.randn(num_samples, num_obs, generator=generator)
+    if normalizer is not None and hasattr(normalizer, "_mean"):
+        obs = obs * normalizer._std.detach().cpu() + normalizer._mean.detach().cpu()
+    return obs
+
+
+def quantization_report(
+    path: str,
+    observations: torch.Tensor,
+    reference_filename: str = "policy.pt",
+    num_calls: int = 1000,
+    num_threads: int = 1,
+) -> dict[str, dict]:
+    """Compare the reduced-precision policies of an export directory with the fp32 policy.
+
+    The latency is measured with the TorchScript runtime of :mod:`accrobotics.deploy` on single
+    observations, and the actions of every policy are compared with those of the fp32 policy on the
+    whole batch of observations. The report is also saved as ``quantization_report.json``.
+
+    Args:
+        path: The export directory.
+        observations: The raw observations, before normalization. Shape is (num_samples, num_obs).
+        reference_filename: The fp32 policy file. Defaults to "policy.pt".
+        num_calls: The number of timed calls per policy. Defaults to 1000.
+        num_threads: The number of inference threads, restored after the measurement. Defaults to 1.
+
+    Returns:
+        The file size (in KiB), latency percentiles (in us) and maximum and mean absolute action
+        deviation of every policy, keyed by file name.
+    """
+    observations = observations.detach().float().cpu()
+    with torch.inference_mode():
+        reference_actions = torch.jit.load(os.path.join(path, reference_filename), map_location="cpu")(observations)
+
+    report = {}
+    for filename in (reference_filename, INT8_FILENAME, FP16_FILENAME):
+        policy_path = os.path.join(path, filename)
+        runtime = TorchScriptRuntime(policy_path, batch_size=len(observations))
+        actions = torch.from_numpy(runtime(observations.numpy()).copy())
+        deviation = torch.abs(actions - reference_actions)
+        with torch_num_threads(num_threads):
+            runtime = TorchScriptRuntime(policy_path, batch_size=1)
+            latency = measure_latency(runtime, observations.numpy(), num_calls)
+        report[filename] = {
+            "size_kib": os.path.getsize(policy_path) / 2**10,
+            "latency_p50_us": latency["p50_us"],
+            "latency_p99_us": latency["p99_us"],
+            "max_action_deviation": deviation.max().item(),
+            "mean_action_deviation": deviation.mean().item(),
+        }
+    report["observations"] = {"num_samples": len(observations)}
+    with open(os.path.join(path, REPORT_FILENAME), "w") as f:
+        json.dump(report, f, indent=2)
+    return report
+
+
+def recorded_observations(directory: str, max_samples: int = 4096) -> torch.Tensor:
+    """Return observations of a recording written by ``play.py --record``.
+
+    Args:
+        directory: The directory of the recording.
+        max_samples: The maximum number of observations, taken evenly over the recording. Defaults to 4096.
+
+    Returns:
+        The observations. Shape is (num_samples, num_obs).
+    """
+    obs = np.concatenate([chunk.reshape(-1, chunk.shape[-1]) for chunk in read_recording(directory)["obs"]])
+    indices = np.linspace(0, len(obs) - 1, num=min(max_samples, len(obs))).astype(np.int64)
+    return torch.from_numpy(np.ascontiguousarray(obs[indices], dtype=np.float32))
+
+
+def _output_size(actor: torch.nn.Sequential) -> int:
+    """Return the output size of the last linear layer of the actor."""
+    return [layer for layer in actor if isinstance(layer, torch.nn.Linear)][-1].out_features
@@ -0,0 +1,156 @@
+"""Recording of rollouts into chunked, memory-mapped files written from a background thread.
+
+Every recorded stream is stored in its own directory as a sequence of ``.npy`` chunks of ``chunk_size``
+steps, each preallocated as a memory-mapped file. A ``meta.json`` file next to the streams holds the
+number of recorded steps and the shapes and data types of the streams.
+
+The stepping loop only issues a (non-blocking on CUDA) copy of the tensors into a pinned staging slot.
+The slots are written to the memory-mapped chunks by a background thread and then reused, so that the
+memory used by the recorder is bounded by the number of slots. When all slots are in use, recording
+waits for the writer to free one.
+"""
+
+from __future__ import annotations
+
+import json
+import numpy as np
+import os
+import queue
+import threading
+import torch
+
+
+class RolloutRecorder:
+    """Streams per-step tensors into chunked, memory-mapped ``.npy`` files."""
+
+    def __init__(self, directory: str, chunk_size: int = 500, num_slots: int = 8, attributes: dict | None = None):
+        """Initialize the recorder.
+
+        Args:
+            directory: The directory in which the recording is written.
+            chunk_size: Number of steps per chunk file.
+            num_slots: Number of staging slots. This bounds the number of steps waiting to be written.
+            attributes: Additional JSON-serializable information stored in ``meta.json``. Defaults to None.
+        """
+        self.directory = directory
+        self.chunk_size = chunk_size
+        self.num_slots = num_slots
+        self.num_steps = 0
+        self.metadata: dict = {"chunk_size": chunk_size, "streams": {}, "attributes": attributes or {}}
+
+        os.makedirs(directory, exist_ok=True)
+        self._slots: list[dict[str, torch.Tensor]] | None = None
+        self._free_slots: queue.Queue[int] = queue.Queue()
+        self._pending: queue.Queue[tuple | None] = queue.Queue()
+        self._chunks: dict[str, np.memmap] = {}
+        self._error: BaseException | None = None
+        self._writer = threading.Thread(target=self._write_loop, name="rollout-recorder", daemon=True)
+        self._writer.start()
+
+    def record(self, **tensors: torch.Tensor):
+        """Record the tensors of one step.
+
+        All steps must provide the same streams with the same shapes. The tensors can be modified as
+        soon as this method returns.
+
+        Args:
+            tensors: The tensors to record, keyed by stream name.
+        """
+        if self._error is not None:
+            raise RuntimeError("The recording writer failed.") from self._error
+        if self._slots is None:
+            self._allocate_slots(tensors)
+        index = self._free_slots.get()
+        slot = self._slots[index]
+        for name, tensor in tensors.items():
+            slot[name].copy_(tensor.detach(), non_blocking=True)
+        event = None
+        if any(tensor.is_cuda for tensor in tensors.values()):
+            event = torch.cuda.Event()
+            event.record()
+        self._pending.put((self.num_steps, index, event))
+        self.num_steps += 1
+
+    def close(self):
+        """Wait for all recorded steps to be written and finalize the recording."""
+        self._pending.put(None)
+        self._writer.join()
+        self._chunks.clear()
+        self.metadata["num_steps"] = self.num_steps
+        with open(os.path.join(self.directory, "meta.json"), "w") as f:
+            json.dump(self.metadata, f, indent=2)
+        if self._error is not None:
+            raise RuntimeError("The recording writer failed.") from self._error
+
+    def _allocate_slots(self, tensors: dict[str, torch.Tensor]):
+        pin_memory = any(tensor.is_cuda for tensor in tensors.values())
+        self._slots = [
+            {
+                name: torch.empty(tensor.shape, dtype=tensor.dtype, pin_memory=pin_memory)
+                for name, tensor in tensors.items()
+            }
+            for _ in range(self.num_slots)
+        ]
+        for index in range(self.num_slots):
+            self._free_slots.put(index)
+        self.metadata["streams"] = {
+            name: {"shape": list(tensor.shape), "dtype": str(self._slots[0][name].numpy().dtype)}
+            for name, tensor in tensors.items()
+        }
+        for name in tensors:
+            os.makedirs(os.path.join(self.directory, name), exist_ok=True)
+
+    def _write_loop(self):
+        while True:
+            item = self._pending.get()
+            if item is None:
+                break
+            step, index, event = item
+            try:
+                if event is not None:
+                    event.synchronize()
+                row = step % self.chunk_size
+                for name, tensor in self._slots[index].items():
+                    if row == 0:
+                        self._open_chunk(name, step // self.chunk_size)
+                    self._chunks[name][row] = tensor.numpy()
+            except BaseException as e:
+                self._error = e
+            finally:
+                self._free_slots.put(index)
+
+    def _open_chunk(self, name: str, chunk_index: int):
+        # the previous chunk is flushed to disk when its memory map is released
+        self._chunks.pop(name, None)
+        stream = self.metadata["streams"][name]
+        self._chunks[name] = np.lib.format.open_memmap(
+            os.path.join(self.directory, name, f"chunk_{chunk_index:05d}.npy"),
+            mode="w+",
+            dtype=np.dtype(stream["dtype"]),
+            shape=(self.chunk_size, *stream["shape"]),
+        )
+
+
+def read_recording(directory: str) -> dict[str, list[np.ndarray]]:
+    """Open a recording written by :class:`RolloutRecorder`.
+
+    The ``meta.json`` file of the recording holds the attributes passed to the recorder.
+
+    Args:
+        directory: The directory of the recording.
+
+    Returns:
+        The memory-mapped chunks of every stream, with the unused steps of the last chunk removed.
+    """
+    with open(os.path.join(directory, "meta.json")) as f:
+        metadata = json.load(f)
+    num_steps, chunk_size = metadata["num_steps"], metadata["chunk_size"]
+    num_chunks = (num_steps + chunk_size - 1) // chunk_size
+    streams = {}
+    for name in metadata["streams"]:
+        chunks = []
+        for chunk_index in range(num_chunks):
+            chunk = np.load(os.path.join(directory, name, f"chunk_{chunk_index:05d}.npy"), mmap_mode="r")
+            chunks.append(chunk[: num_steps - chunk_index * chunk_size])
+        streams[name] = chunks
+    return streams
@@ -0,0 +1,263 @@
+"""On-policy runner writing its checkpoints in the background.
+
+:class:`rsl_rl.runners.OnPolicyRunner` writes every checkpoint synchronously, which stalls the rollout
+collection for as long as the file system takes to store it. The runner in this module only copies the
+state dicts to host memory on the training thread, into page-locked buffers that are reused between
+checkpoints, and writes them from a background thread. Checkpoints are written to a temporary file and
+renamed, so that a checkpoint file is either complete or absent.
+
+Older checkpoints of the run can be deleted with a retention policy keeping the last and the best
+checkpoints, ranked by the mean episode reward at the time they were saved. The written and deleted
+checkpoints are recorded in the checkpoint index of the experiment (see :mod:`checkpoint_index`).
+
+The runner also trains with one process per device when launched with ``torchrun``. RSL-RL averages
+the gradients over the processes and only logs and saves from the process of rank 0. The runner adds
+the ``gloo`` backend for processes training on the CPU, and updates the observation normalizers with
+the moments of the observations of all processes, so that they stay identical.
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import os
+import statistics
+import torch
+import torch.distributed as dist
+from dataclasses import dataclass
+
+from rsl_rl.modules import EmpiricalNormalization
+from rsl_rl.runners import OnPolicyRunner
+
+from checkpoint_index import CheckpointIndex
+
+
+class DistributedEmpiricalNormalization(EmpiricalNormalization):
+    """Empirical normalization updated with the moments of the values of all processes."""
+
+    @torch.jit.unused
+    def update(self, x: torch.Tensor):
+        if self.until is not None and self.count >= self.until:
+            return
+        # sums of the values and of their squares over all processes, in double precision
+        x = x.double()
+        moments = torch.cat([x.sum(dim=0), x.square().sum(dim=0), x.new_tensor([x.shape[0]])])
+        dist.all_reduce(moments, op=dist.ReduceOp.SUM)
+        num_features = x.shape[1]
+        # the count stays on the device, as in the base class, so that the update does not synchronize
+        count_x = moments[-1]
+        mean_x = moments[:num_features] / count_x
+        var_x = (moments[num_features:-1] / count_x - mean_x.square()).clamp(min=0.0)
+        mean_x, var_x = mean_x.to(self._mean.dtype).unsqueeze(0), var_x.to(self._var.dtype).unsqueeze(0)
+
+        self.count += count_x.to(self.count.dtype)
+        rate = (count_x / self.count).to(self._mean.dtype)
+        delta_mean = mean_x - self._mean
+        self._mean += rate * delta_mean
+        self._var += rate * (var_x - self._var + delta_mean * (mean_x - self._mean))
+        self._std = torch.sqrt(self._var)
+
+
+@dataclass
+class CheckpointRecord:
+    """A checkpoint written by the runner."""
+
+    path: str
+    iteration: int
+    mean_reward: float | None
+
+
+class CheckpointingRunner(OnPolicyRunner):
+    """On-policy runner with asynchronous checkpoint writing and checkpoint retention.
+
+    The checkpoints have the layout of the checkpoints of :class:`OnPolicyRunner` and are loaded with
+    :meth:`OnPolicyRunner.load`.
+    """
+
+    def __init__(
+        self,
+        env,
+        train_cfg: dict,
+        log_dir: str | None = None,
+        device: str = "cpu",
+        keep_last: int | None = None,
+        keep_best: int = 0,
+        asynchronous: bool = True,
+    ):
+        """Initialize the runner.
+
+        Args:
+            env: The environment wrapped for RSL-RL.
+            train_cfg: The runner configuration.
+            log_dir: The directory of the checkpoints and logs. Defaults to None.
+            device: The training device. Defaults to "cpu".
+            keep_last: Number of most recent checkpoints to keep. Defaults to None, in which case all
+                checkpoints are kept.
+            keep_best: Number of checkpoints with the highest mean reward to keep in addition to the last
+                ones. Only used with ``keep_last``. Defaults to 0.
+            asynchronous: Whether the checkpoints are written from a background thread. Defaults to True.
+
+        Raises:
+            ValueError: If ``keep_last`` is smaller than 1.
+            RuntimeError: If launched with several processes and RSL-RL does not support distributed training.
+        """
+        if keep_last is not None and keep_last < 1:
+            raise ValueError(f"At least the last checkpoint must be kept, got keep_last={keep_last}.")
+        super().__init__(env, train_cfg, log_dir=log_dir, device=device)
+        if int(os.getenv("WORLD_SIZE", "1")) > 1 and not hasattr(self.alg, "reduce_parameters"):
+            raise RuntimeError("Distributed training requires RSL-RL 2.3 or later.")
+        if getattr(self, "is_distributed", False) and self.empirical_normalization:
+            self._synchronize_normalizers()
+        self.keep_last = keep_last
+        self.keep_best = keep_best
+        self.checkpoints: list[CheckpointRecord] = []
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1) if asynchronous else None
+        self._pending: concurrent.futures.Future | None = None
+        self._host_buffers: dict[str, torch.Tensor] = {}
+        self._mean_reward: float | None = None
+        # the experiment directory holds the run directories and their index
+        self._index = CheckpointIndex(os.path.dirname(os.path.abspath(log_dir))) if log_dir is not None else None
+
+    def learn(self, num_learning_iterations: int, init_at_random_ep_len: bool = False):
+        try:
+            super().learn(num_learning_iterations, init_at_random_ep_len=init_at_random_ep_len)
+        finally:
+            # the last checkpoint is written before returning
+            self.wait()
+
+    def log(self, locs: dict, *args, **kwargs):
+        # the mean reward ranks the checkpoints saved at this iteration
+        if len(locs["rewbuffer"]) > 0:
+            self._mean_reward = statistics.mean(locs["rewbuffer"])
+        super().log(locs, *args, **kwargs)
+
+    def save(self, path: str, infos=None):
+        # the host buffers are reused, so the previous checkpoint must be written before copying
+        self.wait()
+        snapshot = self._snapshot(self._state_dicts(infos), "")
+        record = CheckpointRecord(path, self.current_learning_iteration, self._mean_reward)
+        if self._executor is None:
+            self._write(snapshot, record)
+            return
+        # the copies to page-locked memory are asynchronous and complete before the event
+        copied = None
+        if torch.cuda.is_available() and str(self.device).startswith("cuda"):
+            copied = torch.cuda.Event()
+            copied.record()
+        self._pending = self._executor.submit(self._write, snapshot, record, copied)
+
+    def wait(self):
+        """Wait until the pending checkpoint is written, raising the error of a failed write."""
+        if self._pending is not None:
+            pending, self._pending = self._pending, None
+            pending.result()
+
+    """
+    Helper functions.
+    """
+
+    def _configure_multi_gpu(self):
+        """Configure the process group of distributed training, on CUDA devices or on the CPU."""
+        world_size = int(os.getenv("WORLD_SIZE", "1"))
+        if world_size == 1 or not str(self.device).startswith("cuda"):
+            # processes training on the CPU communicate with the gloo backend instead of NCCL
+            self.gpu_world_size = world_size
+            self.is_distributed = world_size > 1
+            self.gpu_local_rank = int(os.getenv("LOCAL_RANK", "0"))
+            self.gpu_global_rank = int(os.getenv("RANK", "0"))
+            self.multi_gpu_cfg = None
+            if self.is_distributed:
+                self.multi_gpu_cfg = {
+                    "global_rank": self.gpu_global_rank,
+                    "local_rank": self.gpu_local_rank,
+                    "world_size": self.gpu_world_size,
+                }
+                if not dist.is_initialized():
+                    dist.init_process_group(backend="gloo", rank=self.gpu_global_rank, world_size=world_size)
+            return
+        super()._configure_multi_gpu()
+
+    def _synchronize_normalizers(self):
+        """Replace the observation normalizers by normalizers updated with the moments of all processes."""
+        for name in ("obs_normalizer", "privileged_obs_normalizer", "critic_obs_normalizer"):
+            normalizer = getattr(self, name, None)
+            if isinstance(normalizer, EmpiricalNormalization):
+                synchronized = DistributedEmpiricalNormalization(
+                    shape=normalizer._mean.shape[1:], eps=normalizer.eps, until=normalizer.until
+                ).to(self.device)
+                synchronized.load_state_dict(normalizer.state_dict())
+                setattr(self, name, synchronized)
+
+    def _state_dicts(self, infos) -> dict:
+        """Return the state dicts of a checkpoint of :class:`OnPolicyRunner`, on the training device."""
+        # RSL-RL 2.3 renamed the actor-critic to policy and the critic observations to privileged ones
+        policy = self.alg.policy if hasattr(self.alg, "policy") else self.alg.actor_critic
+        saved_dict = {
+            "model_state_dict": policy.state_dict(),
+            "optimizer_state_dict": self.alg.optimizer.state_dict(),
+            "iter": self.current_learning_iteration,
+            "infos": infos,
+        }
+        if getattr(self.alg, "rnd", None):
+            saved_dict["rnd_state_dict"] = self.alg.rnd.state_dict()
+            saved_dict["rnd_optimizer_state_dict"] = self.alg.rnd_optimizer.state_dict()
+        if self.empirical_normalization:
+            saved_dict["obs_norm_state_dict"] = self.obs_normalizer.state_dict()
+            if hasattr(self, "privileged_obs_normalizer"):
+                saved_dict["privileged_obs_norm_state_dict"] = self.privileged_obs_normalizer.state_dict()
+            else:
+                saved_dict["critic_obs_norm_state_dict"] = self.critic_obs_normalizer.state_dict()
+        return saved_dict
+
+    def _snapshot(self, value, key: str):
+        """Copy the tensors of a nested state into the host buffers, keyed by their position in the state."""
+        if isinstance(value, torch.Tensor):
+            buffer = self._host_buffers.get(key)
+            if buffer is None or buffer.shape != value.shape or buffer.dtype != value.dtype:
+                buffer = torch.empty(value.shape, dtype=value.dtype, pin_memory=value.is_cuda)
+                self._host_buffers[key] = buffer
+            return buffer.copy_(value.detach(), non_blocking=value.is_cuda)
+        if isinstance(value, dict):
+            return {name: self._snapshot(item, f"{key}/{name}") for name, item in value.items()}
+        if isinstance(value, (list, tuple)):
+            return type(value)(self._snapshot(item, f"{key}/{index}") for index, item in enumerate(value))
+        return value
+
+    def _write(self, snapshot: dict, record: CheckpointRecord, copied: torch.cuda.Event | None = None):
+        """Write a checkpoint atomically and apply the retention policy."""
+        if copied is not None:
+            copied.synchronize()
+        tmp_path = f"{record.path}.tmp"
+        with open(tmp_path, "wb") as f:
+            torch.save(snapshot, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, record.path)
+        # upload model to external logging service
+        if self.logger_type in ["neptune", "wandb"] and not getattr(self, "disable_logs", False):
+            self.writer.save_model(record.path, record.iteration)
+
+        self.checkpoints = [checkpoint for checkpoint in self.checkpoints if checkpoint.path != record.path]
+        self.checkpoints.append(record)
+        if self._index is not None:
+            run_name = os.path.basename(os.path.dirname(os.path.abspath(record.path)))
+            self._index.add(run_name, os.path.basename(record.path), record.iteration, record.mean_reward)
+        self._apply_retention()
+
+    def _apply_retention(self):
+        """Delete the checkpoints that are neither among the last nor among the best ones."""
+        if self.keep_last is None:
+            return
+        by_iteration = sorted(self.checkpoints, key=lambda checkpoint: checkpoint.iteration)
+        kept = by_iteration[-self.keep_last :]
+        ranked = [checkpoint for checkpoint in by_iteration if checkpoint.mean_reward is not None]
+        ranked.sort(key=lambda checkpoint: checkpoint.mean_reward, reverse=True)
+        kept += ranked[: self.keep_best]
+        for checkpoint in by_iteration:
+            if checkpoint in kept:
+                continue
+            if self._index is not None:
+                run_name = os.path.basename(os.path.dirname(os.path.abspath(checkpoint.path)))
+                self._index.remove(run_name, os.path.basename(checkpoint.path))
+            if os.path.exists(checkpoint.path):
+                os.remove(checkpoint.path)
+        self.checkpoints = [checkpoint for checkpoint in by_iteration if checkpoint in kept]
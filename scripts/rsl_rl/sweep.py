@@ -0,0 +1,150 @@
+"""Parameter sweeps of a reward term over groups of environments of one simulation.
+
+A sweep file lists the parameter settings of a reward term, either explicitly or as a grid:
+
+.. code-block:: yaml
+
+    term: foot_deceleration
+    grid:
+      velocity_threshold: [0.2, 0.3, 0.5]
+      deceleration_weight: [0.3, 0.5]
+
+The environments are assigned to the settings in turn, environment ``i`` to setting
+``i % num_settings``, so that every setting is trained on all terrains, which the terrain importer
+assigns by environment index. The swept parameters of the term are replaced by per-environment tensors
+holding the value of each group. The metrics of every group are accumulated on the device and logged
+with the training statistics.
+"""
+
+from __future__ import annotations
+
+import gymnasium as gym
+import itertools
+import json
+import torch
+import yaml
+from typing import TYPE_CHECKING
+
+from isaaclab.managers import SceneEntityCfg
+
+from accrobotics.mdp import term_param
+
+from evaluation import EvaluationMetrics
+
+if TYPE_CHECKING:
+    from isaaclab.envs import ManagerBasedRLEnv
+
+
+def load_sweep(path: str) -> dict:
+    """Load a sweep file.
+
+    Args:
+        path: Path to the YAML sweep file.
+
+    Returns:
+        The sweep with the name of the reward term (``"term"``) and the list of parameter settings
+        (``"configs"``).
+
+    Raises:
+        ValueError: If the file defines neither or both of ``configs`` and ``grid``.
+    """
+    with open(path) as f:
+        sweep = yaml.safe_load(f)
+    if ("configs" in sweep) == ("grid" in sweep):
+        raise ValueError(f"The sweep file '{path}' must define either 'configs' or 'grid'.")
+    if "grid" in sweep:
+        names = list(sweep["grid"])
+        sweep["configs"] = [dict(zip(names, values)) for values in itertools.product(*sweep["grid"].values())]
+    return {"term": sweep.get("term", "foot_deceleration"), "configs": sweep["configs"]}
+
+
+def apply_sweep(env: ManagerBasedRLEnv, sweep: dict) -> torch.Tensor:
+    """Assign every environment to a parameter setting of the sweep.
+
+    The swept parameters of the reward term are replaced by tensors of shape (num_envs,) holding the
+    value of the setting of every environment (see :func:`accrobotics.mdp.term_param`). Parameters
+    that a setting omits keep the value of the term configuration.
+
+    Args:
+        env: The environment instance.
+        sweep: The sweep returned by :func:`load_sweep`.
+
+    Returns:
+        The group index of every environment. Shape is (num_envs,).
+
+    Raises:
+        ValueError: If there are more settings than environments.
+    """
+    configs = sweep["configs"]
+    num_groups = len(configs)
+    if num_groups > env.num_envs:
+        raise ValueError(f"The sweep has {num_groups} settings but there are only {env.num_envs} environments.")
+    group_ids = torch.arange(env.num_envs, device=env.device) % num_groups
+
+    for name in sorted({name for config in configs for name in config}):
+        param = term_param(env, sweep["term"], name)
+        for group, config in enumerate(configs):
+            if name in config:
+                param[group_ids == group] = float(config[name])
+    return group_ids
+
+
+class SweepMetricsWrapper(gym.Wrapper):
+    """Logs the metrics of every group of a sweep with the training statistics.
+
+    The metrics of the groups are accumulated on the device and their means over every
+    ``log_interval`` steps are added to the ``"log"`` extras of every step, which RSL-RL writes to
+    the logger as ``Sweep/group_<index>/<metric>``.
+    """
+
+    def __init__(self, env: gym.Env, group_ids: torch.Tensor, num_groups: int, log_interval: int):
+        """Initialize the wrapper.
+
+        Args:
+            env: The environment to wrap.
+            group_ids: The group index of every environment. Shape is (num_envs,).
+            num_groups: The number of groups.
+            log_interval: Number of steps over which the metrics are averaged, e.g. the number of steps
+                per environment of a training iteration.
+        """
+        super().__init__(env)
+        sensor_cfg = SceneEntityCfg("contact_forces", body_names=".*_foot")
+        sensor_cfg.resolve(env.unwrapped.scene)
+        self.metrics = EvaluationMetrics(
+            env.unwrapped, sensor_cfg, SceneEntityCfg("robot"), group_ids=group_ids, num_groups=num_groups
+        )
+        self.log_interval = log_interval
+        self.last_summaries: list[dict] = []
+        self._log = self._group_log()
+
+    def step(self, action: torch.Tensor):
+        obs, rewards, terminated, truncated, extras = self.env.step(action)
+        self.metrics.update(rewards, terminated | truncated)
+        if self.metrics.num_steps == self.log_interval:
+            self._log = self._group_log()
+            self.last_summaries = [self.metrics.summary(group) for group in range(self.metrics.num_groups)]
+            self.metrics.reset()
+        extras.setdefault("log", {}).update(self._log)
+        return obs, rewards, terminated, truncated, extras
+
+    def save_summary(self, path: str, sweep: dict):
+        """Save the parameters of every group with its metrics over the last logging interval.
+
+        Args:
+            path: Path to the JSON file.
+            sweep: The sweep returned by :func:`load_sweep`.
+        """
+        groups = [
+            {"group": group, "params": config, "metrics": summary}
+            for group, (config, summary) in enumerate(zip(sweep["configs"], self.last_summaries))
+        ]
+        with open(path, "w") as f:
+            json.dump({"term": sweep["term"], "groups": groups}, f, indent=2)
+
+    def _group_log(self) -> dict[str, torch.Tensor]:
+        """Return the current means of the metrics of every group, keyed by their logger names."""
+        return {
+            f"Sweep/group_{group}/{name}": value
+            for name, values in self.metrics.group_means().items()
+            for group, value in enumerate(values)
+        }
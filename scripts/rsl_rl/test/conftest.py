@@ -0,0 +1,7 @@
+"""Test configuration of the RSL-RL scripts, run without Isaac Sim on the modules that do not need it."""
+
+import os
+import sys
+
+# the modules of the scripts are imported as top-level modules, as when running the scripts
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
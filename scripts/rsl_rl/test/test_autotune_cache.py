@@ -0,0 +1,25 @@
+"""Tests of the cache of the tuned numbers of environments."""
+
+import os
+
+from autotune_cache import AutotuneCache, hardware_key  # isort: skip
+
+
+def test_hardware_key_of_cpu():
+    assert hardware_key("cpu").endswith(f"({os.cpu_count()} CPUs)")
+
+
+def test_put_and_get(tmp_path):
+    cache = AutotuneCache(str(tmp_path / "logs" / "autotune.json"))
+    assert cache.get("Task-v0", "cpu") is None
+    assert cache.num_envs("Task-v0", "cpu") is None
+    result = {"num_envs": 4096, "probes": [{"num_envs": 4096, "env_steps_per_s": 1.0e5}]}
+    cache.put("Task-v0", "cpu", result)
+    cache.put("Other-Task-v0", "cpu", {"num_envs": 1024, "probes": []})
+    assert cache.get("Task-v0", "cpu") == result
+    assert cache.num_envs("Task-v0", "cpu") == 4096
+    assert cache.num_envs("Other-Task-v0", "cpu") == 1024
+    # the result replaces the previous one of the same task and hardware
+    cache.put("Task-v0", "cpu", {"num_envs": 2048, "probes": []})
+    assert cache.num_envs("Task-v0", "cpu") == 2048
+    assert list(cache.load()["tasks"]["Task-v0"]) == [hardware_key("cpu")]
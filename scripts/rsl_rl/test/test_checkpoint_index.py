@@ -0,0 +1,92 @@
+"""Tests of the checkpoint index on temporary experiment directories."""
+
+import os
+import pytest
+import shutil
+
+from checkpoint_index import CheckpointIndex, get_checkpoint_path  # isort: skip
+
+
+def make_run(log_root_path, run_name: str, iterations: list[int]):
+    """Create a run directory with empty checkpoint files."""
+    os.makedirs(log_root_path / run_name)
+    for iteration in iterations:
+        (log_root_path / run_name / f"model_{iteration}.pt").touch()
+
+
+@pytest.fixture
+def index(tmp_path):
+    make_run(tmp_path, "2024-01-01_00-00-00", [0, 50, 100])
+    make_run(tmp_path, "2024-01-02_00-00-00", [0, 50])
+    index = CheckpointIndex(str(tmp_path))
+    index.rebuild()
+    return index
+
+
+def test_rebuild_indexes_all_runs(index, tmp_path):
+    runs = index.load()["runs"]
+    assert sorted(runs) == ["2024-01-01_00-00-00", "2024-01-02_00-00-00"]
+    assert runs["2024-01-01_00-00-00"]["model_100.pt"] == {"iteration": 100, "mean_reward": None}
+
+
+def test_find_last_checkpoint_of_last_run(index, tmp_path):
+    assert index.find() == str(tmp_path / "2024-01-02_00-00-00" / "model_50.pt")
+    # checkpoints are sorted by their zero-padded names, not alphabetically
+    assert index.find("2024-01-01") == str(tmp_path / "2024-01-01_00-00-00" / "model_100.pt")
+    assert index.find(checkpoint=r"model_0\.pt") == str(tmp_path / "2024-01-02_00-00-00" / "model_0.pt")
+    assert index.find("2025") is None
+
+
+def test_add_and_remove(index, tmp_path):
+    (tmp_path / "2024-01-02_00-00-00" / "model_150.pt").touch()
+    index.add("2024-01-02_00-00-00", "model_150.pt", 150, mean_reward=12.5)
+    assert index.load()["runs"]["2024-01-02_00-00-00"]["model_150.pt"] == {"iteration": 150, "mean_reward": 12.5}
+    assert index.find() == str(tmp_path / "2024-01-02_00-00-00" / "model_150.pt")
+    index.remove("2024-01-02_00-00-00", "model_150.pt")
+    assert index.find() == str(tmp_path / "2024-01-02_00-00-00" / "model_50.pt")
+
+
+def test_find_deleted_checkpoint(index, tmp_path):
+    os.remove(tmp_path / "2024-01-02_00-00-00" / "model_50.pt")
+    assert index.find() is None
+
+
+def test_rebuild_keeps_mean_rewards(index):
+    index.add("2024-01-01_00-00-00", "model_100.pt", 100, mean_reward=3.0)
+    index.rebuild()
+    assert index.load()["runs"]["2024-01-01_00-00-00"]["model_100.pt"]["mean_reward"] == 3.0
+
+
+def test_add_missing_runs(index, tmp_path):
+    index.add_missing_runs()
+    make_run(tmp_path, "2024-01-03_00-00-00", [0, 50])
+    make_run(tmp_path, "2024-01-04_00-00-00", [])
+    shutil.rmtree(tmp_path / "2024-01-01_00-00-00")
+    assert index.add_missing_runs("2024") == ["2024-01-02_00-00-00", "2024-01-03_00-00-00", "2024-01-04_00-00-00"]
+    runs = index.load()["runs"]
+    assert "2024-01-01_00-00-00" not in runs
+    # runs without checkpoints are indexed, so that they are not listed again
+    assert runs["2024-01-04_00-00-00"] == {}
+    assert sorted(runs["2024-01-03_00-00-00"]) == ["model_0.pt", "model_50.pt"]
+
+
+def test_add_missing_runs_without_changes(index, tmp_path, monkeypatch):
+    # the first listing writes the index into the experiment directory, which lists it once more
+    index.add_missing_runs()
+    index.add_missing_runs()
+    mtime_ns = os.stat(index.path).st_mtime_ns
+
+    def scandir(path):
+        raise AssertionError("The run directories were listed again.")
+
+    monkeypatch.setattr(os, "scandir", scandir)
+    assert index.add_missing_runs() == ["2024-01-01_00-00-00", "2024-01-02_00-00-00"]
+    assert os.stat(index.path).st_mtime_ns == mtime_ns
+
+
+def test_get_checkpoint_path_of_unindexed_run(index, tmp_path):
+    make_run(tmp_path, "2024-01-03_00-00-00", [0, 50, 100])
+    assert get_checkpoint_path(str(tmp_path)) == str(tmp_path / "2024-01-03_00-00-00" / "model_100.pt")
+    assert get_checkpoint_path(str(tmp_path), "2024-01-01", r"model_50\.pt") == str(
+        tmp_path / "2024-01-01_00-00-00" / "model_50.pt"
+    )
@@ -0,0 +1,90 @@
+"""Tests of the distillation of a policy into a student network."""
+
+import math
+import pytest
+import torch
+
+from distillation import REGRESSION_KEYS, DAggerDistillation, StudentPolicy, compare_evaluations  # isort: skip
+
+
+class MockVecEnv:
+    """Environments with random observations and episodes of fixed length, rewarding the first action."""
+
+    num_obs = 4
+    num_actions = 2
+    episode_length = 5
+
+    def __init__(self, num_envs: int):
+        self.num_envs = num_envs
+        self.device = "cpu"
+        self.episode_length_buf = torch.zeros(num_envs, dtype=torch.long)
+
+    def get_observations(self) -> tuple[torch.Tensor, dict]:
+        return torch.randn(self.num_envs, self.num_obs), {"observations": {}}
+
+    def step(self, actions: torch.Tensor):
+        self.episode_length_buf += 1
+        dones = self.episode_length_buf >= self.episode_length
+        self.episode_length_buf[dones] = 0
+        obs, extras = self.get_observations()
+        return obs, torch.ones(self.num_envs), dones.long(), extras
+
+
+class LinearTeacher(torch.nn.Module):
+    """Linear teacher with the inference interface of the RSL-RL actor-critic."""
+
+    def __init__(self):
+        super().__init__()
+        self.actor = torch.nn.Linear(MockVecEnv.num_obs, MockVecEnv.num_actions)
+
+    def act_inference(self, obs: torch.Tensor) -> torch.Tensor:
+        return self.actor(obs)
+
+
+def test_student_policy():
+    student = StudentPolicy(4, 2, [16, 8])
+    assert student(torch.zeros(3, 4)).shape == (3, 2)
+    assert [layer.out_features for layer in student.actor if isinstance(layer, torch.nn.Linear)] == [16, 8, 2]
+    assert StudentPolicy(4, 2, [])(torch.zeros(3, 4)).shape == (3, 2)
+
+
+def test_distillation(tmp_path):
+    torch.manual_seed(0)
+    env = MockVecEnv(16)
+    distillation = DAggerDistillation(
+        env, LinearTeacher(), torch.nn.Identity(), StudentPolicy(4, 2, [32]), num_steps_per_env=8, buffer_size=200
+    )
+    stats = distillation.collect()
+    initial_error = stats["action_error"]
+    assert stats["teacher_share"] == 1.0
+    # every episode collects the same reward at every step
+    assert stats["mean_return"] == pytest.approx(MockVecEnv.episode_length)
+    # the dataset is full and its oldest samples were replaced
+    assert distillation._num_samples == 128
+    distillation.collect()
+    assert distillation._num_samples == 200
+    assert distillation._buffer_index == 256 % 200
+
+    stats = distillation.learn(30, log_dir=str(tmp_path), save_interval=10)
+    assert stats["action_error"] < initial_error
+    assert distillation.beta == pytest.approx(0.9**30)
+    checkpoint = torch.load(tmp_path / "student_30.pt")
+    assert checkpoint["iter"] == 30
+    assert checkpoint["student_cfg"]["hidden_dims"] == [32]
+    assert (tmp_path / "student_0.pt").exists()
+
+
+def test_compare_evaluations():
+    teacher = {key: 2.0 for key in REGRESSION_KEYS}
+    student = {key: 3.0 for key in REGRESSION_KEYS}
+    teacher["landing_impulse_mean"] = 0.0
+    comparison = compare_evaluations(teacher, student)
+    assert comparison["episode_return_mean"] == {
+        "teacher": 2.0,
+        "student": 3.0,
+        "difference": 1.0,
+        "relative_difference": 0.5,
+    }
+    # the relative difference to a zero value of the teacher is undefined
+    assert comparison["landing_impulse_mean"]["difference"] == 3.0
+    assert math.isnan(comparison["landing_impulse_mean"]["relative_difference"])
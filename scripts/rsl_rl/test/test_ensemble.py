@@ -0,0 +1,31 @@
+"""Tests of the batched inference of several policies."""
+
+import pytest
+import torch
+
+from ensemble import StackedPolicies  # isort: skip
+
+
+def make_policy(seed: int, hidden_dim: int = 16) -> torch.nn.Module:
+    """Return a small MLP policy initialized with a seed."""
+    torch.manual_seed(seed)
+    return torch.nn.Sequential(torch.nn.Linear(8, hidden_dim), torch.nn.ELU(), torch.nn.Linear(hidden_dim, 3))
+
+
+def test_interleaved_policies():
+    policies = [make_policy(seed) for seed in range(3)]
+    stacked = StackedPolicies(policies)
+    obs = torch.randn(12, 8)
+    group_ids = stacked.group_ids(12, "cpu")
+    assert group_ids.tolist() == [0, 1, 2] * 4
+    with torch.inference_mode():
+        actions = stacked(obs)
+        expected = torch.stack([policies[group](obs[i]) for i, group in enumerate(group_ids.tolist())])
+    torch.testing.assert_close(actions, expected)
+
+
+def test_invalid_policies():
+    with pytest.raises(ValueError):
+        StackedPolicies([])
+    with pytest.raises(ValueError):
+        StackedPolicies([make_policy(0), make_policy(1, hidden_dim=32)])
@@ -0,0 +1,74 @@
+"""Tests of the parameter sweeps of a reward term."""
+
+import pytest
+import torch
+from types import SimpleNamespace
+
+# the sweeps import the scene entity configuration of Isaac Lab, but do not need the simulator
+pytest.importorskip("isaaclab")
+
+from sweep import apply_sweep, load_sweep  # noqa: E402  # isort: skip
+
+
+def foot_deceleration(env, velocity_threshold: float = 0.3, deceleration_weight: float = 0.5):
+    """Reward term with the default parameter values of the swept term."""
+
+
+class MockRewardManager:
+    """Reward manager holding the configuration of one reward term."""
+
+    def __init__(self):
+        self._term_cfgs = {"foot_deceleration": SimpleNamespace(func=foot_deceleration, params={})}
+
+    def get_term_cfg(self, term_name: str):
+        return self._term_cfgs[term_name]
+
+    def set_term_cfg(self, term_name: str, cfg):
+        self._term_cfgs[term_name] = cfg
+
+
+def write_sweep(tmp_path, text: str) -> str:
+    """Write a sweep file and return its path."""
+    path = tmp_path / "sweep.yaml"
+    path.write_text(text)
+    return str(path)
+
+
+def test_load_grid(tmp_path):
+    sweep = load_sweep(
+        write_sweep(tmp_path, "grid:\n  velocity_threshold: [0.2, 0.3]\n  deceleration_weight: [0.3, 0.5, 0.7]\n")
+    )
+    assert sweep["term"] == "foot_deceleration"
+    assert len(sweep["configs"]) == 6
+    assert sweep["configs"][0] == {"velocity_threshold": 0.2, "deceleration_weight": 0.3}
+    assert sweep["configs"][-1] == {"velocity_threshold": 0.3, "deceleration_weight": 0.7}
+
+
+def test_load_configs(tmp_path):
+    sweep = load_sweep(write_sweep(tmp_path, "term: other\nconfigs:\n  - {velocity_threshold: 0.2}\n  - {}\n"))
+    assert sweep == {"term": "other", "configs": [{"velocity_threshold": 0.2}, {}]}
+
+
+@pytest.mark.parametrize("text", ["term: foot_deceleration\n", "configs: []\ngrid: {}\n"])
+def test_load_invalid(tmp_path, text):
+    with pytest.raises(ValueError):
+        load_sweep(write_sweep(tmp_path, text))
+
+
+def test_apply_interleaved_groups():
+    env = SimpleNamespace(num_envs=8, device="cpu", reward_manager=MockRewardManager())
+    sweep = {"term": "foot_deceleration", "configs": [{"velocity_threshold": 0.2}, {"velocity_threshold": 0.5}, {}]}
+    group_ids = apply_sweep(env, sweep)
+    # the groups are interleaved so that every group is spread over all terrains
+    assert group_ids.tolist() == [0, 1, 2, 0, 1, 2, 0, 1]
+    params = env.reward_manager.get_term_cfg("foot_deceleration").params
+    # the settings that omit a parameter keep its default value
+    expected = torch.tensor([0.2, 0.5, 0.3])[group_ids]
+    torch.testing.assert_close(params["velocity_threshold"], expected)
+    assert "deceleration_weight" not in params
+
+
+def test_apply_too_many_settings():
+    env = SimpleNamespace(num_envs=2, device="cpu", reward_manager=MockRewardManager())
+    with pytest.raises(ValueError):
+        apply_sweep(env, {"term": "foot_deceleration", "configs": [{}, {}, {}]})
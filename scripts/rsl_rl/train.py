@@ -3,7 +3,16 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
-"""Script to train RL agent with RSL-RL."""
+"""Script to train RL agent with RSL-RL.
+
+With ``--distributed``, the script trains with one process per device, launched with ``torchrun``.
+``--num_envs`` is the total number of environments, which are split over the processes:
+
+.. code-block:: bash
+
+    torchrun --nnodes=1 --nproc_per_node=2 scripts/rsl_rl/train.py --task=<Task> --headless --distributed
+
+"""
 
 """Launch Isaac Sim Simulator first."""
 
@@ -20,11 +29,55 @@ import cli_args  # isort: skip
 parser = argparse.ArgumentParser(description="Train an RL agent with RSL-RL.")
 parser.add_argument("--video", action="store_true", default=False, help="Record videos during training.")
 parser.add_argument("--video_length", type=int, default=200, help="Length of the recorded video (in steps).")
+parser.add_argument(
+    "--video_stride", type=int, default=1, help="Number of steps between the recorded frames of the videos."
+)
 parser.add_argument("--video_interval", type=int, default=2000, help="Interval between video recordings (in steps).")
-parser.add_argument("--num_envs", type=int, default=None, help="Number of environments to simulate.")
+parser.add_argument(
+    "--num_envs",
+    type=int,
+    default=None,
+    help="Number of environments to simulate. Defaults to the number tuned by autotune.py, or that of the task.",
+)
 parser.add_argument("--task", type=str, default=None, help="Name of the task.")
 parser.add_argument("--seed", type=int, default=None, help="Seed used for the environment")
 parser.add_argument("--max_iterations", type=int, default=None, help="RL Policy training iterations.")
+parser.add_argument(
+    "--profile_rewards",
+    action="store_true",
+    default=False,
+    help="Record per-term reward latencies and save them to params/reward_profile.yaml.",
+)
+parser.add_argument(
+    "--sweep",
+    type=str,
+    default=None,
+    help="YAML file of reward parameter settings to train side by side on groups of environments.",
+)
+parser.add_argument(
+    "--instrument",
+    action="store_true",
+    default=False,
+    help="Log the time of the env steps, reward terms, policy inference and PPO updates of every iteration.",
+)
+parser.add_argument(
+    "--keep_last",
+    type=int,
+    default=None,
+    help="Number of most recent checkpoints to keep. All checkpoints are kept if not set.",
+)
+parser.add_argument(
+    "--keep_best",
+    type=int,
+    default=0,
+    help="Number of checkpoints with the highest mean reward to keep in addition to the last ones.",
+)
+parser.add_argument(
+    "--sync_checkpoints",
+    action="store_true",
+    default=False,
+    help="Write the checkpoints on the training thread instead of in the background.",
+)
 # append RSL-RL cli arguments
 cli_args.add_rsl_rl_args(parser)
 # append AppLauncher cli args
@@ -49,23 +102,29 @@ import os
 import torch
 from datetime import datetime
 
-from rsl_rl.runners import OnPolicyRunner
-
 from isaaclab.envs import (
     DirectMARLEnv,
     DirectMARLEnvCfg,
     DirectRLEnvCfg,
+    ManagerBasedRLEnv,
     ManagerBasedRLEnvCfg,
     multi_agent_to_single_agent,
 )
 from isaaclab.utils.dict import print_dict
 from isaaclab.utils.io import dump_pickle, dump_yaml
 from isaaclab_rl.rsl_rl import RslRlOnPolicyRunnerCfg, RslRlVecEnvWrapper
-from isaaclab_tasks.utils import get_checkpoint_path
 from isaaclab_tasks.utils.hydra import hydra_task_config
 
 # Import extensions to set up environment tasks
 import accrobotics.tasks  # noqa: F401
+from accrobotics.mdp import profile_reward_terms
+
+from autotune_cache import AutotuneCache  # isort: skip
+from checkpoint_index import get_checkpoint_path  # isort: skip
+from instrumentation import TrainingInstrumentation  # isort: skip
+from runners import CheckpointingRunner  # isort: skip
+from sweep import SweepMetricsWrapper, apply_sweep, load_sweep  # isort: skip
+from video import AsyncRecordVideo  # isort: skip
 
 torch.backends.cuda.matmul.allow_tf32 = True
 torch.backends.cudnn.allow_tf32 = True
@@ -88,6 +147,31 @@ def main(env_cfg: ManagerBasedRLEnvCfg | DirectRLEnvCfg | DirectMARLEnvCfg, agen
     env_cfg.seed = agent_cfg.seed
     env_cfg.sim.device = args_cli.device if args_cli.device is not None else env_cfg.sim.device
 
+    # use the number of environments tuned by autotune.py for the task on this hardware
+    if args_cli.num_envs is None:
+        tuned_num_envs = AutotuneCache().num_envs(args_cli.task, env_cfg.sim.device)
+        if tuned_num_envs is not None:
+            # the tuned number is per device, distributed training simulates on every device
+            world_size = int(os.getenv("WORLD_SIZE", "1")) if args_cli.distributed else 1
+            env_cfg.scene.num_envs = tuned_num_envs * world_size
+            print(f"[INFO] Using the tuned number of environments: {env_cfg.scene.num_envs}")
+
+    # distributed training: every process simulates its share of the environments on its own device
+    is_main_process = True
+    if args_cli.distributed:
+        world_size = int(os.getenv("WORLD_SIZE", "1"))
+        rank = int(os.getenv("RANK", "0"))
+        if env_cfg.sim.device.startswith("cuda"):
+            env_cfg.sim.device = f"cuda:{app_launcher.local_rank}"
+        agent_cfg.device = env_cfg.sim.device
+        num_envs = env_cfg.scene.num_envs
+        env_cfg.scene.num_envs = num_envs // world_size + int(rank < num_envs % world_size)
+        # offset the seeds to have diverse rollouts in the processes
+        agent_cfg.seed += rank
+        env_cfg.seed = agent_cfg.seed
+        is_main_process = rank == 0
+        print(f"[INFO] Process {rank}/{world_size} simulates {env_cfg.scene.num_envs} environments.")
+
     # specify directory for logging experiments
     log_root_path = os.path.join("logs", "rsl_rl", agent_cfg.experiment_name)
     log_root_path = os.path.abspath(log_root_path)
@@ -100,17 +184,33 @@ def main(env_cfg: ManagerBasedRLEnvCfg | DirectRLEnvCfg | DirectMARLEnvCfg, agen
 
     # create isaac environment
     env = gym.make(args_cli.task, cfg=env_cfg, render_mode="rgb_array" if args_cli.video else None)
+    # profile the reward terms
+    reward_profiler = None
+    if args_cli.profile_rewards and isinstance(env.unwrapped, ManagerBasedRLEnv):
+        print("[INFO] Profiling reward terms.")
+        reward_profiler = profile_reward_terms(env.unwrapped)
+    # assign the reward parameter settings of the sweep to groups of environments
+    sweep = None
+    if args_cli.sweep is not None:
+        if not isinstance(env.unwrapped, ManagerBasedRLEnv):
+            raise ValueError("Reward parameter sweeps are only supported for manager-based RL environments.")
+        sweep = load_sweep(args_cli.sweep)
+        print(f"[INFO] Sweeping {len(sweep['configs'])} settings of the reward term '{sweep['term']}'.")
+        group_ids = apply_sweep(env.unwrapped, sweep)
+        env = SweepMetricsWrapper(env, group_ids, len(sweep["configs"]), log_interval=agent_cfg.num_steps_per_env)
+        sweep_env = env
     # wrap for video recording
-    if args_cli.video:
+    if args_cli.video and is_main_process:
         video_kwargs = {
             "video_folder": os.path.join(log_dir, "videos", "train"),
             "step_trigger": lambda step: step % args_cli.video_interval == 0,
             "video_length": args_cli.video_length,
+            "frame_stride": args_cli.video_stride,
             "disable_logger": True,
         }
         print("[INFO] Recording videos during training.")
         print_dict(video_kwargs, nesting=4)
-        env = gym.wrappers.RecordVideo(env, **video_kwargs)
+        env = AsyncRecordVideo(env, **video_kwargs)
 
     # convert to single-agent instance if required by the RL algorithm
     if isinstance(env.unwrapped, DirectMARLEnv):
@@ -119,8 +219,21 @@ def main(env_cfg: ManagerBasedRLEnvCfg | DirectRLEnvCfg | DirectMARLEnvCfg, agen
     # wrap around environment for rsl-rl
     env = RslRlVecEnvWrapper(env)
 
-    # create runner from rsl-rl
-    runner = OnPolicyRunner(env, agent_cfg.to_dict(), log_dir=log_dir, device=agent_cfg.device)
+    # create runner from rsl-rl, writing the checkpoints in the background
+    runner = CheckpointingRunner(
+        env,
+        agent_cfg.to_dict(),
+        log_dir=log_dir,
+        device=agent_cfg.device,
+        keep_last=args_cli.keep_last,
+        keep_best=args_cli.keep_best,
+        asynchronous=not args_cli.sync_checkpoints,
+    )
+    # time the sections of every training iteration
+    instrumentation = None
+    if args_cli.instrument and is_main_process:
+        print("[INFO] Instrumenting the training iterations.")
+        instrumentation = TrainingInstrumentation(runner, log_dir)
     # write git state to logs
     runner.add_git_repo_to_log(__file__)
     # save resume path before creating a new log_dir
@@ -132,14 +245,28 @@ def main(env_cfg: ManagerBasedRLEnvCfg | DirectRLEnvCfg | DirectMARLEnvCfg, agen
         runner.load(resume_path)
 
     # dump the configuration into log-directory
-    dump_yaml(os.path.join(log_dir, "params", "env.yaml"), env_cfg)
-    dump_yaml(os.path.join(log_dir, "params", "agent.yaml"), agent_cfg)
-    dump_pickle(os.path.join(log_dir, "params", "env.pkl"), env_cfg)
-    dump_pickle(os.path.join(log_dir, "params", "agent.pkl"), agent_cfg)
+    if is_main_process:
+        dump_yaml(os.path.join(log_dir, "params", "env.yaml"), env_cfg)
+        dump_yaml(os.path.join(log_dir, "params", "agent.yaml"), agent_cfg)
+        dump_pickle(os.path.join(log_dir, "params", "env.pkl"), env_cfg)
+        dump_pickle(os.path.join(log_dir, "params", "agent.pkl"), agent_cfg)
+        if sweep is not None:
+            dump_yaml(os.path.join(log_dir, "params", "sweep.yaml"), sweep)
 
     # run training
     runner.learn(num_learning_iterations=agent_cfg.max_iterations, init_at_random_ep_len=True)
 
+    # dump the latencies of the training sections next to the configuration
+    if instrumentation is not None:
+        instrumentation.close()
+        dump_yaml(os.path.join(log_dir, "params", "training_profile.yaml"), instrumentation.summary())
+    # dump the reward term latencies next to the configuration
+    if reward_profiler is not None and is_main_process:
+        reward_profiler.dump(os.path.join(log_dir, "params", "reward_profile.yaml"))
+    # save the metrics of every sweep group over the last iteration
+    if sweep is not None and is_main_process:
+        sweep_env.save_summary(os.path.join(log_dir, "sweep.json"), sweep)
+
     # close the simulator
     env.close()
 
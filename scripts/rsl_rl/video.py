@@ -0,0 +1,174 @@
+"""Recording of videos with the encoding in a background thread.
+
+:class:`AsyncRecordVideo` replaces :class:`gymnasium.wrappers.RecordVideo` in the training and play
+scripts. Instead of keeping the frames of a recording in memory and encoding them in the step loop when
+the recording ends, the frames are copied into a queue and streamed to FFmpeg by a background thread.
+Only every ``frame_stride``-th step is rendered. The number of queued frames is bounded, and frames are
+dropped instead of blocking the step loop when the encoder cannot keep up. The messages starting and
+stopping the recordings are not bounded, so that they never block the step loop either.
+"""
+
+from __future__ import annotations
+
+import gymnasium as gym
+import numpy as np
+import os
+import queue
+import threading
+from collections.abc import Callable
+
+
+class AsyncRecordVideo(gym.Wrapper):
+    """Records videos of the rollouts every time the step trigger fires, encoding them in the background.
+
+    The videos are named ``<name_prefix>-step-<step>.mp4`` like those of
+    :class:`gymnasium.wrappers.RecordVideo`. The frame rate of the videos is divided by the frame stride,
+    so that they play in real time.
+    """
+
+    def __init__(
+        self,
+        env: gym.Env,
+        video_folder: str,
+        step_trigger: Callable[[int], bool],
+        video_length: int = 200,
+        name_prefix: str = "rl-video",
+        fps: int | None = None,
+        frame_stride: int = 1,
+        max_queue_size: int = 64,
+        disable_logger: bool = True,
+    ):
+        """Initialize the wrapper and start the encoding thread.
+
+        Args:
+            env: The environment, created with the "rgb_array" render mode.
+            video_folder: The directory of the videos.
+            step_trigger: Function of the step index returning whether to start a recording at that step.
+            video_length: The length of the recordings (in steps). Defaults to 200.
+            name_prefix: The prefix of the video files. Defaults to "rl-video".
+            fps: The frame rate of the environment. Defaults to None, in which case the ``render_fps``
+                of the environment metadata is used, or 30.
+            frame_stride: The number of steps between recorded frames. Defaults to 1.
+            max_queue_size: The maximum number of frames waiting to be encoded. Frames are dropped, without
+                rendering them, when that many are waiting. Defaults to 64.
+            disable_logger: Unused, the encoder never logs. Kept for compatibility with
+                :class:`gymnasium.wrappers.RecordVideo`. Defaults to True.
+
+        Raises:
+            ValueError: If the render mode of the environment does not return images, or if the frame
+                stride is smaller than 1.
+            ImportError: If MoviePy is not installed.
+        """
+        super().__init__(env)
+        if env.render_mode != "rgb_array":
+            raise ValueError(f"Recording videos requires the 'rgb_array' render mode, got '{env.render_mode}'.")
+        if frame_stride < 1:
+            raise ValueError(f"The frame stride must be at least 1, got {frame_stride}.")
+        try:
+            from moviepy.video.io.ffmpeg_writer import FFMPEG_VideoWriter
+        except ImportError as e:
+            raise ImportError("Recording videos requires MoviePy: pip install moviepy") from e
+
+        self.video_folder = os.path.abspath(video_folder)
+        os.makedirs(self.video_folder, exist_ok=True)
+        self.step_trigger = step_trigger
+        self.video_length = video_length
+        self.name_prefix = name_prefix
+        self.frame_stride = frame_stride
+        self.frames_per_sec = (fps or self.metadata.get("render_fps", 30)) / frame_stride
+        self.step_id = -1
+        self.recording = False
+        self.num_dropped_frames = 0
+        self._recorded_steps = 0
+        self._writer_cls = FFMPEG_VideoWriter
+        # the queue keeps the frames ordered with the start and stop messages, the semaphore bounds the frames
+        self._queue = queue.Queue()
+        self._frame_slots = threading.Semaphore(max_queue_size)
+        self._error: BaseException | None = None
+        self._thread = threading.Thread(target=self._encode, name="video-encoder", daemon=True)
+        self._thread.start()
+
+    def step(self, action):
+        """Step the environment and record its frame if a recording is running."""
+        obs, reward, terminated, truncated, info = self.env.step(action)
+        self.step_id += 1
+        if self.step_trigger(self.step_id):
+            self.start_recording(f"{self.name_prefix}-step-{self.step_id}")
+        if self.recording:
+            if self._recorded_steps % self.frame_stride == 0:
+                self._capture_frame()
+            self._recorded_steps += 1
+            if self._recorded_steps > self.video_length:
+                self.stop_recording()
+        return obs, reward, terminated, truncated, info
+
+    def close(self):
+        """Finish the running recording, wait for the encoding and close the environment."""
+        if self.recording:
+            self.stop_recording()
+        self._queue.put(None)
+        self._thread.join()
+        super().close()
+        if self._error is not None:
+            raise RuntimeError("Encoding the videos failed.") from self._error
+
+    def start_recording(self, video_name: str):
+        """Start a new recording, finishing the running one.
+
+        Args:
+            video_name: The name of the video file, without extension.
+        """
+        if self.recording:
+            self.stop_recording()
+        self._queue.put(("start", os.path.join(self.video_folder, f"{video_name}.mp4")))
+        self.recording = True
+        self._recorded_steps = 0
+
+    def stop_recording(self):
+        """Finish the running recording. The video is completed once its frames are encoded."""
+        self._queue.put(("stop", None))
+        self.recording = False
+
+    """
+    Helper functions.
+    """
+
+    def _capture_frame(self):
+        """Render a frame and queue it, dropping it if too many frames are waiting to be encoded."""
+        if not self._frame_slots.acquire(blocking=False):
+            self.num_dropped_frames += 1
+            return
+        frame = self.env.render()
+        if not isinstance(frame, np.ndarray):
+            self._frame_slots.release()
+            self.stop_recording()
+            raise ValueError(f"Expected the rendered frame to be a numpy array, got {type(frame).__name__}.")
+        # copy the frame, the renderer may reuse its buffer
+        self._queue.put(("frame", np.array(frame[..., :3], dtype=np.uint8)))
+
+    def _encode(self):
+        """Stream the queued frames to the video files, until the closing sentinel."""
+        writer, path = None, None
+        while (message := self._queue.get()) is not None:
+            kind, value = message
+            if kind == "frame":
+                self._frame_slots.release()
+            if self._error is not None:
+                continue
+            try:
+                if kind == "start":
+                    path = value
+                elif kind == "frame" and path is not None:
+                    if writer is None:
+                        height, width = value.shape[:2]
+                        writer = self._writer_cls(path, (width, height), self.frames_per_sec, codec="libx264")
+                    writer.write_frame(value)
+                elif kind == "stop":
+                    if writer is not None:
+                        writer.close()
+                    writer, path = None, None
+            except BaseException as e:
+                # keep consuming the queue so that the step loop is never blocked
+                self._error = e
+        if writer is not None:
+            writer.close()
@@ -0,0 +1,6 @@
+"""
+Standalone CPU inference of the exported policies, independent of Isaac Sim and Isaac Lab.
+"""
+
+from .control import *
+from .runtime import *
@@ -0,0 +1,74 @@
+"""
+Fixed-rate control loop driving an inference runtime.
+
+The loop wakes up on absolute deadlines of a fixed period, reads an observation, evaluates the policy
+and hands the actions over. It reports the inference latency percentiles, the wake-up jitter and the
+number of periods in which the step did not finish before the next deadline.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import time
+from collections.abc import Callable
+
+from .runtime import PolicyRuntime
+
+GO2_CONTROL_RATE_HZ = 50.0
+"""Rate of the Go2 locomotion policies (Hz), i.e. the environment step rate of the tasks."""
+
+
+def run_control_loop(
+    policy: PolicyRuntime,
+    get_observation: Callable[[], np.ndarray],
+    apply_action: Callable[[np.ndarray], None] | None = None,
+    rate_hz: float = GO2_CONTROL_RATE_HZ,
+    num_steps: int = 500,
+) -> dict[str, float]:
+    """Run the policy at a fixed rate and report its timing.
+
+    Args:
+        policy: The inference runtime.
+        get_observation: Returns the observation of the current step.
+        apply_action: Receives the actions of the current step. Defaults to None.
+        rate_hz: Control rate (Hz). Defaults to the rate of the Go2 policies.
+        num_steps: Number of control steps. Defaults to 500.
+
+    Returns:
+        The latency summary of the policy over the loop, the mean and maximum wake-up jitter (in us),
+        the number of overruns and the utilization of the period by the 99th percentile step latency.
+    """
+    period_ns = int(1e9 / rate_hz)
+    jitter_us = np.zeros(num_steps, dtype=np.float64)
+    step_us = np.zeros(num_steps, dtype=np.float64)
+    num_overruns = 0
+    policy.reset_latencies()
+
+    deadline = time.perf_counter_ns() + period_ns
+    for step in range(num_steps):
+        # sleep coarsely, then spin until the deadline
+        remaining_ns = deadline - time.perf_counter_ns()
+        if remaining_ns > 1_000_000:
+            time.sleep((remaining_ns - 1_000_000) / 1e9)
+        while (now := time.perf_counter_ns()) < deadline:
+            pass
+        jitter_us[step] = (now - deadline) / 1e3
+        actions = policy(get_observation())
+        if apply_action is not None:
+            apply_action(actions)
+        end = time.perf_counter_ns()
+        step_us[step] = (end - now) / 1e3
+        deadline += period_ns
+        # skip the missed periods instead of running late steps back to back
+        if end > deadline:
+            num_overruns += 1
+            deadline += (end - deadline) // period_ns * period_ns + period_ns
+
+    summary = policy.latency_summary()
+    summary["rate_hz"] = rate_hz
+    summary["step_p99_us"] = float(np.percentile(step_us, 99.0))
+    summary["jitter_mean_us"] = float(jitter_us.mean())
+    summary["jitter_max_us"] = float(jitter_us.max())
+    summary["num_overruns"] = num_overruns
+    summary["utilization_p99"] = summary["step_p99_us"] / (period_ns / 1e3)
+    return summary
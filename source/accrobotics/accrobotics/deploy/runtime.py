@@ -0,0 +1,230 @@
+"""
+CPU inference runtimes for the policies exported by ``scripts/rsl_rl/play.py``.
+
+The runtimes load ``policy.pt`` (TorchScript) or ``policy.onnx`` (ONNX Runtime) and evaluate them on
+preallocated observation and action buffers. The latency of every call is kept in a fixed-size ring
+buffer from which percentiles are reported. Only PyTorch and NumPy are required, ONNX Runtime is
+imported when an ONNX policy is loaded.
+"""
+
+from __future__ import annotations
+
+import abc
+import contextlib
+import numpy as np
+import os
+import time
+import torch
+
+
+class PolicyRuntime(abc.ABC):
+    """Base class of the inference runtimes.
+
+    The observations are copied into a preallocated input buffer of shape (batch_size, num_obs) and the
+    actions are written into a preallocated output buffer of shape (batch_size, num_actions). The
+    returned actions are a view of the output buffer and are overwritten by the next call.
+    """
+
+    LATENCY_HISTORY = 10000
+    """Number of most recent calls whose latencies are kept for the percentiles."""
+
+    def __init__(self, num_obs: int, num_actions: int, batch_size: int = 1):
+        self.num_obs = num_obs
+        self.num_actions = num_actions
+        self.batch_size = batch_size
+        self.obs = np.zeros((batch_size, num_obs), dtype=np.float32)
+        self.actions = np.zeros((batch_size, num_actions), dtype=np.float32)
+        self.num_calls = 0
+        self._latencies_us = np.zeros(self.LATENCY_HISTORY, dtype=np.float64)
+
+    def __call__(self, obs: np.ndarray) -> np.ndarray:
+        """Compute the actions of a single observation or of a batch of observations.
+
+        Args:
+            obs: The observations. Shape is (num_obs,) or (batch_size, num_obs).
+
+        Returns:
+            The actions, with the same leading dimensions as the observations.
+        """
+        start = time.perf_counter_ns()
+        self.obs[...] = obs
+        self._infer()
+        self._latencies_us[self.num_calls % self.LATENCY_HISTORY] = (time.perf_counter_ns() - start) / 1e3
+        self.num_calls += 1
+        return self.actions[0] if np.ndim(obs) == 1 else self.actions
+
+    def latency_summary(self) -> dict[str, float]:
+        """Return the mean, median, 99th percentile and maximum latency (in us) of the recent calls."""
+        latencies = self._latencies_us[: min(self.num_calls, self.LATENCY_HISTORY)]
+        if len(latencies) == 0:
+            return {"num_calls": 0}
+        p50, p99 = np.percentile(latencies, [50.0, 99.0])
+        return {
+            "num_calls": self.num_calls,
+            "mean_us": float(latencies.mean()),
+            "p50_us": float(p50),
+            "p99_us": float(p99),
+            "max_us": float(latencies.max()),
+        }
+
+    def reset_latencies(self):
+        """Discard the recorded latencies, e.g. after warming up."""
+        self.num_calls = 0
+
+    @abc.abstractmethod
+    def _infer(self):
+        """Evaluate the policy on :attr:`obs` and write the result into :attr:`actions`."""
+
+
+class TorchScriptRuntime(PolicyRuntime):
+    """Runtime for policies exported with :func:`isaaclab_rl.rsl_rl.export_policy_as_jit`."""
+
+    def __init__(self, path: str, batch_size: int = 1, num_threads: int | None = None):
+        """Load the policy.
+
+        Args:
+            path: Path to the TorchScript file.
+            batch_size: Number of observations evaluated per call. Defaults to 1.
+            num_threads: Number of intra-op threads of PyTorch, which is a setting of the whole process.
+                Defaults to None, which keeps the current setting. To limit the threads only while
+                measuring, use :func:`torch_num_threads` instead.
+        """
+        if num_threads is not None:
+            torch.set_num_threads(num_threads)
+        module = torch.jit.load(path, map_location="cpu").eval()
+        num_obs, num_actions = _linear_dims(module)
+        self.module = torch.jit.optimize_for_inference(torch.jit.freeze(module))
+        super().__init__(num_obs, num_actions, batch_size)
+        # the tensors share the memory of the numpy buffers
+        self._obs = torch.from_numpy(self.obs)
+        self._actions = torch.from_numpy(self.actions)
+
+    def _infer(self):
+        with torch.inference_mode():
+            self._actions.copy_(self.module(self._obs))
+
+
+class OnnxRuntime(PolicyRuntime):
+    """Runtime for policies exported with :func:`isaaclab_rl.rsl_rl.export_policy_as_onnx`.
+
+    The buffers are bound to the ONNX Runtime session, so that calls do not allocate.
+    """
+
+    def __init__(self, path: str, batch_size: int = 1, num_threads: int | None = 1):
+        """Load the policy.
+
+        Args:
+            path: Path to the ONNX file.
+            batch_size: Number of observations evaluated per call. Defaults to 1.
+            num_threads: Number of intra-op threads of ONNX Runtime. Defaults to 1, None lets ONNX
+                Runtime decide.
+
+        Raises:
+            ImportError: If ONNX Runtime is not installed.
+            ValueError: If the exported model has a fixed batch size different from ``batch_size``.
+        """
+        try:
+            import onnxruntime
+        except ImportError as e:
+            raise ImportError("ONNX policies require onnxruntime: pip install onnxruntime") from e
+
+        options = onnxruntime.SessionOptions()
+        options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if num_threads is not None:
+            options.intra_op_num_threads = num_threads
+            options.inter_op_num_threads = 1
+        self.session = onnxruntime.InferenceSession(path, options, providers=["CPUExecutionProvider"])
+        model_input, model_output = self.session.get_inputs()[0], self.session.get_outputs()[0]
+        if isinstance(model_input.shape[0], int) and model_input.shape[0] != batch_size:
+            raise ValueError(
+                f"The exported policy has a fixed batch size of {model_input.shape[0]}, got batch size {batch_size}."
+            )
+        super().__init__(model_input.shape[1], model_output.shape[1], batch_size)
+        self._binding = self.session.io_binding()
+        self._binding.bind_cpu_input(model_input.name, self.obs)
+        self._binding.bind_output(
+            model_output.name,
+            device_type="cpu",
+            device_id=0,
+            element_type=np.float32,
+            shape=self.actions.shape,
+            buffer_ptr=self.actions.ctypes.data,
+        )
+
+    def _infer(self):
+        self.session.run_with_iobinding(self._binding)
+
+
+def load_policy(path: str, batch_size: int = 1, num_threads: int | None = None) -> PolicyRuntime:
+    """Load an exported policy with the runtime matching its file extension.
+
+    Args:
+        path: Path to ``policy.pt`` or ``policy.onnx``.
+        batch_size: Number of observations evaluated per call. Defaults to 1.
+        num_threads: Number of intra-op threads. Defaults to None, which keeps the current setting of
+            PyTorch or lets ONNX Runtime decide.
+
+    Returns:
+        The runtime of the policy.
+
+    Raises:
+        ValueError: If the file extension is neither ``.pt`` nor ``.onnx``.
+    """
+    extension = os.path.splitext(path)[1]
+    if extension == ".pt":
+        return TorchScriptRuntime(path, batch_size, num_threads)
+    if extension == ".onnx":
+        return OnnxRuntime(path, batch_size, num_threads)
+    raise ValueError(f"Unsupported policy file '{path}', expected a '.pt' or '.onnx' file.")
+
+
+@contextlib.contextmanager
+def torch_num_threads(num_threads: int | None):
+    """Set the number of intra-op threads of PyTorch within the context and restore it on exit.
+
+    Args:
+        num_threads: Number of intra-op threads. None keeps the current setting.
+    """
+    previous = torch.get_num_threads()
+    if num_threads is not None:
+        torch.set_num_threads(num_threads)
+    try:
+        yield
+    finally:
+        torch.set_num_threads(previous)
+
+
+def measure_latency(
+    policy: PolicyRuntime, observations: np.ndarray, num_calls: int = 1000, warmup: int = 50
+) -> dict[str, float]:
+    """Measure the latency of a runtime on single observations, as in the control loop.
+
+    Args:
+        policy: The runtime of the policy.
+        observations: The observations, evaluated one after the other. Shape is (num_samples, num_obs).
+        num_calls: Number of timed calls. Defaults to 1000.
+        warmup: Number of untimed calls before the timed ones. Defaults to 50.
+
+    Returns:
+        The latency summary of the timed calls, see :meth:`PolicyRuntime.latency_summary`.
+    """
+    for index in range(warmup):
+        policy(observations[index % len(observations)])
+    policy.reset_latencies()
+    for index in range(num_calls):
+        policy(observations[index % len(observations)])
+    return policy.latency_summary()
+
+
+def _linear_dims(module: torch.jit.ScriptModule) -> tuple[int, int]:
+    """Return the input size of the first and the output size of the last linear layer of the actor.
+
+    Policies whose actor has no plain linear layers, such as the quantized exports, store the sizes
+    as the ``num_obs`` and ``num_actions`` attributes of the module.
+    """
+    if hasattr(module, "num_obs") and hasattr(module, "num_actions"):
+        return int(module.num_obs), int(module.num_actions)
+    weights = [param for name, param in module.named_parameters() if name.startswith("actor.") and param.dim() == 2]
+    if not weights:
+        raise ValueError("The TorchScript policy has no linear layers in its 'actor' module.")
+    return weights[0].shape[1], weights[-1].shape[0]
@@ -5,4 +5,9 @@ This module contains reward functions, curriculum implementations, and other
 MDP-related utilities used across different task environments.
 """
 
-from .rewards import *
\ No newline at end of file
+from .curriculums import *
+from .features import *
+from .params import *
+from .profiling import *
+from .rewards import *
+from .stats import *
\ No newline at end of file
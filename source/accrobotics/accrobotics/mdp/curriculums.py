@@ -0,0 +1,103 @@
+"""
+Curriculum terms that adapt the reward terms of this package during training.
+
+The curricula write the parameter tensors of the reward terms in place (see :mod:`.params`), so
+they run entirely on the device. They return None, so that the curriculum manager does not read a
+state back from the device on every reset.
+"""
+
+from __future__ import annotations
+
+import torch
+import weakref
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
+from .params import term_param
+
+if TYPE_CHECKING:
+    from isaaclab.envs import ManagerBasedRLEnv
+
+
+class _QuietnessState:
+    """Device state of :func:`quietness_curriculum` for one reward term."""
+
+    def __init__(self, env: ManagerBasedRLEnv, reward_term_name: str):
+        # progress of the curriculum in [0, 1] and moving average of the normalized tracking reward
+        self.level = torch.zeros((), device=env.device)
+        self.tracking = torch.zeros((), device=env.device)
+        # the phase weights of the term configuration are scaled by the curriculum
+        self.deceleration_weight = term_param(env, reward_term_name, "deceleration_weight", shape=())
+        self.landing_weight = term_param(env, reward_term_name, "landing_weight", shape=())
+        self.velocity_threshold = term_param(env, reward_term_name, "velocity_threshold", shape=())
+        self.base_deceleration_weight = self.deceleration_weight.clone()
+        self.base_landing_weight = self.landing_weight.clone()
+
+
+# curriculum states are owned by the environment and kept per reward term
+_quietness_states: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def quietness_curriculum(
+    env: ManagerBasedRLEnv,
+    env_ids: Sequence[int] | torch.Tensor,
+    reward_term_name: str = "foot_deceleration",
+    tracking_term_name: str = "track_lin_vel_xy_exp",
+    promotion_threshold: float = 0.8,
+    demotion_threshold: float = 0.5,
+    rate: float = 0.05,
+    weight_scale_range: tuple[float, float] = (0.1, 1.0),
+    velocity_threshold_range: tuple[float, float] = (0.5, 0.3),
+) -> None:
+    """Anneal the foot deceleration reward with the velocity tracking performance.
+
+    The curriculum keeps a moving average of the velocity tracking reward of the finished episodes,
+    normalized by its maximum over an episode, and a level in [0, 1]. The level rises while the
+    average is above ``promotion_threshold`` and falls while it is below ``demotion_threshold``, by
+    ``rate`` per ``num_envs`` finished episodes. The level interpolates:
+
+    - the scale of the phase weights of the foot deceleration term, which scales the whole term, and
+    - the velocity threshold of the term, from lenient to strict.
+
+    Starting with a low weight lets the policy acquire a gait before the quietness pressure rises.
+
+    Args:
+        env: The environment instance.
+        env_ids: The environments being reset.
+        reward_term_name: The name of the :func:`foot_deceleration_swing_phase` reward term.
+        tracking_term_name: The name of the velocity tracking reward term.
+        promotion_threshold: Normalized tracking reward above which the level rises.
+        demotion_threshold: Normalized tracking reward below which the level falls.
+        rate: Change of the level per ``num_envs`` finished episodes.
+        weight_scale_range: Scale of the phase weights at level 0 and at level 1.
+        velocity_threshold_range: Velocity threshold (m/s) at level 0 and at level 1.
+    """
+    # the initial reset has no finished episodes
+    if env.common_step_counter == 0 or len(env_ids) == 0:
+        return None
+    env_states = _quietness_states.setdefault(env, {})
+    if reward_term_name not in env_states:
+        env_states[reward_term_name] = _QuietnessState(env, reward_term_name)
+    state = env_states[reward_term_name]
+
+    # the episode sums are read before the reward manager resets them
+    reward_manager = env.reward_manager
+    tracking_weight = reward_manager.get_term_cfg(tracking_term_name).weight
+    episode_tracking = reward_manager._episode_sums[tracking_term_name][env_ids]
+    tracking = episode_tracking.mean() / (tracking_weight * env.max_episode_length_s)
+    # average over roughly the last num_envs episodes
+    finished_fraction = min(len(env_ids) / env.num_envs, 1.0)
+    state.tracking.lerp_(tracking, finished_fraction)
+
+    # move the level and write the term parameters in place
+    step = rate * finished_fraction
+    state.level.add_((state.tracking > promotion_threshold).float() * step)
+    state.level.sub_((state.tracking < demotion_threshold).float() * step)
+    state.level.clamp_(0.0, 1.0)
+    scale = weight_scale_range[0] + (weight_scale_range[1] - weight_scale_range[0]) * state.level
+    torch.mul(state.base_deceleration_weight, scale, out=state.deceleration_weight)
+    torch.mul(state.base_landing_weight, scale, out=state.landing_weight)
+    state.velocity_threshold.copy_(
+        velocity_threshold_range[0] + (velocity_threshold_range[1] - velocity_threshold_range[0]) * state.level
+    )
+    return None
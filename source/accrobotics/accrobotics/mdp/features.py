@@ -0,0 +1,217 @@
+"""
+Step-scoped cache of foot kinematics and contact features shared between MDP terms.
+
+Several foot-related terms gather the same bodies out of the contact sensor and articulation buffers
+and reduce them in the same way. The cache in this module computes each feature at most once per
+environment step for a given contact sensor and body selection, and returns the same tensors to
+every term that asks for them during that step.
+
+Body selections are resolved once per environment into an index that avoids host-to-device
+transfers: a slice view when the body indices are contiguous and a device index tensor otherwise.
+
+The landing impact features estimate how hard the feet hit the ground from the net contact force
+history of the sensor. They are a closer proxy of the impact noise than the foot speeds, and are
+computed for all environments and feet at once.
+"""
+
+from __future__ import annotations
+
+import functools
+import torch
+import weakref
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from isaaclab.envs import ManagerBasedRLEnv
+    from isaaclab.managers import SceneEntityCfg
+    from isaaclab.sensors import ContactSensor
+
+
+class FootFeatures:
+    """Foot features of one contact sensor body selection at one environment step.
+
+    Features are computed on first access and cached until the end of the step. The returned tensors
+    are shared between terms and must not be modified in place.
+    """
+
+    def __init__(self, env: ManagerBasedRLEnv, sensor_cfg: SceneEntityCfg):
+        self._env = env
+        self._sensor: ContactSensor = env.scene.sensors[sensor_cfg.name]
+        self._body_ids = resolve_body_index(env, sensor_cfg)
+        self._foot_velocities: dict[str, torch.Tensor] = {}
+        self._foot_speeds: dict[str, torch.Tensor] = {}
+
+    @functools.cached_property
+    def current_air_time(self) -> torch.Tensor:
+        """Time the feet have been in the air since the last contact (s). Shape is (num_envs, num_feet)."""
+        return self._sensor.data.current_air_time[:, self._body_ids]
+
+    @functools.cached_property
+    def last_air_time(self) -> torch.Tensor:
+        """Duration of the previous swing phase of the feet (s). Shape is (num_envs, num_feet)."""
+        return self._sensor.data.last_air_time[:, self._body_ids]
+
+    @functools.cached_property
+    def current_contact_time(self) -> torch.Tensor:
+        """Time the feet have been in contact since the last lift-off (s). Shape is (num_envs, num_feet)."""
+        return self._sensor.data.current_contact_time[:, self._body_ids]
+
+    @functools.cached_property
+    def first_contact(self) -> torch.Tensor:
+        """Whether the feet made contact during the last environment step. Shape is (num_envs, num_feet)."""
+        return self._sensor.compute_first_contact(self._env.step_dt)[:, self._body_ids]
+
+    @functools.cached_property
+    def contact_force_history(self) -> torch.Tensor:
+        """Magnitudes of the net contact forces of the feet, most recent first (N).
+
+        Shape is (num_envs, history_length, num_feet).
+        """
+        return torch.linalg.vector_norm(self._sensor.data.net_forces_w_history[:, :, self._body_ids], dim=-1)
+
+    @functools.cached_property
+    def landing_forces(self) -> torch.Tensor:
+        """Contact force history of the feet since their touchdown during the last step (N).
+
+        History samples older than the touchdown and feet that did not land are zero. The samples of a
+        touchdown older than the history are lost, see :func:`history_sample_ages`. Shape is
+        (num_envs, history_length, num_feet).
+        """
+        sample_ages, sample_dt = history_sample_ages(self._env, self._sensor)
+        # the contact time is one sample period at the touchdown sample, so the samples since the
+        # touchdown are younger than the contact time minus one period, up to rounding
+        since_touchdown = sample_ages.view(1, -1, 1) < self.current_contact_time.unsqueeze(1) - 0.5 * sample_dt
+        since_touchdown &= self.first_contact.unsqueeze(1)
+        return self.contact_force_history * since_touchdown
+
+    @functools.cached_property
+    def landing_peak_force(self) -> torch.Tensor:
+        """Peak contact force of the feet that landed during the last step (N), zero for the other feet.
+
+        Shape is (num_envs, num_feet).
+        """
+        return self.landing_forces.amax(dim=1)
+
+    @functools.cached_property
+    def landing_impulse(self) -> torch.Tensor:
+        """Contact impulse of the feet that landed during the last step (N s), zero for the other feet.
+
+        The impulse integrates the contact force history since the touchdown, which only covers the
+        duration of the history. Shape is (num_envs, num_feet).
+        """
+        _, sample_dt = history_sample_ages(self._env, self._sensor)
+        return self.landing_forces.sum(dim=1) * sample_dt
+
+    def foot_velocities(self, asset_cfg: SceneEntityCfg) -> torch.Tensor:
+        """Linear velocities of the feet in the world frame (m/s). Shape is (num_envs, num_feet, 3).
+
+        Args:
+            asset_cfg: The articulation whose body velocities are gathered. The bodies are selected
+                with the body indices of the contact sensor.
+        """
+        if asset_cfg.name not in self._foot_velocities:
+            robot = self._env.scene[asset_cfg.name]
+            self._foot_velocities[asset_cfg.name] = robot.data.body_lin_vel_w[:, self._body_ids, :]
+        return self._foot_velocities[asset_cfg.name]
+
+    def foot_speeds(self, asset_cfg: SceneEntityCfg) -> torch.Tensor:
+        """Linear speeds of the feet in the world frame (m/s). Shape is (num_envs, num_feet).
+
+        Args:
+            asset_cfg: The articulation whose body velocities are gathered.
+        """
+        if asset_cfg.name not in self._foot_speeds:
+            self._foot_speeds[asset_cfg.name] = torch.linalg.vector_norm(self.foot_velocities(asset_cfg), dim=-1)
+        return self._foot_speeds[asset_cfg.name]
+
+
+# cache entries are owned by the environment so they are released together with it
+_feature_cache: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_index_cache: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_history_cache: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def resolve_body_index(env: ManagerBasedRLEnv, entity_cfg: SceneEntityCfg) -> slice | torch.Tensor:
+    """Return the cached index selecting the bodies of a scene entity configuration.
+
+    Indexing with the list of body indices of a resolved :class:`SceneEntityCfg` copies the list to the
+    device and performs a general gather on every call. The index returned here is computed once per
+    environment and selection: contiguous body indices become a slice, so that indexing returns a view,
+    and other selections become an index tensor on the environment's device.
+
+    Args:
+        env: The environment instance.
+        entity_cfg: The resolved scene entity configuration.
+
+    Returns:
+        The slice or device index tensor selecting the bodies.
+    """
+    body_ids = entity_cfg.body_ids
+    if isinstance(body_ids, slice):
+        return body_ids
+    key = (entity_cfg.name, tuple(body_ids))
+    env_cache = _index_cache.setdefault(env, {})
+    if key not in env_cache:
+        start = body_ids[0] if len(body_ids) > 0 else 0
+        if list(body_ids) == list(range(start, start + len(body_ids))):
+            env_cache[key] = slice(start, start + len(body_ids))
+        else:
+            env_cache[key] = torch.tensor(body_ids, dtype=torch.long, device=env.device)
+    return env_cache[key]
+
+
+def history_sample_ages(env: ManagerBasedRLEnv, sensor: ContactSensor) -> tuple[torch.Tensor, float]:
+    """Return the cached ages of the contact force history samples of a sensor and their period.
+
+    Sensors with a history are updated at every physics step, also in scenes with lazy sensor updates,
+    and append a sample to their history on every update. The samples are therefore the physics time
+    step apart, or the update period of the sensor if it is longer.
+
+    The history only covers ``history_length`` samples. With the Go2 contact sensor, three samples of
+    5 ms cover 15 ms of the 20 ms environment step, so the forces of a touchdown early in the step
+    are not in the history anymore when the terms are evaluated.
+
+    Args:
+        env: The environment instance.
+        sensor: The contact sensor.
+
+    Returns:
+        The ages of the samples (s), on the environment's device, and the sample period (s). The ages
+        have shape (history_length,), the most recent sample having age zero.
+
+    Raises:
+        ValueError: If the sensor does not keep a contact force history.
+    """
+    env_cache = _history_cache.setdefault(env, {})
+    if id(sensor) not in env_cache:
+        history = sensor.data.net_forces_w_history
+        if history is None or history.shape[1] == 0:
+            raise ValueError("The contact sensor does not keep a contact force history, set its 'history_length'.")
+        sample_dt = max(sensor.cfg.update_period, env.physics_dt)
+        sample_ages = torch.arange(history.shape[1], device=env.device, dtype=torch.float32) * sample_dt
+        env_cache[id(sensor)] = (sample_ages, sample_dt)
+    return env_cache[id(sensor)]
+
+
+def foot_features(env: ManagerBasedRLEnv, sensor_cfg: SceneEntityCfg) -> FootFeatures:
+    """Return the foot features of the current environment step.
+
+    The features are keyed on the contact sensor, the selected bodies and the environment's step
+    counter, so that all terms evaluated during the same step share them.
+
+    Args:
+        env: The environment instance.
+        sensor_cfg: Configuration for the contact sensor, with the feet selected as bodies.
+
+    Returns:
+        The foot features of the current step.
+    """
+    body_ids = sensor_cfg.body_ids
+    body_key = (body_ids.start, body_ids.stop, body_ids.step) if isinstance(body_ids, slice) else tuple(body_ids)
+    key = (sensor_cfg.name, body_key)
+    env_cache = _feature_cache.setdefault(env, {})
+    step, features = env_cache.get(key, (None, None))
+    if step != env.common_step_counter:
+        features = FootFeatures(env, sensor_cfg)
+        env_cache[key] = (env.common_step_counter, features)
+    return features
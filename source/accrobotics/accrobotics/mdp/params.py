@@ -0,0 +1,103 @@
+"""
+Term parameters given either as Python scalars or as per-environment device tensors.
+
+Thresholds and weights of the terms in this package accept a Python scalar shared by all
+environments, a tensor of shape (num_envs,) or, for foot terms, a tensor of shape (num_envs, num_feet).
+Scalars are converted once per environment into cached device tensors, so that evaluating a term
+never copies parameters from the host.
+
+Parameter tensors stored in the term configurations are read on every step, which makes them
+updatable in place, e.g. by a curriculum, without rebuilding the configuration.
+"""
+
+from __future__ import annotations
+
+import copy
+import inspect
+import torch
+import weakref
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from isaaclab.envs import ManagerBasedRLEnv
+
+
+# scalar parameters are owned by the environment so they are released together with it
+_scalar_params: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def foot_param(env: ManagerBasedRLEnv, value: float | torch.Tensor) -> torch.Tensor:
+    """Return a term parameter as a tensor broadcastable to the (num_envs, num_feet) foot buffers.
+
+    Args:
+        env: The environment instance.
+        value: A Python scalar, or a tensor of shape (num_envs,) or (num_envs, num_feet).
+
+    Returns:
+        A cached 0-dim tensor for scalars, a (num_envs, 1) view for per-environment tensors and the
+        tensor itself for per-foot tensors. Cached scalar tensors are shared and must not be modified.
+
+    Raises:
+        ValueError: If the leading dimension of a tensor is not the number of environments.
+    """
+    if isinstance(value, torch.Tensor):
+        if value.dim() > 0 and value.shape[0] != env.num_envs:
+            raise ValueError(
+                f"Expected a parameter tensor with {env.num_envs} environments, got shape {tuple(value.shape)}."
+            )
+        return value.unsqueeze(-1) if value.dim() == 1 else value
+    env_params = _scalar_params.setdefault(env, {})
+    if value not in env_params:
+        env_params[value] = torch.tensor(float(value), device=env.device)
+    return env_params[value]
+
+
+def term_param(
+    env: ManagerBasedRLEnv, term_name: str, param_name: str, shape: tuple[int, ...] | None = None
+) -> torch.Tensor:
+    """Return the tensor of a reward term parameter, for updating it in place.
+
+    A parameter that is still a scalar, or that is not set and uses the default value of the term
+    function, is replaced once by a tensor filled with its value. The replacement is made in a copy
+    of the term configuration, so that the environment configuration keeps the scalar value.
+
+    Args:
+        env: The environment instance.
+        term_name: The name of the reward term.
+        param_name: The name of the parameter.
+        shape: The shape of the tensor replacing a scalar. Defaults to None, in which case it is
+            (num_envs,).
+
+    Returns:
+        The parameter tensor read by the term on every step.
+    """
+    reward_manager = env.reward_manager
+    term_cfg = reward_manager.get_term_cfg(term_name)
+    value = term_cfg.params.get(param_name)
+    if isinstance(value, torch.Tensor):
+        return value
+    if value is None:
+        value = inspect.signature(term_cfg.func).parameters[param_name].default
+    term_cfg = copy.copy(term_cfg)
+    term_cfg.params = dict(term_cfg.params)
+    shape = (env.num_envs,) if shape is None else shape
+    term_cfg.params[param_name] = torch.full(shape, float(value), device=env.device)
+    reward_manager.set_term_cfg(term_name, term_cfg)
+    return term_cfg.params[param_name]
+
+
+def set_term_param(env: ManagerBasedRLEnv, term_name: str, param_name: str, value: float | torch.Tensor):
+    """Set a reward term parameter in place.
+
+    Args:
+        env: The environment instance.
+        term_name: The name of the reward term.
+        param_name: The name of the parameter.
+        value: A Python scalar written to all environments, or a device tensor broadcastable to the
+            parameter tensor.
+    """
+    param = term_param(env, term_name, param_name)
+    if isinstance(value, torch.Tensor):
+        param.copy_(value)
+    else:
+        param.fill_(value)
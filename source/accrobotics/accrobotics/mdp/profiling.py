@@ -0,0 +1,251 @@
+"""
+Latency profiling of MDP terms.
+
+The profiler wraps term functions with optional timing: CUDA events when the environment runs on a
+CUDA device and :func:`time.perf_counter_ns` on the host. Event timings are resolved lazily once the
+events have completed, so profiling does not add device synchronizations to the step. Latencies
+are aggregated into per-term histograms that can be dumped next to the run configuration.
+"""
+
+from __future__ import annotations
+
+import bisect
+import functools
+import math
+import os
+import time
+import torch
+import yaml
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from isaaclab.envs import ManagerBasedRLEnv
+
+
+_BINS_PER_DECADE = 10
+
+
+class LatencyRecorder:
+    """Histogram of the latencies of a code section.
+
+    Latencies are binned into logarithmically spaced bins between 1 us and 10 s, with ten bins per
+    decade. Percentiles are estimated from the bin edges.
+    """
+
+    BIN_EDGES_US = [10 ** (i / _BINS_PER_DECADE) for i in range(7 * _BINS_PER_DECADE + 1)]
+    """Upper edges of the histogram bins (in us). Latencies above the last edge go to an overflow bin."""
+
+    MAX_PENDING = 1024
+    """Maximum number of unresolved CUDA event pairs before the oldest ones are waited for."""
+
+    def __init__(self, use_cuda_events: bool = False):
+        """Initialize the recorder.
+
+        Args:
+            use_cuda_events: Whether to time sections with CUDA events instead of the host clock.
+        """
+        self.use_cuda_events = use_cuda_events
+        self.counts = [0] * (len(self.BIN_EDGES_US) + 1)
+        self.num_samples = 0
+        self.total_us = 0.0
+        self.min_us = math.inf
+        self.max_us = 0.0
+        self._pending: list[tuple[torch.cuda.Event, torch.cuda.Event]] = []
+
+    def start(self) -> torch.cuda.Event | int:
+        """Start timing a section and return the token to pass to :meth:`stop`."""
+        if self.use_cuda_events:
+            event = torch.cuda.Event(enable_timing=True)
+            event.record()
+            return event
+        return time.perf_counter_ns()
+
+    def stop(self, token: torch.cuda.Event | int):
+        """Stop timing the section started with :meth:`start`."""
+        if self.use_cuda_events:
+            end = torch.cuda.Event(enable_timing=True)
+            end.record()
+            self._pending.append((token, end))
+            self._resolve(block=len(self._pending) > self.MAX_PENDING)
+        else:
+            self.add((time.perf_counter_ns() - token) / 1e3)
+
+    def add(self, latency_us: float):
+        """Add a latency sample (in us) to the histogram."""
+        self.counts[bisect.bisect_left(self.BIN_EDGES_US, latency_us)] += 1
+        self.num_samples += 1
+        self.total_us += latency_us
+        self.min_us = min(self.min_us, latency_us)
+        self.max_us = max(self.max_us, latency_us)
+
+    def wait(self):
+        """Wait for the pending CUDA event timings and add them to the histogram."""
+        self._resolve(block=True)
+
+    def percentile(self, q: float) -> float:
+        """Estimate a percentile (in us) as the upper edge of the bin containing it.
+
+        Args:
+            q: The percentile in [0, 100].
+        """
+        self._resolve(block=True)
+        if self.num_samples == 0:
+            return math.nan
+        rank = q / 100.0 * self.num_samples
+        cumulative = 0
+        for index, count in enumerate(self.counts):
+            cumulative += count
+            if cumulative >= rank and count > 0:
+                return min(self.BIN_EDGES_US[index], self.max_us) if index < len(self.BIN_EDGES_US) else self.max_us
+        return self.max_us
+
+    def summary(self) -> dict:
+        """Return the statistics and the non-empty histogram bins of the recorded latencies."""
+        self._resolve(block=True)
+        if self.num_samples == 0:
+            return {"num_samples": 0}
+        histogram = {}
+        for index, count in enumerate(self.counts):
+            if count > 0:
+                upper = f"{self.BIN_EDGES_US[index]:.4g}" if index < len(self.BIN_EDGES_US) else "inf"
+                histogram[f"<={upper}us"] = count
+        return {
+            "num_samples": self.num_samples,
+            "mean_us": self.total_us / self.num_samples,
+            "min_us": self.min_us,
+            "max_us": self.max_us,
+            "p50_us": self.percentile(50),
+            "p90_us": self.percentile(90),
+            "p99_us": self.percentile(99),
+            "histogram": histogram,
+        }
+
+    def _resolve(self, block: bool = False):
+        """Move completed CUDA event timings into the histogram.
+
+        Args:
+            block: Whether to wait for the oldest events to complete instead of only taking the
+                completed ones.
+        """
+        num_resolved = 0
+        for start, end in self._pending:
+            if not end.query():
+                if not block:
+                    break
+                end.synchronize()
+            self.add(start.elapsed_time(end) * 1e3)
+            num_resolved += 1
+        del self._pending[:num_resolved]
+
+
+class _ProfiledTerm:
+    """Callable timing every call of a term function.
+
+    Attribute access is forwarded to the wrapped term so that class-based terms keep working, and
+    the wrapper pickles as the wrapped term so that configurations remain serializable.
+    """
+
+    def __init__(self, func: Callable, recorder_fn: Callable[[object], LatencyRecorder], profiler: TermProfiler):
+        functools.update_wrapper(self, func, updated=())
+        self._func = func
+        self._recorder_fn = recorder_fn
+        self._profiler = profiler
+
+    def __call__(self, env, *args, **kwargs):
+        if not self._profiler.enabled:
+            return self._func(env, *args, **kwargs)
+        recorder = self._recorder_fn(env)
+        token = recorder.start()
+        value = self._func(env, *args, **kwargs)
+        recorder.stop(token)
+        return value
+
+    def __getattr__(self, name: str):
+        return getattr(self._func, name)
+
+    def __reduce__(self):
+        return (_identity, (self._func,))
+
+
+def _identity(value):
+    return value
+
+
+class TermProfiler:
+    """Registry of per-term latency recorders.
+
+    Term functions are wrapped with :meth:`profile`, either as a decorator or explicitly. Timing is
+    only performed while :attr:`enabled` is True.
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self.recorders: dict[str, LatencyRecorder] = {}
+
+    def profile(self, func: Callable | None = None, *, name: str | None = None) -> Callable:
+        """Wrap a term function to record the latency of its calls.
+
+        The device of the environment passed as first argument decides whether CUDA events are used.
+
+        Args:
+            func: The term function. If None, a decorator is returned.
+            name: The name under which the latencies are recorded. Defaults to the function name.
+
+        Returns:
+            The wrapped function, or a decorator if ``func`` is None.
+        """
+        if func is None:
+            return functools.partial(self.profile, name=name)
+        name = name or getattr(func, "__name__", type(func).__name__)
+
+        def get_recorder(env) -> LatencyRecorder:
+            if name not in self.recorders:
+                self.recorders[name] = LatencyRecorder(use_cuda_events=torch.device(env.device).type == "cuda")
+            return self.recorders[name]
+
+        return _ProfiledTerm(func, get_recorder, self)
+
+    def summary(self) -> dict[str, dict]:
+        """Return the latency statistics of all recorded terms, sorted by total time."""
+        summaries = {name: recorder.summary() for name, recorder in self.recorders.items()}
+        return dict(
+            sorted(summaries.items(), key=lambda item: -item[1].get("mean_us", 0.0) * item[1]["num_samples"])
+        )
+
+    def dump(self, filename: str):
+        """Save the latency statistics to a YAML file.
+
+        Args:
+            filename: The path to the file. Missing directories are created.
+        """
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        with open(filename, "w") as f:
+            yaml.safe_dump(self.summary(), f, sort_keys=False)
+
+
+TERM_PROFILER = TermProfiler()
+"""Default profiler used by :func:`profile_reward_terms`."""
+
+
+def profile_reward_terms(env: ManagerBasedRLEnv, profiler: TermProfiler | None = None) -> TermProfiler:
+    """Wrap all active reward terms of an environment with latency profiling.
+
+    Both the terms of this extension and the terms inherited from Isaac Lab are wrapped. Latencies are
+    recorded under the names of the reward terms.
+
+    Args:
+        env: The environment whose reward manager is profiled.
+        profiler: The profiler that records the latencies. Defaults to :data:`TERM_PROFILER`.
+
+    Returns:
+        The profiler recording the latencies.
+    """
+    profiler = profiler or TERM_PROFILER
+    reward_manager = env.reward_manager
+    for term_name in reward_manager.active_terms:
+        term_cfg = reward_manager.get_term_cfg(term_name)
+        if not isinstance(term_cfg.func, _ProfiledTerm):
+            term_cfg.func = profiler.profile(term_cfg.func, name=term_name)
+            reward_manager.set_term_cfg(term_name, term_cfg)
+    return profiler
@@ -1,21 +1,145 @@
 from __future__ import annotations
 
 import torch
+import weakref
 from typing import TYPE_CHECKING
 
-from isaaclab.managers import SceneEntityCfg
-from isaaclab.sensors import ContactSensor
+from .features import foot_features
+from .params import foot_param
+from .stats import StatsAccumulator
 
 if TYPE_CHECKING:
     from isaaclab.envs import ManagerBasedRLEnv
+    from isaaclab.managers import SceneEntityCfg
+
+
+def _foot_deceleration_kernel(
+    foot_speeds: torch.Tensor,
+    current_air_time: torch.Tensor,
+    first_contact: torch.Tensor,
+    velocity_threshold: torch.Tensor,
+    min_air_time: torch.Tensor,
+    max_air_time: torch.Tensor,
+    deceleration_weight: torch.Tensor,
+    landing_weight: torch.Tensor,
+) -> torch.Tensor:
+    """Reference implementation of the foot deceleration reward, compiled with TorchScript below.
+
+    The parameters are 0-dim tensors or tensors broadcastable to the foot buffers.
+    """
+    sufficient_air_time = current_air_time > min_air_time
+    in_deceleration_phase = sufficient_air_time & (current_air_time <= max_air_time)
+    good_landing = first_contact & sufficient_air_time
+    velocity_reward = torch.exp(-foot_speeds / velocity_threshold)
+    phase_reward = velocity_reward * (
+        in_deceleration_phase.float() * deceleration_weight + good_landing.float() * landing_weight
+    )
+    return torch.sum(phase_reward, dim=1)
+
+
+_foot_deceleration_jit = torch.jit.script(_foot_deceleration_kernel)
+
+
+class _FootDecelerationBuffers:
+    """Preallocated intermediates for :func:`_foot_deceleration_eager`."""
+
+    def __init__(self, num_envs: int, num_feet: int, device: torch.device):
+        self.velocity_reward = torch.empty(num_envs, num_feet, device=device)
+        self.weights = torch.empty(num_envs, num_feet, device=device)
+        self.sufficient_air_time = torch.empty(num_envs, num_feet, dtype=torch.bool, device=device)
+        self.in_deceleration_phase = torch.empty(num_envs, num_feet, dtype=torch.bool, device=device)
+        self.good_landing = torch.empty(num_envs, num_feet, dtype=torch.bool, device=device)
+        self.reward = torch.empty(num_envs, device=device)
+
+
+# buffers are owned by the environment so they are released together with it
+_eager_buffers: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _foot_deceleration_eager(
+    foot_speeds: torch.Tensor,
+    current_air_time: torch.Tensor,
+    first_contact: torch.Tensor,
+    velocity_threshold: torch.Tensor,
+    min_air_time: torch.Tensor,
+    max_air_time: torch.Tensor,
+    deceleration_weight: torch.Tensor,
+    landing_weight: torch.Tensor,
+    buffers: _FootDecelerationBuffers,
+) -> torch.Tensor:
+    """Allocation-free equivalent of :func:`_foot_deceleration_kernel`.
+
+    All intermediates are written into ``buffers``. The returned tensor is ``buffers.reward`` and is
+    overwritten by the next call.
+    """
+    torch.gt(current_air_time, min_air_time, out=buffers.sufficient_air_time)
+    torch.le(current_air_time, max_air_time, out=buffers.in_deceleration_phase)
+    buffers.in_deceleration_phase.logical_and_(buffers.sufficient_air_time)
+    torch.logical_and(first_contact, buffers.sufficient_air_time, out=buffers.good_landing)
+    # the masks are 0/1 so the products are exact and match the reference weighting bit for bit
+    torch.mul(buffers.in_deceleration_phase, deceleration_weight, out=buffers.weights)
+    torch.mul(buffers.good_landing, landing_weight, out=buffers.velocity_reward)
+    buffers.weights.add_(buffers.velocity_reward)
+    torch.neg(foot_speeds, out=buffers.velocity_reward)
+    buffers.velocity_reward.div_(velocity_threshold).exp_().mul_(buffers.weights)
+    return torch.sum(buffers.velocity_reward, dim=1, out=buffers.reward)
+
+
+def _get_eager_buffers(env: ManagerBasedRLEnv, foot_speeds: torch.Tensor) -> _FootDecelerationBuffers:
+    """Return the eager buffers of the environment, allocating them on first use."""
+    num_envs, num_feet = foot_speeds.shape
+    env_buffers = _eager_buffers.setdefault(env, {})
+    key = (num_envs, num_feet, foot_speeds.device)
+    if key not in env_buffers:
+        env_buffers[key] = _FootDecelerationBuffers(num_envs, num_feet, foot_speeds.device)
+    return env_buffers[key]
+
+
+# debug statistics are owned by the environment and kept per contact sensor
+_debug_stats: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _print_foot_deceleration_stats(record: dict):
+    """Print a flushed record of the foot deceleration debug statistics."""
+    counts, samples = record["counts"], record["samples"]
+    air_time_min, air_time_max = record["ranges"]["air_time"]
+    print(f"\n=== Foot Deceleration Debug (Step {record['step']}) ===")
+    print(f"Air times: {[round(value, 4) for value in samples['air_time']]}")
+    print(f"Foot speeds: {[round(value, 4) for value in samples['foot_speeds']]}")
+    print(f"In deceleration phase: {[bool(value) for value in samples['in_deceleration_phase']]}")
+    print(f"Good landings: {[bool(value) for value in samples['good_landing']]}")
+    print(f"Total reward (env 0): {samples['reward'][0]:.6f}")
+    print(
+        f"Global (last {record['interval']} steps): {counts['sufficient_air_time']} sufficient air,"
+        f" {counts['in_deceleration_phase']} in decel phase, {counts['good_landing']} good landings"
+    )
+    print(f"Air time range: [{air_time_min:.3f}, {air_time_max:.3f}]")
+
+
+def _get_debug_stats(env: ManagerBasedRLEnv, sensor_name: str, flush_interval: int) -> StatsAccumulator:
+    """Return the debug statistics of the environment for a contact sensor, creating them on first use."""
+    env_stats = _debug_stats.setdefault(env, {})
+    if sensor_name not in env_stats:
+        env_stats[sensor_name] = StatsAccumulator(
+            count_names=["sufficient_air_time", "in_deceleration_phase", "good_landing"],
+            range_names=["air_time"],
+            device=env.device,
+            flush_interval=flush_interval,
+            sink=_print_foot_deceleration_stats,
+        )
+    return env_stats[sensor_name]
+
 
 def foot_deceleration_swing_phase(
     env: ManagerBasedRLEnv, 
     sensor_cfg: SceneEntityCfg, 
     asset_cfg: SceneEntityCfg,
-    velocity_threshold: float = 0.5,
-    min_air_time: float = 0.05,
-    deceleration_phase: float = 0.1,
+    velocity_threshold: float | torch.Tensor = 0.5,
+    min_air_time: float | torch.Tensor = 0.05,
+    deceleration_phase: float | torch.Tensor = 0.1,
+    deceleration_weight: float | torch.Tensor = 0.3,
+    landing_weight: float | torch.Tensor = 0.7,
+    backend: str = "jit",
     debug: bool = False,
     debug_print_freq: int = 100
 ) -> torch.Tensor:
@@ -23,6 +147,9 @@ def foot_deceleration_swing_phase(
     
     This improved function only applies deceleration rewards when feet have been airborne 
     for a minimum duration, ensuring longer steps while still encouraging gentle landings.
+
+    The thresholds and weights are either Python scalars shared by all environments or device tensors of
+    shape (num_envs,) or (num_envs, num_feet), which can be updated in place between steps.
     
     Args:
         env: The environment instance.
@@ -31,67 +158,129 @@ def foot_deceleration_swing_phase(
         velocity_threshold: Maximum desired foot velocity during deceleration phase (m/s).
         min_air_time: Minimum air time before deceleration is encouraged (s). Typical values: 0.05-0.2.
         deceleration_phase: Duration of final swing phase where deceleration is rewarded (s).
-        debug: If True, enables debug logging.
-        debug_print_freq: Frequency of debug prints (every N steps).
+        deceleration_weight: Weight of the low foot velocities during the deceleration phase.
+        landing_weight: Weight of the low foot velocities at landings after sufficient air time.
+        backend: Implementation used to compute the reward. ``"jit"`` runs a TorchScript-compiled kernel,
+            ``"eager"`` reuses preallocated per-environment buffers. On the CPU, both return rewards
+            bit-identical to the unfused formulation. On CUDA, they may differ from it by about one ulp,
+            since the parameters are device tensors and CUDA divides by a Python scalar by multiplying
+            with its reciprocal.
+        debug: If True, accumulates debug statistics on the device and prints them asynchronously.
+        debug_print_freq: Frequency of debug prints (every N steps). The global statistics cover all
+            steps since the previous print.
     
     Returns:
         Reward tensor for foot deceleration behavior that preserves air time.
     """
-    # Get contact sensor data
-    contact_sensor: ContactSensor = env.scene.sensors[sensor_cfg.name]
-    
-    # Get robot articulation
-    robot = env.scene[asset_cfg.name]
+    # Get the foot features of this step, shared with the other foot terms
+    features = foot_features(env, sensor_cfg)
     
-    # Get foot velocities in world frame
-    foot_velocities = robot.data.body_lin_vel_w[:, sensor_cfg.body_ids, :]  # [num_envs, num_feet, 3]
-    foot_speeds = torch.norm(foot_velocities, dim=-1)  # [num_envs, num_feet]
+    # Get foot speeds in world frame
+    foot_speeds = features.foot_speeds(asset_cfg)  # [num_envs, num_feet]
     
     # Get current air time for each foot
-    current_air_time = contact_sensor.data.current_air_time[:, sensor_cfg.body_ids]
-    
-    # Only consider feet that have been airborne for sufficient time
-    sufficient_air_time = current_air_time > min_air_time
+    current_air_time = features.current_air_time
     
-    # Identify feet in the final deceleration phase (approaching landing)
-    # This is when air time is above min threshold but we're approaching expected landing
-    in_deceleration_phase = (current_air_time > min_air_time) & (current_air_time <= min_air_time + deceleration_phase)
+    # Get feet that just made contact
+    first_contact = features.first_contact
     
-    # Get feet that just made contact after sufficient air time
-    first_contact = contact_sensor.compute_first_contact(env.step_dt)[:, sensor_cfg.body_ids]
-    good_landing = first_contact & (current_air_time > min_air_time)
+    # Feet in the deceleration phase have air time in (min_air_time, min_air_time + deceleration_phase]
+    if isinstance(min_air_time, torch.Tensor) or isinstance(deceleration_phase, torch.Tensor):
+        max_air_time = foot_param(env, min_air_time) + foot_param(env, deceleration_phase)
+    else:
+        max_air_time = foot_param(env, min_air_time + deceleration_phase)
+    min_air_time = foot_param(env, min_air_time)
+    params = (
+        foot_param(env, velocity_threshold),
+        min_air_time,
+        max_air_time,
+        foot_param(env, deceleration_weight),
+        foot_param(env, landing_weight),
+    )
     
     # Reward low velocities during deceleration phase and at good landings
-    velocity_reward = torch.exp(-foot_speeds / velocity_threshold)
-    
-    # Apply reward only during appropriate phases
-    phase_reward = velocity_reward * (in_deceleration_phase.float() * 0.3 + good_landing.float() * 0.7)
-    
-    # Sum reward across all feet
-    reward = torch.sum(phase_reward, dim=1)
+    if backend == "jit":
+        reward = _foot_deceleration_jit(foot_speeds, current_air_time, first_contact, *params)
+    elif backend == "eager":
+        buffers = _get_eager_buffers(env, foot_speeds)
+        reward = _foot_deceleration_eager(foot_speeds, current_air_time, first_contact, *params, buffers)
+    else:
+        raise ValueError(f"Unknown foot deceleration backend '{backend}'. Expected 'jit' or 'eager'.")
     
-    # Debug logging
+    # Debug statistics are accumulated on the device and only read back every debug_print_freq steps
     if debug:
-        if hasattr(env, '_debug_step_count'):
-            env._debug_step_count += 1
-        else:
-            env._debug_step_count = 1
-            
-        if env._debug_step_count % debug_print_freq == 0:
+        stats = _get_debug_stats(env, sensor_cfg.name, debug_print_freq)
+        sufficient_air_time = current_air_time > min_air_time
+        in_deceleration_phase = sufficient_air_time & (current_air_time <= max_air_time)
+        good_landing = first_contact & sufficient_air_time
+        stats.add_count("sufficient_air_time", sufficient_air_time)
+        stats.add_count("in_deceleration_phase", in_deceleration_phase)
+        stats.add_count("good_landing", good_landing)
+        stats.add_range("air_time", current_air_time)
+        if stats.step():
             env_idx = 0  # Debug first environment
-            print(f"\n=== Foot Deceleration Debug (Step {env._debug_step_count}) ===")
-            print(f"Air times: {current_air_time[env_idx].cpu().numpy()}")
-            print(f"Foot speeds: {foot_speeds[env_idx].cpu().numpy()}")
-            print(f"In deceleration phase: {in_deceleration_phase[env_idx].cpu().numpy()}")
-            print(f"Good landings: {good_landing[env_idx].cpu().numpy()}")
-            print(f"Total reward (env 0): {reward[env_idx].item():.6f}")
-            
-            # Global statistics
-            feet_with_sufficient_air = sufficient_air_time.sum().item()
-            feet_in_decel_phase = in_deceleration_phase.sum().item()
-            good_landings_count = good_landing.sum().item()
-            
-            print(f"Global: {feet_with_sufficient_air} sufficient air, {feet_in_decel_phase} in decel phase, {good_landings_count} good landings")
-            print(f"Air time range: [{current_air_time.min().item():.3f}, {current_air_time.max().item():.3f}]")
+            stats.flush(samples={
+                "air_time": current_air_time[env_idx],
+                "foot_speeds": foot_speeds[env_idx],
+                "in_deceleration_phase": in_deceleration_phase[env_idx],
+                "good_landing": good_landing[env_idx],
+                "reward": reward[env_idx],
+            })
     
     return reward
+
+
+def feet_air_time(
+    env: ManagerBasedRLEnv, command_name: str, sensor_cfg: SceneEntityCfg, threshold: float | torch.Tensor
+) -> torch.Tensor:
+    """Reward long steps taken by the feet using L2-kernel.
+
+    This is the same reward as the Isaac Lab velocity task term of the same name, but the contact features
+    are read from the per-step foot feature cache so that they are shared with the other foot terms.
+
+    Args:
+        env: The environment instance.
+        command_name: Name of the velocity command. No reward is given for commands below 0.1 m/s.
+        sensor_cfg: Configuration for the contact sensor, with the feet selected as bodies.
+        threshold: Air time (s) above which steps are rewarded. A scalar or a device tensor of shape
+            (num_envs,) or (num_envs, num_feet).
+
+    Returns:
+        Reward tensor for the air time of the feet that just landed.
+    """
+    features = foot_features(env, sensor_cfg)
+    reward = torch.sum((features.last_air_time - foot_param(env, threshold)) * features.first_contact, dim=1)
+    # no reward for zero command
+    reward *= torch.norm(env.command_manager.get_command(command_name)[:, :2], dim=1) > 0.1
+    return reward
+
+
+def foot_landing_impact(
+    env: ManagerBasedRLEnv, sensor_cfg: SceneEntityCfg, metric: str = "impulse", force_threshold: float = 0.0
+) -> torch.Tensor:
+    """Penalize the ground impacts of the feet that just landed, estimated from the contact force history.
+
+    The impact of a landing is either the contact impulse since the touchdown or the peak contact force
+    (see :class:`FootFeatures`). Use a negative weight to penalize hard landings.
+
+    Args:
+        env: The environment instance.
+        sensor_cfg: Configuration for the contact sensor, with the feet selected as bodies. The history
+            length of the sensor should cover an environment step.
+        metric: The impact estimate, ``"impulse"`` (N s) or ``"peak_force"`` (N).
+        force_threshold: Impacts are only penalized above this value, e.g. the share of the body weight
+            carried by a foot, in the unit of the metric. Defaults to 0.0.
+
+    Returns:
+        Sum of the impacts of the landing feet above the threshold.
+    """
+    features = foot_features(env, sensor_cfg)
+    if metric == "impulse":
+        impact = features.landing_impulse
+    elif metric == "peak_force":
+        impact = features.landing_peak_force
+    else:
+        raise ValueError(f"Unknown foot landing impact metric '{metric}'. Expected 'impulse' or 'peak_force'.")
+    if force_threshold > 0.0:
+        impact = torch.clamp(impact - force_threshold, min=0.0)
+    return torch.sum(impact, dim=1)
@@ -0,0 +1,130 @@
+"""
+Device-side statistics for debugging MDP terms.
+
+Terms called every environment step should not read tensors back to the host, as every read
+synchronizes the device and stalls the vectorized step. The accumulator in this module keeps
+running counts and ranges on the device and copies them to the host asynchronously every
+``flush_interval`` steps.
+"""
+
+from __future__ import annotations
+
+import collections
+import torch
+from collections.abc import Callable, Sequence
+
+
+class StatsAccumulator:
+    """Running counts and min/max ranges kept on the device and flushed asynchronously.
+
+    Every flush copies the accumulated statistics (and optional per-environment samples) into a
+    host buffer with a non-blocking copy and resets the accumulators. The host copy is decoded once
+    the copy has completed, which is checked without blocking on every subsequent :meth:`step`. Decoded
+    records are appended to :attr:`history` and passed to the ``sink`` callback, if any.
+    """
+
+    def __init__(
+        self,
+        count_names: Sequence[str],
+        range_names: Sequence[str],
+        device: torch.device | str,
+        flush_interval: int = 100,
+        sink: Callable[[dict], None] | None = None,
+        history_size: int = 100,
+    ):
+        """Initialize the accumulator.
+
+        Args:
+            count_names: Names of the counters.
+            range_names: Names of the tracked value ranges.
+            device: Device on which the statistics are accumulated.
+            flush_interval: Number of steps between two flushes.
+            sink: Callback receiving every decoded record. Defaults to None.
+            history_size: Number of decoded records kept in :attr:`history`.
+        """
+        self.device = torch.device(device)
+        self.flush_interval = flush_interval
+        self.sink = sink
+        self.history: collections.deque[dict] = collections.deque(maxlen=history_size)
+        self.num_steps = 0
+        self._last_flush_step = 0
+
+        self._count_names = list(count_names)
+        self._range_names = list(range_names)
+        self._counts = torch.zeros(len(self._count_names), dtype=torch.int64, device=self.device)
+        self._min = torch.full((len(self._range_names),), float("inf"), device=self.device)
+        self._max = torch.full((len(self._range_names),), float("-inf"), device=self.device)
+        # copies that have been issued but not decoded yet
+        self._pending: collections.deque[tuple] = collections.deque()
+
+    def add_count(self, name: str, mask: torch.Tensor):
+        """Add the number of set elements of a boolean mask to a counter."""
+        index = self._count_names.index(name)
+        self._counts[index] += mask.sum()
+
+    def add_range(self, name: str, values: torch.Tensor):
+        """Extend a tracked range with the minimum and maximum of the values."""
+        index = self._range_names.index(name)
+        torch.minimum(self._min[index], values.min(), out=self._min[index])
+        torch.maximum(self._max[index], values.max(), out=self._max[index])
+
+    def step(self) -> bool:
+        """Advance the step counter and decode completed flushes.
+
+        Returns:
+            True if a flush is due at this step, in which case the caller should call :meth:`flush`.
+        """
+        self.num_steps += 1
+        self._decode_completed()
+        return self.num_steps % self.flush_interval == 0
+
+    def flush(self, samples: dict[str, torch.Tensor] | None = None):
+        """Issue a non-blocking copy of the statistics to the host and reset them.
+
+        Args:
+            samples: Additional tensors to copy along with the statistics, e.g. the state of one
+                environment. Defaults to None.
+        """
+        samples = samples or {}
+        # pack everything into a single buffer to issue one copy
+        tensors = [self._counts.double(), self._min.double(), self._max.double()]
+        tensors += [sample.detach().flatten().double() for sample in samples.values()]
+        packed = torch.cat(tensors)
+        host = torch.empty(packed.shape, dtype=packed.dtype, pin_memory=packed.is_cuda)
+        host.copy_(packed, non_blocking=True)
+        event = None
+        if packed.is_cuda:
+            event = torch.cuda.Event()
+            event.record()
+        layout = [(name, sample.numel()) for name, sample in samples.items()]
+        self._pending.append((self.num_steps, self.num_steps - self._last_flush_step, host, event, layout))
+        self._last_flush_step = self.num_steps
+        # reset the accumulators for the next interval
+        self._counts.zero_()
+        self._min.fill_(float("inf"))
+        self._max.fill_(float("-inf"))
+        self._decode_completed()
+
+    def _decode_completed(self):
+        """Decode the host copies whose transfer has completed."""
+        while self._pending and (self._pending[0][3] is None or self._pending[0][3].query()):
+            step, interval, host, _, layout = self._pending.popleft()
+            values = host.tolist()
+            num_counts, num_ranges = len(self._count_names), len(self._range_names)
+            record = {
+                "step": step,
+                "interval": interval,
+                "counts": dict(zip(self._count_names, map(int, values[:num_counts]))),
+                "ranges": {
+                    name: (values[num_counts + i], values[num_counts + num_ranges + i])
+                    for i, name in enumerate(self._range_names)
+                },
+                "samples": {},
+            }
+            offset = num_counts + 2 * num_ranges
+            for name, numel in layout:
+                record["samples"][name] = values[offset : offset + numel]
+                offset += numel
+            self.history.append(record)
+            if self.sink is not None:
+                self.sink(record)
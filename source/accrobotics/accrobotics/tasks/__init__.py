@@ -6,9 +6,4 @@ with Isaac Lab, including specialized configurations for different robots
 and training scenarios.
 """
 
-import os
-import toml
-
-from isaaclab_tasks.utils import import_packages
-
-from .go2 import *
\ No newline at end of file
+from .go2 import *
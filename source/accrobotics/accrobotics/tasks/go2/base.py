@@ -1,18 +1,22 @@
 """
 Contains base tasks from official base Isaac Lab tasks for comparison purposes.
+
+The tasks are registered with string entry points, so that the Isaac Lab configuration modules are
+only imported when an environment or its configuration is created.
 """
 
 import gymnasium as gym
 
-import isaaclab_tasks.manager_based.locomotion.velocity.config.go2 as go2
+ISAACLAB_GO2_CFG = "isaaclab_tasks.manager_based.locomotion.velocity.config.go2"
+"""Module of the Isaac Lab Go2 velocity tracking configurations."""
 
 gym.register(
     id="Base-Velocity-Flat-Unitree-Go2-v0",
     entry_point="isaaclab.envs:ManagerBasedRLEnv",
     disable_env_checker=True,
     kwargs={
-        "env_cfg_entry_point": f"{go2.__name__}.flat_env_cfg:UnitreeGo2FlatEnvCfg",
-        "rsl_rl_cfg_entry_point": f"{go2.agents.__name__}.rsl_rl_ppo_cfg:UnitreeGo2FlatPPORunnerCfg",
+        "env_cfg_entry_point": f"{ISAACLAB_GO2_CFG}.flat_env_cfg:UnitreeGo2FlatEnvCfg",
+        "rsl_rl_cfg_entry_point": f"{ISAACLAB_GO2_CFG}.agents.rsl_rl_ppo_cfg:UnitreeGo2FlatPPORunnerCfg",
     },
 )
 
@@ -21,8 +25,8 @@ gym.register(
     entry_point="isaaclab.envs:ManagerBasedRLEnv",
     disable_env_checker=True,
     kwargs={
-        "env_cfg_entry_point": f"{go2.__name__}.flat_env_cfg:UnitreeGo2FlatEnvCfg_PLAY",
-        "rsl_rl_cfg_entry_point": f"{go2.agents.__name__}.rsl_rl_ppo_cfg:UnitreeGo2FlatPPORunnerCfg",
+        "env_cfg_entry_point": f"{ISAACLAB_GO2_CFG}.flat_env_cfg:UnitreeGo2FlatEnvCfg_PLAY",
+        "rsl_rl_cfg_entry_point": f"{ISAACLAB_GO2_CFG}.agents.rsl_rl_ppo_cfg:UnitreeGo2FlatPPORunnerCfg",
     },
 )
 
@@ -31,8 +35,8 @@ gym.register(
     entry_point="isaaclab.envs:ManagerBasedRLEnv",
     disable_env_checker=True,
     kwargs={
-        "env_cfg_entry_point": f"{go2.__name__}.rough_env_cfg:UnitreeGo2RoughEnvCfg",
-        "rsl_rl_cfg_entry_point": f"{go2.agents.__name__}.rsl_rl_ppo_cfg:UnitreeGo2RoughPPORunnerCfg",
+        "env_cfg_entry_point": f"{ISAACLAB_GO2_CFG}.rough_env_cfg:UnitreeGo2RoughEnvCfg",
+        "rsl_rl_cfg_entry_point": f"{ISAACLAB_GO2_CFG}.agents.rsl_rl_ppo_cfg:UnitreeGo2RoughPPORunnerCfg",
     },
 )
 
@@ -41,7 +45,7 @@ gym.register(
     entry_point="isaaclab.envs:ManagerBasedRLEnv",
     disable_env_checker=True,
     kwargs={
-        "env_cfg_entry_point": f"{go2.__name__}.rough_env_cfg:UnitreeGo2RoughEnvCfg_PLAY",
-        "rsl_rl_cfg_entry_point": f"{go2.agents.__name__}.rsl_rl_ppo_cfg:UnitreeGo2RoughPPORunnerCfg",
+        "env_cfg_entry_point": f"{ISAACLAB_GO2_CFG}.rough_env_cfg:UnitreeGo2RoughEnvCfg_PLAY",
+        "rsl_rl_cfg_entry_point": f"{ISAACLAB_GO2_CFG}.agents.rsl_rl_ppo_cfg:UnitreeGo2RoughPPORunnerCfg",
     },
 )
\ No newline at end of file
@@ -0,0 +1,93 @@
+"""
+Quiet locomotion environment configurations for the Unitree Go2 robot.
+
+The configurations extend the base Go2 configurations with additional reward terms focused on
+gentle foot landings to reduce impact noise during locomotion. They are imported lazily through
+the entry points registered in :mod:`accrobotics.tasks.go2.quiet`.
+"""
+
+from isaaclab.utils import configclass
+from isaaclab.managers import CurriculumTermCfg as CurrTerm
+from isaaclab.managers import RewardTermCfg as RewTerm
+from isaaclab.managers import SceneEntityCfg
+
+from isaaclab_tasks.manager_based.locomotion.velocity.config.go2.flat_env_cfg import (
+    UnitreeGo2FlatEnvCfg,
+    UnitreeGo2FlatEnvCfg_PLAY,
+)
+from isaaclab_tasks.manager_based.locomotion.velocity.config.go2.rough_env_cfg import (
+    UnitreeGo2RoughEnvCfg,
+    UnitreeGo2RoughEnvCfg_PLAY,
+)
+
+import accrobotics.mdp as mdp
+
+# Shared reward term for foot deceleration to keep code simple and consistent
+foot_deceleration_swing_phase = RewTerm(
+    func=mdp.foot_deceleration_swing_phase,
+    weight=0.25,
+    params={
+        "sensor_cfg": SceneEntityCfg("contact_forces", body_names=".*_foot"),
+        "asset_cfg": SceneEntityCfg("robot"),
+        "velocity_threshold": 0.3,
+        "min_air_time": 0.05,  # Ensure minimum air time before dec
+        "deceleration_phase": 0.1,  # Duration of final swing phase for deceleration
+    }
+)
+
+# Opt-in curriculum annealing the foot deceleration reward with the velocity tracking performance
+quietness_curriculum = CurrTerm(
+    func=mdp.quietness_curriculum,
+    params={
+        "reward_term_name": "foot_deceleration",
+        "tracking_term_name": "track_lin_vel_xy_exp",
+        "weight_scale_range": (0.1, 1.0),  # Scale of the phase weights from the first to the last level
+        "velocity_threshold_range": (0.5, 0.3),  # Lenient threshold first, the default one at the last level
+    }
+)
+
+# Below are the environment modifications for the Go2 robot to learn quieter walking
+
+@configclass
+class QuietRoughEnvCfg(UnitreeGo2RoughEnvCfg):
+    def __post_init__(self):
+        super().__post_init__()
+        self.rewards.foot_deceleration = foot_deceleration_swing_phase
+        # share the per-step foot features with the foot deceleration term
+        self.rewards.feet_air_time.func = mdp.feet_air_time
+
+@configclass
+class QuietRoughEnvCfg_PLAY(UnitreeGo2RoughEnvCfg_PLAY):
+    def __post_init__(self):
+        super().__post_init__()
+        self.rewards.foot_deceleration = foot_deceleration_swing_phase
+        # share the per-step foot features with the foot deceleration term
+        self.rewards.feet_air_time.func = mdp.feet_air_time
+
+@configclass
+class QuietFlatEnvCfg(UnitreeGo2FlatEnvCfg):
+    def __post_init__(self):
+        super().__post_init__()
+        self.rewards.foot_deceleration = foot_deceleration_swing_phase
+        # share the per-step foot features with the foot deceleration term
+        self.rewards.feet_air_time.func = mdp.feet_air_time
+
+@configclass
+class QuietFlatEnvCfg_PLAY(UnitreeGo2FlatEnvCfg_PLAY):
+    def __post_init__(self):
+        super().__post_init__()
+        self.rewards.foot_deceleration = foot_deceleration_swing_phase
+        # share the per-step foot features with the foot deceleration term
+        self.rewards.feet_air_time.func = mdp.feet_air_time
+
+@configclass
+class QuietRoughCurriculumEnvCfg(QuietRoughEnvCfg):
+    def __post_init__(self):
+        super().__post_init__()
+        self.curriculum.quietness = quietness_curriculum
+
+@configclass
+class QuietFlatCurriculumEnvCfg(QuietFlatEnvCfg):
+    def __post_init__(self):
+        super().__post_init__()
+        self.curriculum.quietness = quietness_curriculum
@@ -0,0 +1,7 @@
+"""Test configuration of the extension, run without Isaac Sim on the mock environment of the benchmarks."""
+
+import os
+import sys
+
+# the mock environment of the reward benchmarks
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "..", "scripts", "benchmarks"))
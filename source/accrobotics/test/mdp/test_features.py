@@ -0,0 +1,45 @@
+"""Tests of the foot features on synthetic contact force histories."""
+
+import pytest
+import torch
+
+from accrobotics.mdp.features import FootFeatures
+
+from mock_env import MockEntityCfg, MockEnv  # isort: skip
+
+
+def touchdown_features(history: list[float], contact_steps: int) -> FootFeatures:
+    """Return the features of one foot with a force history, most recent first, that landed some physics steps ago."""
+    env = MockEnv(1, foot_ids=[0], num_bodies=1, history_length=len(history))
+    data = env.scene.sensors["contact_forces"].data
+    data.net_forces_w_history.zero_()
+    data.net_forces_w_history[0, :, 0, 2] = torch.tensor(history)
+    data.current_contact_time.fill_(contact_steps * env.physics_dt)
+    return FootFeatures(env, MockEntityCfg("contact_forces", body_ids=[0]))
+
+
+@pytest.mark.parametrize(
+    "history, contact_steps, peak_force, impulse_samples",
+    [
+        # touchdown at the last physics step, the older samples are airborne
+        ([100.0, 200.0, 200.0], 1, 100.0, 100.0),
+        # touchdown two physics steps ago
+        ([50.0, 100.0, 200.0], 2, 100.0, 150.0),
+        # touchdown older than the history
+        ([30.0, 50.0, 100.0], 4, 100.0, 180.0),
+    ],
+)
+def test_landing_forces_since_touchdown(history, contact_steps, peak_force, impulse_samples):
+    features = touchdown_features(history, contact_steps)
+    physics_dt = features._env.physics_dt
+    assert features.first_contact.item()
+    assert features.landing_peak_force.item() == pytest.approx(peak_force)
+    assert features.landing_impulse.item() == pytest.approx(impulse_samples * physics_dt)
+
+
+def test_landing_forces_without_touchdown():
+    # in contact for longer than the environment step
+    features = touchdown_features([40.0, 40.0, 40.0], 8)
+    assert not features.first_contact.item()
+    assert features.landing_peak_force.item() == 0.0
+    assert features.landing_impulse.item() == 0.0